@@ -0,0 +1,715 @@
+# _parser_tables.py  – 由 generate_parse_tables.py --codegen 生成，请勿手工修改
+import sys
+from array import array
+from lexer import terminal_name
+
+def _load(code, data):
+    a = array(code, data)
+    if sys.byteorder != 'little':
+        a.byteswap()
+    return a
+
+FINGERPRINT = '8299c2fb4589c2bbc58af1953e077387ec0107f09e851dca7fe00f05e698c510'   # 生成本模块的解析表的 PackedTables.digest()
+TERMINALS = ('!=', '$', '&', '(', ')', '*', '+', ',', '-', '->', '.', '..', '/', ':', ';', '<', '<=', '=', '==', '>', '>=', 'IDENT', 'NUMBER', '[', ']', 'break', 'continue', 'else', 'fn', 'for', 'i32', 'if', 'in', 'let', 'loop', 'mut', 'return', 'while', '{', '}')
+PRODUCTIONS = (("Program'", ('Program',)), ('VariableInternal', ('mut', 'IDENT')), ('VariableInternal', ('IDENT',)), ('Type', ('i32',)), ('Assignable', ('IDENT',)), ('Program', ('DeclList',)), ('DeclList', ()), ('DeclList', ('Decl', 'DeclList')), ('Decl', ('FnDecl',)), ('FnDecl', ('FnHead', 'Block')), ('FnDecl', ('FnHead', 'FuncExprBlock')), ('FnHead', ('fn', 'IDENT', '(', 'ParamList', ')')), ('FnHead', ('fn', 'IDENT', '(', 'ParamList', ')', '->', 'Type')), ('ParamList', ()), ('ParamList', ('Param',)), ('ParamList', ('Param', ',', 'ParamList')), ('Param', ('VariableInternal', ':', 'Type')), ('Block', ('{', '}')), ('Block', ('{', 'Stmt', 'StmtList', '}')), ('StmtList', ()), ('StmtList', ('Stmt',)), ('StmtList', ('Stmt', 'StmtList')), ('Stmt', (';',)), ('Stmt', ('Expr', ';')), ('Stmt', ('return', ';')), ('Stmt', ('return', 'Expr', ';')), ('Stmt', ('let', 'VariableInternal', ':', 'Type', ';')), ('Stmt', ('let', 'VariableInternal', ';')), ('Stmt', ('Assignable', '=', 'Expr', ';')), ('Stmt', ('let', 'VariableInternal', ':', 'Type', '=', 'Expr', ';')), ('Stmt', ('let', 'VariableInternal', '=', 'Expr', ';')), ('Primary', ('Assignable',)), ('Assignable', ('*', 'Primary')), ('Expr', ('AddExpr',)), ('Expr', ('Expr', '==', 'Expr')), ('Expr', ('Expr', '!=', 'Expr')), ('Expr', ('Expr', '<', 'Expr')), ('Expr', ('Expr', '<=', 'Expr')), ('Expr', ('Expr', '>', 'Expr')), ('Expr', ('Expr', '>=', 'Expr')), ('AddExpr', ('AddExpr', '+', 'MulExpr')), ('AddExpr', ('AddExpr', '-', 'MulExpr')), ('AddExpr', ('MulExpr',)), ('MulExpr', ('MulExpr', '*', 'Primary')), ('MulExpr', ('MulExpr', '/', 'Primary')), ('MulExpr', ('Primary',)), ('Primary', ('IDENT',)), ('Primary', ('IDENT', '(', 'ArgList', ')')), ('Primary', ('(', 'Expr', ')')), ('Primary', ('NUMBER',)), ('ArgList', ()), ('ArgList', ('Expr',)), ('ArgList', ('Expr', ',', 'ArgList')), ('Stmt', ('if', 'Expr', 'Block', 'ElsePart')), ('ElsePart', ()), ('ElsePart', ('else', 'if', 'Expr', 'Block', 'ElsePart')), ('ElsePart', ('else', 'Block')), ('Stmt', ('while', 'Expr', 'Block')), ('Stmt', ('for', 'VariableInternal', 'in', 'Iterable', 'Block')), ('Iterable', ('Expr', '..', 'Expr')), ('Iterable', ('Expr',)), ('Stmt', ('loop', 'Block')), ('Stmt', ('break', ';')), ('Stmt', ('continue', ';')), ('Primary', ('*', 'Primary')), ('Primary', ('&', 'Primary')), ('Primary', ('&', 'mut', 'Primary')), ('FuncExprBlock', ('{', 'FuncStmtList', '}')), ('FuncStmtList', ('Stmt', 'FuncStmtList')), ('FuncStmtList', ('Stmt',)), ('FuncStmtList', ('Expr',)), ('Primary', ('FuncExprBlock',)), ('Expr', ('SelectExpr',)), ('SelectExpr', ('if', 'Expr', 'FuncExprBlock', 'else', 'FuncExprBlock')), ('Expr', ('LoopExpr',)), ('LoopExpr', ('loop', 'FuncExprBlock')), ('Stmt', ('break', 'Expr', ';')), ('Type', ('[', 'Type', ';', 'NUMBER', ']')), ('Primary', ('[', 'ExprList', ']')), ('ExprList', ()), ('ExprList', ('Expr',)), ('ExprList', ('Expr', ',', 'ExprList')), ('Assignable', ('Primary', '[', 'Expr', ']')), ('Type', ('(', ')')), ('Type', ('(', 'Type', ',', ')')), ('Type', ('(', 'TypeList', ')')), ('TypeList', ('Type',)), ('TypeList', ('Type', ',', 'TypeList')), ('Primary', ('(', ')')), ('Primary', ('(', 'Expr', ')')), ('Primary', ('(', 'Expr', ',', ')')), ('Primary', ('(', 'Expr', ',', 'ExprList', ')')), ('ExprList', ('Expr',)), ('ExprList', ('Expr', ',', 'ExprList')), ('Assignable', ('Primary', '.', 'NUMBER')), ('Type', ('&', 'Type')), ('Type', ('&', 'mut', 'Type')))
+_W = 41          # ACTION 每行的列数
+_UNKNOWN = 40    # 不认识的 token 所在的列
+_NN = 27      # GOTO 每行的列数
+ACTION = _load('h', b'\x00\x00\xf9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xfa\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\xf7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf8\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf6\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\xf5\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\'\x00\x00\x00\x00\x00\x00\x00\x00\x00(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00)\x00\x00\x00*\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\xe0\xff\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xe0\xff\x00\x00\xe0\xff\x00\x00\xe0\xff\x00\x00\xe0\xff\x00\x00\xe0\xff\xe0\xff\xe0\xff+\x00\xe0\xff\xe0\xff\xe0\xff\x00\x00\x00\x00\xe0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\x00\x00,\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00-\x00.\x00/\x00\x00\x000\x001\x002\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\xff\x00\x00\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x003\x00\x00\x00\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x004\x00\xd5\xff\x00\x00\xd5\xff\x00\x00\x00\x00\x00\x005\x00\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd5\xff\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\x00\x006\x00\x00\x00\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x007\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\xec\xff\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00J\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00U\x00V\x00\x00\x00W\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00X\x00Y\x00Z\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00[\x00\x00\x00\x00\x00\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xe9\xff\xfb\xff\x00\x00\x00\x00\\\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfb\xff\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00z\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x81\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x83\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x97\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x98\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9b\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\x00\x00\x00\x00\x00\x00\x00\x00\xf2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\x00\x00\x00\x00\x00\xac\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\xe8\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\x00\x00\x00\x00\x00\xac\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\x00\x00\x00\x00\x00\xac\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\x00\x00\x00\x00\x00\xac\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\x00\x00\x00\x00\x00\xac\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\x00\x00\x00\x00\x00\xac\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\xbb\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\xec\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\x00\x00\xc8\x00\x00\x00\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x00\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\\\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00=\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\x00\x1c\x00\x1d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\xcc\x00\xde\xff\xcd\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xde\xff\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xce\x00\x00\x00\x00\x00\x00\x00\xcf\x00\x00\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\xd5\xff\xd6\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\xd7\x00\x00\x00\x00\x00\xd5\xff\xd5\xff\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\xd2\xff\xd2\xff\xd2\xff\x00\x00\xd8\x00\x00\x00\xd2\xff\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x00\xd9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xdd\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\xdf\x00\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe3\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x006\x00\x00\x00\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x007\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\x00\x00\x00\x00\x00\x00U\x00V\x00\x00\x00W\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00X\x00Y\x00Z\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe6\x00\x00\x00\x00\x00[\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xe8\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00U\x00V\x00\x00\x00W\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00X\x00Y\x00Z\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00[\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\xea\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfb\xff\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x00\xde\xff\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xde\xff\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x00\xf4\x00\x00\x00\xf5\x00\xf6\x00\xf7\x00\x00\x00\x00\x00\x00\x00\xaf\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\xf9\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\xfa\x00\x00\x00\x00\x00\xd5\xff\xd5\xff\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\xd2\xff\xd2\xff\x00\x00\xfb\x00\x00\x00\xd2\xff\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x00\xfc\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x01K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x02\x01\x00\x00\xfb\xff\xfb\xff\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x01\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x01\x00\x00\t\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x01\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x11\x01\xd5\xff\x00\x00\xd5\xff\x00\x00\x00\x00\x00\x00\x12\x01\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\x00\x00\x13\x01\x00\x00\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x00\x14\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\x01\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x18\x01K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xc1\xff\xfb\xff\x00\x00\x00\x00\x1a\x01\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x01\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\xc0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 \x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00!\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"\x01\x00\x00#\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xde\xff\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00,\x01\x00\x00\x00\x00\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00-\x01\xd5\xff\x00\x00\xd5\xff\x00\x00\x00\x00\x00\x00.\x01\x00\x00\x00\x00\xd5\xff\xd5\xff\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd5\xff\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\x00\x00/\x01\x00\x00\xd2\xff\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x002\x01\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x004\x01K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x006\x01\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00:\x01\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00<\x01=\x01\x00\x00\x00\x00>\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xc2\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00B\x01\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00C\x01\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff\xe7\xff&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00F\x01\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\xba\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\xff\x00\x00\x00\x00G\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00I\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\xfd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00J\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x004\x00\xd7\xff\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x005\x00\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd7\xff\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\x00\x00\xc8\x00\x00\x00\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x00\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x004\x00\xd6\xff\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x005\x00\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00K\x01\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00,\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xff.\x00/\x00\x00\x000\x001\x002\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\x01\x00\x00\x00\x00,\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xff.\x00/\x00\x00\x000\x001\x002\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00,\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\xff.\x00/\x00\x00\x000\x001\x002\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00,\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\xff.\x00/\x00\x00\x000\x001\x002\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00,\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\xff.\x00/\x00\x00\x000\x001\x002\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00,\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff.\x00/\x00\x00\x000\x001\x002\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\x00\x00\xc8\x00\x00\x00\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\x00\x00\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\x00\x00\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\x00\x00\xc8\x00\x00\x00\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\x00\x00\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00N\x01\x00\x00O\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\xde\xff\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00V\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00W\x01\xd5\xff\x00\x00\xd5\xff\x00\x00\x00\x00\x00\x00X\x01\x00\x00\x00\x00\xd5\xff\xd5\xff\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\x00\x00Y\x01\x00\x00\xd2\xff\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x00Z\x01\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\\\x01\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00^\x01K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00`\x01\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00d\x01\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xea\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x00\xc8\x00\x00\x00\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\x00\x00\xc8\x00\x00\x00\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x00\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00m\x01K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00u\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\xbe\xff\xbe\xff\xbe\xff\x00\x00\xd8\x00\x00\x00\xbe\xff\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x00\xd9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\x00\x00K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00x\x01\x00\x00\x00\x00y\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\x00\x00\xd8\x00\x00\x00\xdf\xff\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00\xd9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x01\x00\x00\x00\x00\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x01\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\x00\x006\x00\x00\x00\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\xbe\xff\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x007\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00U\x00V\x00\x00\x00W\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00X\x00Y\x00Z\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00[\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\x81\x01\x00\x00\x00\x00\x82\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x006\x00\x00\x00\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x007\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x84\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x85\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xcc\xff\x00\x00\x00\x00\x87\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\xbe\xff\xbe\xff\x00\x00\xfb\x00\x00\x00\xbe\xff\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x00\xfc\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\x96\x01\x00\x00\x00\x00\x97\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\xdf\xff\xdf\xff\x00\x00\xfb\x00\x00\x00\xdf\xff\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00\xfc\x00\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x01\x00\x00\x00\x00\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9c\x01\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\xb3\xff\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\x00\x00\x13\x01\x00\x00\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x00\x14\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xaa\x01\x00\x00\x00\x00\xab\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x00\x13\x01\x00\x00\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00\x14\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xad\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x01\x00\x00\x00\x00\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb0\x01\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x01\x00\x00\x00\x00\xc1\x01\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc9\xff\xc9\xff\x00\x00\xc9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc9\xff\xc9\xff\xc9\xff\x00\x00\xc9\xff\xc9\xff\xc6\x01\x00\x00\xc9\xff\x00\x00\xc9\xff\x00\x00\xc9\xff\xc9\xff\x00\x00\xc9\xff\xc9\xff\xc9\xff\xc9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\xd0\x01\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\x00\x00/\x01\x00\x00\xbe\xff\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xd6\x01\x00\x00\x00\x00\xd7\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x00/\x01\x00\x00\xdf\xff\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x01\x00\x00\x00\x00\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\x01\x00\x00\x00\x00\x00\x00\xde\x01\xdf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe1\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\xe4\xff\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe3\x01\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\xec\xff\x00\x00\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xe6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\xc6\xff\x00\x00\x00\x00w\x00x\x00\x00\x00\xe9\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xea\x01|\x00}\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00\xeb\x01\x00\x00"\x00\xec\x01\x00\x00$\x00%\x00\x80\x00B\x01\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\x00\x00\x00\x00\xf2\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xee\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf4\xff\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x01\xf1\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff\xe3\xff&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x01\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\x00\x00Y\x01\x00\x00\xbe\xff\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x00Z\x01\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\x01\x02\x00\x00\x00\x00\x02\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x00Y\x01\x00\x00\xdf\xff\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00Z\x01\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x01\x00\x00\x00\x00\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x02\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\x08\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00\xd7\xff\xd6\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\xd7\x00\x00\x00\x00\x00\xd7\xff\xd7\xff\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\xd6\xff\xd6\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\xd7\x00\x00\x00\x00\x00\xd6\xff\xd6\xff\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xaf\xff\x00\x00\x00\x00\t\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xce\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\x00\x00\x00\x00\x00\x00\xd4\xff\xd4\xff\xd4\xff\xd4\xff\xd4\xff\x00\x00\xd8\x00\x00\x00\xd4\xff\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\x00\x00\xd9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\x00\x00\xd3\xff\xd3\xff\xd3\xff\xd3\xff\xd3\xff\x00\x00\xd8\x00\x00\x00\xd3\xff\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\x00\x00\xd9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\x0b\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\xbd\xff\xbd\xff\xbd\xff\x00\x00\xd8\x00\x00\x00\xbd\xff\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x00\xd9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00\r\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x02\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\x00\x006\x00\x00\x00\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\xbd\xff\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x007\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00\x12\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\xf9\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\xfa\x00\x00\x00\x00\x00\xd7\xff\xd7\xff\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\xf9\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\xfa\x00\x00\x00\x00\x00\xd6\xff\xd6\xff\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x00\xf4\x00\x00\x00\xf5\x00\xf6\x00\xf7\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x00\xf4\x00\x00\x00\xf5\x00\xf6\x00\xf7\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x00\xf4\x00\x00\x00\xf5\x00\xf6\x00\xf7\x00\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x00\xf4\x00\x00\x00\xf5\x00\xf6\x00\xf7\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x00\xf4\x00\x00\x00\xf5\x00\xf6\x00\xf7\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x00\xf4\x00\x00\x00\xf5\x00\xf6\x00\xf7\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\xd4\xff\xd4\xff\xd4\xff\x00\x00\xfb\x00\x00\x00\xd4\xff\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\x00\x00\xfc\x00\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\xd3\xff\xd3\xff\xd3\xff\x00\x00\xfb\x00\x00\x00\xd3\xff\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\x00\x00\xfc\x00\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\x15\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\xbd\xff\xbd\xff\x00\x00\xfb\x00\x00\x00\xbd\xff\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x00\xfc\x00\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00\x17\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x02\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x11\x01\xd7\xff\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00\x12\x01\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x11\x01\xd6\xff\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x12\x01\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\xff\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\x00\x00\x13\x01\x00\x00\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\x00\x00\x14\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\x00\x00\x13\x01\x00\x00\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\x00\x00\x14\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\x1b\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\x00\x00\x13\x01\x00\x00\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x00\x14\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00\x1d\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 \x02\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00!\x02\x00\x00"\x02\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\x00\x00\xde\xff\xde\xff\x00\x00\xde\xff\xde\xff\xde\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\xff\x00\x00\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff#\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00$\x02\x00\x00\x00\x00\x00\x00%\x02&\x02\x00\x00\'\x02(\x02)\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\xff\x00\x00\x00\x00\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00E\x01\x00\x00\x00\x00\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xb5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00+\x02\xd5\xff\x00\x00\xd5\xff\x00\x00\x00\x00\xd5\xff,\x02\x00\x00\x00\x00\xd5\xff\xd5\xff\x00\x00\xd5\xff\xd5\xff\xd5\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd5\xff\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\x00\x00-\x02\xd2\xff\xd2\xff\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x00.\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\xb7\xff\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\x02\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x002\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x004\x02\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x02\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00-\x01\xd7\xff\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00.\x01\x00\x00\x00\x00\xd7\xff\xd7\xff\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00-\x01\xd6\xff\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00.\x01\x00\x00\x00\x00\xd6\xff\xd6\xff\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\xca\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00;\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00E\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\x01\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00=\x02\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\xec\xff\x00\x00\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xee\xff\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\x00\x00/\x01\x00\x00\xd4\xff\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\x00\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\x00\x00/\x01\x00\x00\xd3\xff\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\x00\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00?\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\x00\x00/\x01\x00\x00\xbd\xff\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x000\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00A\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00B\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00C\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00D\x02\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00E\x02\x00\x00\x00\x00F\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\x01\xdf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe1\x01\x00\x00\x00\x00\x00\x00\x00\x00H\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x01\xf1\x01K\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\x02N\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x02\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00R\x02\x00\x00\xe0\xff\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xff\xe0\xff\x00\x00\xe0\xff\x00\x00\xe0\xff\x00\x00\xe0\xff\x00\x00\xe0\xff\xe0\xff\xe0\xff+\x00\xe0\xff\xe0\xff\xe0\xff\x00\x00\x00\x00\xe0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00-\x00\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd2\xff\xd2\xff\x00\x00\xd2\xff\x00\x00S\x02\x00\x00\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\xd2\xff\xd2\xff\xd2\xff\x00\x00\x00\x00T\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00\xe9\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xea\x01|\x00}\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00\xeb\x01\x00\x00"\x00\xec\x01\x00\x00$\x00%\x00\x80\x00\xec\xff\x00\x00\x00\x00\x00\x00Y\x02Z\x02\x00\x00[\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\\\x02]\x02^\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00_\x02\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x1a\x01\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00a\x02\x00\x00\x00\x00\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\xf0\xff\x00\x00\x00\x00c\x02d\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00e\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\xef\xff\x00\x00\x00\x00\xf0\x01\xf1\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00h\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x01\xf1\x01k\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\x02N\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00W\x01\xd7\xff\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00X\x01\x00\x00\x00\x00\xd7\xff\xd7\xff\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00W\x01\xd6\xff\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00X\x01\x00\x00\x00\x00\xd6\xff\xd6\xff\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\x00\x00Y\x01\x00\x00\xd4\xff\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\x00\x00Z\x01\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\x00\x00Y\x01\x00\x00\xd3\xff\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\x00\x00Z\x01\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00m\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\x00\x00Y\x01\x00\x00\xbd\xff\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x00Z\x01\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00o\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00p\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00q\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00r\x02\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00H\x00I\x00\xb0\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00t\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe3\x00\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\x00\x00\x00\x00v\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xcb\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00w\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x01\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00y\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x01\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x01\x00\x00\x00\x00\xc1\x01\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x01\x00\x00\x00\x00\xc1\x01\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x01\x00\x00\x00\x00\xc1\x01\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x01\x00\x00\x00\x00\xc1\x01\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x01\x00\x00\x00\x00\xc1\x01\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x01\x00\x00\x00\x00\xc1\x01\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\xc5\xff\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x86\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\x00\x00-\x02\xbe\xff\xbe\xff\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x00.\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xba\x01\xbb\x01\x00\x00\xbc\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x01\xbe\x01\xbf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc2\x01\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\x89\x02\x00\x00\x00\x00\x8a\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x00-\x02\xdf\xff\xdf\xff\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00.\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8c\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00}\x01\x00\x00\x00\x00\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\xb4\xff\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8f\x02\x00\x00\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\xc7\xff\x00\x00\x00\x00\x8d\x00\x8e\x00\x00\x00\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x90\x00\x91\x00\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x00\x00\x00\x00\x00\x94\x00\x00\x00\x00\x00\x00\x00\x95\x00\x00\x00\x00\x00\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x91\x02\x00\x00\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00\x92\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00:\x01\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\xe5\xff\x00\x00\x00\x00w\x00x\x00\x00\x00y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00{\x00|\x00}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\x00\x00\x00\x00\xde\x01\xdf\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe1\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa9\xff\x00\x00\x00\x00\x96\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x97\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x98\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\x02N\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x02\x00\x00\x00\x00\x00\x00\x00\x00\x9a\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x01\xf1\x01\x9d\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\x02N\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xe1\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x00\xbe\x00\x00\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x00\x00\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x00\x00\xc5\x00\x00\x00\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00\xe9\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xea\x01|\x00}\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00\xeb\x01\x00\x00"\x00\xec\x01\x00\x00$\x00%\x00\x80\x00\xec\xff\x00\x00\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xe0\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xb8\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x00S\x02\x00\x00\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00T\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Y\x02Z\x02\x00\x00[\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\\\x02]\x02^\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa2\x02\x00\x00\x00\x00_\x02\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xa4\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00Y\x02Z\x02\x00\x00[\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\\\x02]\x02^\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00_\x02\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\xa6\x02\x00\x00\xfb\xff\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\x00\x00\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\xfb\xff\x00\x00\x00\x00\xfb\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\xce\xff\x00\x00\x00\x00f\x00g\x00\x00\x00h\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00i\x00j\x00k\x00\xb0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00l\x00\x00\x00\x00\x00m\x00\x00\x00\x00\x00\x00\x00n\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00,\x01\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x18\x00\x00\x00\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x00\x1c\x00\x1d\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00!\x00\x00\x00"\x00#\x00\x00\x00$\x00%\x00&\x00B\x01\x00\x00\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\xf3\xff\x00\x00\x00\x00c\x02d\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00e\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x02\x00\x00\x00\x00\x00\x00\x00\x00\xaa\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x01\xf1\x01\xad\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\x02N\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xfc\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\x00\x00\x00\x00\xf0\x01\xf1\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa9\xff\x00\x00\x00\x00\xb0\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb2\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00d\x01\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xae\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00+\x02\xd7\xff\x00\x00\xd7\xff\x00\x00\x00\x00\xd7\xff,\x02\x00\x00\x00\x00\xd7\xff\xd7\xff\x00\x00\xd7\xff\xd7\xff\xd7\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd7\xff\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00+\x02\xd6\xff\x00\x00\xd6\xff\x00\x00\x00\x00\xd6\xff,\x02\x00\x00\x00\x00\xd6\xff\xd6\xff\x00\x00\xd6\xff\xd6\xff\xd6\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd6\xff\x00\x00\x00\x00#\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00\x00\x00%\x02&\x02\x00\x00\'\x02(\x02)\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\xff\x00\x00\x00\x00&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc4\xff\x00\x00\x00\x00#\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00\x00\x00%\x02&\x02\x00\x00\'\x02(\x02)\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdb\xff\x00\x00\x00\x00#\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00\x00\x00%\x02&\x02\x00\x00\'\x02(\x02)\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\xff\x00\x00\x00\x00#\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00\x00\x00%\x02&\x02\x00\x00\'\x02(\x02)\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\xff\x00\x00\x00\x00#\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00\x00\x00%\x02&\x02\x00\x00\'\x02(\x02)\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd9\xff\x00\x00\x00\x00#\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\x00\x00%\x02&\x02\x00\x00\'\x02(\x02)\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xff\x00\x00\x00\x00\xd4\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\x00\x00-\x02\xd4\xff\xd4\xff\x00\x00\x00\x00\xd4\xff\xd4\xff\x00\x00\xd4\xff\xd4\xff\xd4\xff\x00\x00\x00\x00.\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\xff\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\x00\x00-\x02\xd3\xff\xd3\xff\x00\x00\x00\x00\xd3\xff\xd3\xff\x00\x00\xd3\xff\xd3\xff\xd3\xff\x00\x00\x00\x00.\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd3\xff\x00\x00\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xb5\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\x00\x00-\x02\xbd\xff\xbd\xff\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x00.\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00\xb7\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb8\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xba\x02\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff&\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\'\x01(\x01\x00\x00)\x01*\x01+\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbc\x02\x00\x00\x00\x00\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xed\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\n\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbd\x02\x0c\x01\r\x01\x00\x00\x0e\x01\x0f\x01\x10\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x00\x00\x00\x00\xf0\x01\xf1\x01\xc0\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc1\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\x00\x00\x00\x00M\x02N\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa9\xff\x00\x00\x00\x00\xc3\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc4\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc5\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xff\xa1\xffP\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Q\x01R\x01\x00\x00S\x01T\x01U\x01\x00\x00\x00\x00\x00\x00\xc6\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbe\xff\xbe\xff\x00\x00\xbe\xff\x00\x00S\x02\x00\x00\xbe\xff\x00\x00\xbe\xff\xbe\xff\xbe\xff\xbe\xff\xbe\xff\xbe\xff\xbe\xff\x00\x00\x00\x00T\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00Y\x02Z\x02\x00\x00[\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\\\x02]\x02^\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00_\x02\x00\x00\x00\x00\xce\x00\x00\x00\x00\x00\x00\x00\xc8\x02\x00\x00\x00\x00\xc9\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd1\x00\xd2\x00\x00\x00\xd3\x00\xd4\x00\xd5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xa7\xff\xdf\xff\x00\x00\x00\x00\x00\x00\x00\x00\xdf\xff\xdf\xff\x00\x00\xdf\xff\x00\x00S\x02\x00\x00\xdf\xff\x00\x00\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\xdf\xff\x00\x00\x00\x00T\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00H\x00I\x00\xcd\xffK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcb\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcc\x02\x00\x00\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\xa0\xff\x00\x00\x00\x00c\x02d\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00e\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00f\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa9\xff\x00\x00\x00\x00\xce\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\xac\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd0\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x00\x00\x00\x00\xf0\x01\xf1\x01\xd1\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd2\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\x00\x00\x00\x00\x00\x00\x00\x00\xd3\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008\x02\x00\x00\x00\x00\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x00\x00\x00\x00\xc9\xff\xc9\xff\x00\x00\xc9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc9\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc9\xff\xc9\xff\xc9\xff\x00\x00\xc9\xff\xc9\xff\xc6\x01\x00\x00\xc9\xff\x00\x00\xc9\xff\x00\x00\xc9\xff\xc9\xff\x00\x00\xc9\xff\xc9\xff\xc9\xff\xc9\xff\x00\x00\x00\x00\x00\x00w\x00x\x00\x00\x00\xe9\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xea\x01|\x00}\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00\xeb\x01\x00\x00"\x00\xec\x01\x00\x00$\x00%\x00\x80\x00\xd0\x01\x00\x00\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\xe2\xff\x00\x00\x00\x00\x00\x00\x00\x00\xa9\xff\x00\x00\x00\x00\xd7\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xa8\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x00\x00\x00\x00\xf0\x01\xf1\x01\xd9\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xda\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xad\xff\xbd\xff\x00\x00\x00\x00\x00\x00\x00\x00\xbd\xff\xbd\xff\x00\x00\xbd\xff\x00\x00S\x02\x00\x00\xbd\xff\x00\x00\xbd\xff\xbd\xff\xbd\xff\xbd\xff\xbd\xff\xbd\xff\xbd\xff\x00\x00\x00\x00T\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\xcf\xff\x00\x00\x00\x00H\x00I\x00\xdc\x02K\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x00M\x00N\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00O\x00\x00\x00\x00\x00P\x00\x00\x00\x00\x00\x00\x00Q\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdd\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xb1\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\xbc\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x9f\xff\x00\x00\x00\x00\xf0\x01\xf1\x01\xde\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\xaa\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdf\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xb6\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\xc8\xff\x00\x00\x00\x00w\x00x\x00\x00\x00\xe9\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xea\x01|\x00}\x00\x00\x00\x1e\x00\x1f\x00\x00\x00\x00\x00 \x00\x00\x00\xeb\x01\x00\x00"\x00\xec\x01\x00\x00$\x00%\x00\x80\x00\xec\xff\x00\x00\x00\x00\x00\x00\xf0\x01\xf1\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf2\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe1\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe2\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xa5\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xd0\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\xab\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe3\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xa4\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff\xb2\xff')
+GOTO = _load('h', b'\xff\xff\xff\xff\xff\xff\xff\xff\x01\x00\x02\x00\xff\xff\xff\xff\xff\xff\x03\x00\x04\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x05\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x00\x07\x00\xff\xff\xff\xff\xff\xff\x03\x00\x04\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x08\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\t\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\x10\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x15\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x007\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x008\x009\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff;\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffA\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffQ\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffR\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffS\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00_\x00\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xffp\x00\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x81\x00\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\x86\x00\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x95\x00\xff\xff\xff\xff\xff\xff\x98\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\x9b\x00\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\x9d\x00\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\x9e\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa0\x00\xa1\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa2\x00\xff\xff\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\xff\xff\xa5\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\xff\xff\xa7\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa8\x00\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa9\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\x14\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xac\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\x14\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xad\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\x14\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xae\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\x14\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xaf\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\x14\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\xa6\x00\xff\xff\xff\xff\x14\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb2\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xb6\x00\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x007\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x008\x00\xc5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc9\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff:\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xca\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd9\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xdb\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00\xdf\x00\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xe0\x00\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe1\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xe3\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffQ\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffR\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe4\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xe6\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffQ\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffR\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe8\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00\xea\x00\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xeb\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xec\x00@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00\x02\x01\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\x03\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x04\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\x06\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x14\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\x16\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x18\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00\x1a\x01\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\x1b\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x1c\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\x1e\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff#\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff$\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff0\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff2\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x006\x01\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff7\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00:\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00?\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00@\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffC\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x007\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xffK\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffZ\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\\\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff^\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00`\x01\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xffa\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffb\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00d\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xfff\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xff\xff\xffg\x01\xff\xff\xff\xffE\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xff\xff\xffh\x01\xff\xff\xff\xffE\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffi\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01k\x01\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffm\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffn\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffo\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffp\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffq\x01\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffr\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffs\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xffu\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffv\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00y\x01@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff{\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00}\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffQ\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffR\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x7f\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\x82\x01@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xff\xff\xff\x87\x01\xff\xff\xff\xffc\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xff\xff\xff\x88\x01\xff\xff\xff\xffc\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\x89\x01\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00\x8a\x01\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\x8b\x01\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\x8c\x01\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\x8d\x01\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\x8e\x01\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\x8f\x01\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x90\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x91\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\x93\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff`\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x94\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\x97\x01@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\x9a\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xff\xff\xff\x9c\x01\xff\xff\xff\xfft\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xff\xff\xff\x9d\x01\xff\xff\xff\xfft\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\x9e\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\x9f\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa0\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa1\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa2\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa3\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa5\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa7\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xab\x01@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xae\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x01\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xb2\x01\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xb4\x01\xb5\x01\xb6\x01\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xb8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\xff\xff\xc2\x01\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\xff\xff\xc3\x01\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xc7\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xc8\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xc9\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xca\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xcb\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xcc\x01\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xcd\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\xce\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd0\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xd3\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xd7\x01@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd9\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xda\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdc\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\xe1\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x007\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x008\x00\xe3\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xff\xe4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xe5\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xff\xe6\x01\xff\xff\xff\xffu\x00\xe7\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa0\x00\xec\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa2\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xee\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff$\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00?\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xff\xff\xf3\x01\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xff\xff\xf4\x01\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xf5\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xf6\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xf7\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xf8\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xf9\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xfa\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x01\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\x02\x02@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x04\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\x05\x02\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01\x0b\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xcd\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01\x10\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\x13\x02@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01\x15\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01\x1b\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff)\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff.\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff0\x02\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff2\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x004\x02\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff5\x02\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff6\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x008\x02\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff9\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff;\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x007\x00\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x008\x00=\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01?\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffF\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffH\x02I\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffK\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xff\xe4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xe5\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xff\xe6\x01\xff\xff\xff\xffu\x00T\x02\xe3\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffU\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffV\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffW\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff_\x02\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x98\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x1c\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffa\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfff\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffh\x02i\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffk\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01m\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01r\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfft\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffw\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffy\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xff\xffz\x02\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xff\xff{\x02\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x01\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff|\x02\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xb5\x01\xb6\x01\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xb8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff}\x02\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x01\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff~\x02\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xb5\x01\xb6\x01\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xb8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x01\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\x7f\x02\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xb5\x01\xb6\x01\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xb8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x01\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\x80\x02\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xb5\x01\xb6\x01\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xb8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x01\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\x81\x02\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xb5\x01\xb6\x01\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xb8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x01\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\x82\x02\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xb5\x01\xb6\x01\xff\xff\xff\xff\xb7\x01\xff\xff\xff\xff\xb8\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x83\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\x86\x02\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x87\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\x8a\x02@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x8c\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\x8d\x02\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x84\x00\xff\xff\x85\x00\xff\xff\xff\xff\xff\xff\xff\xff\x8f\x02\xff\xff\xff\xff\xff\xff\x87\x00\xff\xff\xff\xff\x88\x00\x89\x00\xff\xff\xff\xff\x8a\x00\xff\xff\xff\xff\x8b\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x92\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xffo\x00\xff\xff\xff\xff\xff\xff\xff\xff\x93\x02\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xfft\x00\xff\xff\xff\xffu\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x94\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x98\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x9a\x02\x9b\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x9d\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb4\x00\xff\xff\xb5\x00\xff\xff\xff\xff\xff\xff\xff\xff\x9f\x02\xff\xff\xff\xff\xff\xff\xb7\x00\xff\xff\xff\xff\xb8\x00\xb9\x00\xff\xff\xff\xff\xba\x00\xff\xff\xff\xff\xbb\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xff\xe4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xe5\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xff\xe6\x01\xff\xff\xff\xffu\x00T\x02\xc5\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffU\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffV\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa0\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xa2\x02\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffU\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffV\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa4\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\\\x00\xff\xff]\x00\xff\xff\xff\xff\xff\xff\xff\xff^\x00\xa6\x02\xff\xff\xff\xff`\x00\xff\xff\xff\xffa\x00b\x00\xff\xff\xff\xffc\x00\xff\xff\xff\xffd\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xa7\x02\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00\x9f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff#\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x0c\x00\xff\xff\r\x00\xff\xff\xff\xff\xff\xff\xff\xff\x0e\x00\xff\xff\xff\xff\xff\xff\x0f\x00\xae\x01\xff\xff\x11\x00\x12\x00\xff\xff\xff\xff\x13\x00\xff\xff\xff\xff\x14\x00@\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa8\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xaa\x02\xab\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xae\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01\xb5\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xba\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\x02\xbe\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc1\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffU\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffV\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc6\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xc9\x02@\x00\xff\xff\xff\xff\xff\xff\xff\xff\xed\x00\xff\xff\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xcc\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\x02\xbe\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd3\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd4\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xff\xe4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xe5\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xff\xe6\x01\xff\xff\xff\xffu\x00\xd5\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\x02\xbe\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff?\x00\xff\xff@\x00\xff\xff\xff\xff\xff\xff\xff\xffj\x01\xda\x02\xff\xff\xff\xffB\x00\xff\xff\xff\xffC\x00D\x00\xff\xff\xff\xffE\x00\xff\xff\xff\xffF\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\x02\xbe\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xffn\x00\xff\xff\xe4\x01\xff\xff\xff\xff\xff\xff\xff\xff\xe5\x01\xff\xff\xff\xff\xff\xffq\x00\xff\xff\xff\xffr\x00s\x00\xff\xff\xff\xff\xe6\x01\xff\xff\xff\xffu\x00T\x02=\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbd\x02\xbe\x02\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff')
+
+def _r0(states, symbols, builders):  # Program' → Program
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[0](children))
+    states.append(GOTO[states[-1] * _NN + 20])
+
+def _r1(states, symbols, builders):  # VariableInternal → mut IDENT
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[1](children))
+    states.append(GOTO[states[-1] * _NN + 26])
+
+def _r2(states, symbols, builders):  # VariableInternal → IDENT
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[2](children))
+    states.append(GOTO[states[-1] * _NN + 26])
+
+def _r3(states, symbols, builders):  # Type → i32
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[3](children))
+    states.append(GOTO[states[-1] * _NN + 24])
+
+def _r4(states, symbols, builders):  # Assignable → IDENT
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[4](children))
+    states.append(GOTO[states[-1] * _NN + 2])
+
+def _r5(states, symbols, builders):  # Program → DeclList
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[5](children))
+    states.append(GOTO[states[-1] * _NN + 19])
+
+def _r6(states, symbols, builders):  # DeclList → ε
+    children = []
+    symbols.append(builders[6](children))
+    states.append(GOTO[states[-1] * _NN + 5])
+
+def _r7(states, symbols, builders):  # DeclList → Decl DeclList
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[7](children))
+    states.append(GOTO[states[-1] * _NN + 5])
+
+def _r8(states, symbols, builders):  # Decl → FnDecl
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[8](children))
+    states.append(GOTO[states[-1] * _NN + 4])
+
+def _r9(states, symbols, builders):  # FnDecl → FnHead Block
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[9](children))
+    states.append(GOTO[states[-1] * _NN + 9])
+
+def _r10(states, symbols, builders):  # FnDecl → FnHead FuncExprBlock
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[10](children))
+    states.append(GOTO[states[-1] * _NN + 9])
+
+def _r11(states, symbols, builders):  # FnHead → fn IDENT ( ParamList )
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[11](children))
+    states.append(GOTO[states[-1] * _NN + 10])
+
+def _r12(states, symbols, builders):  # FnHead → fn IDENT ( ParamList ) -> Type
+    children = symbols[-7:]
+    del symbols[-7:]
+    del states[-7:]
+    symbols.append(builders[12](children))
+    states.append(GOTO[states[-1] * _NN + 10])
+
+def _r13(states, symbols, builders):  # ParamList → ε
+    children = []
+    symbols.append(builders[13](children))
+    states.append(GOTO[states[-1] * _NN + 17])
+
+def _r14(states, symbols, builders):  # ParamList → Param
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[14](children))
+    states.append(GOTO[states[-1] * _NN + 17])
+
+def _r15(states, symbols, builders):  # ParamList → Param , ParamList
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[15](children))
+    states.append(GOTO[states[-1] * _NN + 17])
+
+def _r16(states, symbols, builders):  # Param → VariableInternal : Type
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[16](children))
+    states.append(GOTO[states[-1] * _NN + 16])
+
+def _r17(states, symbols, builders):  # Block → { }
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[17](children))
+    states.append(GOTO[states[-1] * _NN + 3])
+
+def _r18(states, symbols, builders):  # Block → { Stmt StmtList }
+    children = symbols[-4:]
+    del symbols[-4:]
+    del states[-4:]
+    symbols.append(builders[18](children))
+    states.append(GOTO[states[-1] * _NN + 3])
+
+def _r19(states, symbols, builders):  # StmtList → ε
+    children = []
+    symbols.append(builders[19](children))
+    states.append(GOTO[states[-1] * _NN + 23])
+
+def _r20(states, symbols, builders):  # StmtList → Stmt
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[20](children))
+    states.append(GOTO[states[-1] * _NN + 23])
+
+def _r21(states, symbols, builders):  # StmtList → Stmt StmtList
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[21](children))
+    states.append(GOTO[states[-1] * _NN + 23])
+
+def _r22(states, symbols, builders):  # Stmt → ;
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[22](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r23(states, symbols, builders):  # Stmt → Expr ;
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[23](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r24(states, symbols, builders):  # Stmt → return ;
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[24](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r25(states, symbols, builders):  # Stmt → return Expr ;
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[25](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r26(states, symbols, builders):  # Stmt → let VariableInternal : Type ;
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[26](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r27(states, symbols, builders):  # Stmt → let VariableInternal ;
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[27](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r28(states, symbols, builders):  # Stmt → Assignable = Expr ;
+    children = symbols[-4:]
+    del symbols[-4:]
+    del states[-4:]
+    symbols.append(builders[28](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r29(states, symbols, builders):  # Stmt → let VariableInternal : Type = Expr ;
+    children = symbols[-7:]
+    del symbols[-7:]
+    del states[-7:]
+    symbols.append(builders[29](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r30(states, symbols, builders):  # Stmt → let VariableInternal = Expr ;
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[30](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r31(states, symbols, builders):  # Primary → Assignable
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[31](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r32(states, symbols, builders):  # Assignable → * Primary
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[32](children))
+    states.append(GOTO[states[-1] * _NN + 2])
+
+def _r33(states, symbols, builders):  # Expr → AddExpr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[33](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r34(states, symbols, builders):  # Expr → Expr == Expr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[34](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r35(states, symbols, builders):  # Expr → Expr != Expr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[35](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r36(states, symbols, builders):  # Expr → Expr < Expr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[36](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r37(states, symbols, builders):  # Expr → Expr <= Expr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[37](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r38(states, symbols, builders):  # Expr → Expr > Expr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[38](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r39(states, symbols, builders):  # Expr → Expr >= Expr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[39](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r40(states, symbols, builders):  # AddExpr → AddExpr + MulExpr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[40](children))
+    states.append(GOTO[states[-1] * _NN + 0])
+
+def _r41(states, symbols, builders):  # AddExpr → AddExpr - MulExpr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[41](children))
+    states.append(GOTO[states[-1] * _NN + 0])
+
+def _r42(states, symbols, builders):  # AddExpr → MulExpr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[42](children))
+    states.append(GOTO[states[-1] * _NN + 0])
+
+def _r43(states, symbols, builders):  # MulExpr → MulExpr * Primary
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[43](children))
+    states.append(GOTO[states[-1] * _NN + 15])
+
+def _r44(states, symbols, builders):  # MulExpr → MulExpr / Primary
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[44](children))
+    states.append(GOTO[states[-1] * _NN + 15])
+
+def _r45(states, symbols, builders):  # MulExpr → Primary
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[45](children))
+    states.append(GOTO[states[-1] * _NN + 15])
+
+def _r46(states, symbols, builders):  # Primary → IDENT
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[46](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r47(states, symbols, builders):  # Primary → IDENT ( ArgList )
+    children = symbols[-4:]
+    del symbols[-4:]
+    del states[-4:]
+    symbols.append(builders[47](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r48(states, symbols, builders):  # Primary → ( Expr )
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[48](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r49(states, symbols, builders):  # Primary → NUMBER
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[49](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r50(states, symbols, builders):  # ArgList → ε
+    children = []
+    symbols.append(builders[50](children))
+    states.append(GOTO[states[-1] * _NN + 1])
+
+def _r51(states, symbols, builders):  # ArgList → Expr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[51](children))
+    states.append(GOTO[states[-1] * _NN + 1])
+
+def _r52(states, symbols, builders):  # ArgList → Expr , ArgList
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[52](children))
+    states.append(GOTO[states[-1] * _NN + 1])
+
+def _r53(states, symbols, builders):  # Stmt → if Expr Block ElsePart
+    children = symbols[-4:]
+    del symbols[-4:]
+    del states[-4:]
+    symbols.append(builders[53](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r54(states, symbols, builders):  # ElsePart → ε
+    children = []
+    symbols.append(builders[54](children))
+    states.append(GOTO[states[-1] * _NN + 6])
+
+def _r55(states, symbols, builders):  # ElsePart → else if Expr Block ElsePart
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[55](children))
+    states.append(GOTO[states[-1] * _NN + 6])
+
+def _r56(states, symbols, builders):  # ElsePart → else Block
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[56](children))
+    states.append(GOTO[states[-1] * _NN + 6])
+
+def _r57(states, symbols, builders):  # Stmt → while Expr Block
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[57](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r58(states, symbols, builders):  # Stmt → for VariableInternal in Iterable Block
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[58](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r59(states, symbols, builders):  # Iterable → Expr .. Expr
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[59](children))
+    states.append(GOTO[states[-1] * _NN + 13])
+
+def _r60(states, symbols, builders):  # Iterable → Expr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[60](children))
+    states.append(GOTO[states[-1] * _NN + 13])
+
+def _r61(states, symbols, builders):  # Stmt → loop Block
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[61](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r62(states, symbols, builders):  # Stmt → break ;
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[62](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r63(states, symbols, builders):  # Stmt → continue ;
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[63](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r64(states, symbols, builders):  # Primary → * Primary
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[64](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r65(states, symbols, builders):  # Primary → & Primary
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[65](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r66(states, symbols, builders):  # Primary → & mut Primary
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[66](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r67(states, symbols, builders):  # FuncExprBlock → { FuncStmtList }
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[67](children))
+    states.append(GOTO[states[-1] * _NN + 11])
+
+def _r68(states, symbols, builders):  # FuncStmtList → Stmt FuncStmtList
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[68](children))
+    states.append(GOTO[states[-1] * _NN + 12])
+
+def _r69(states, symbols, builders):  # FuncStmtList → Stmt
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[69](children))
+    states.append(GOTO[states[-1] * _NN + 12])
+
+def _r70(states, symbols, builders):  # FuncStmtList → Expr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[70](children))
+    states.append(GOTO[states[-1] * _NN + 12])
+
+def _r71(states, symbols, builders):  # Primary → FuncExprBlock
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[71](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r72(states, symbols, builders):  # Expr → SelectExpr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[72](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r73(states, symbols, builders):  # SelectExpr → if Expr FuncExprBlock else FuncExprBlock
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[73](children))
+    states.append(GOTO[states[-1] * _NN + 21])
+
+def _r74(states, symbols, builders):  # Expr → LoopExpr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[74](children))
+    states.append(GOTO[states[-1] * _NN + 7])
+
+def _r75(states, symbols, builders):  # LoopExpr → loop FuncExprBlock
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[75](children))
+    states.append(GOTO[states[-1] * _NN + 14])
+
+def _r76(states, symbols, builders):  # Stmt → break Expr ;
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[76](children))
+    states.append(GOTO[states[-1] * _NN + 22])
+
+def _r77(states, symbols, builders):  # Type → [ Type ; NUMBER ]
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[77](children))
+    states.append(GOTO[states[-1] * _NN + 24])
+
+def _r78(states, symbols, builders):  # Primary → [ ExprList ]
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[78](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r79(states, symbols, builders):  # ExprList → ε
+    children = []
+    symbols.append(builders[79](children))
+    states.append(GOTO[states[-1] * _NN + 8])
+
+def _r80(states, symbols, builders):  # ExprList → Expr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[80](children))
+    states.append(GOTO[states[-1] * _NN + 8])
+
+def _r81(states, symbols, builders):  # ExprList → Expr , ExprList
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[81](children))
+    states.append(GOTO[states[-1] * _NN + 8])
+
+def _r82(states, symbols, builders):  # Assignable → Primary [ Expr ]
+    children = symbols[-4:]
+    del symbols[-4:]
+    del states[-4:]
+    symbols.append(builders[82](children))
+    states.append(GOTO[states[-1] * _NN + 2])
+
+def _r83(states, symbols, builders):  # Type → ( )
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[83](children))
+    states.append(GOTO[states[-1] * _NN + 24])
+
+def _r84(states, symbols, builders):  # Type → ( Type , )
+    children = symbols[-4:]
+    del symbols[-4:]
+    del states[-4:]
+    symbols.append(builders[84](children))
+    states.append(GOTO[states[-1] * _NN + 24])
+
+def _r85(states, symbols, builders):  # Type → ( TypeList )
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[85](children))
+    states.append(GOTO[states[-1] * _NN + 24])
+
+def _r86(states, symbols, builders):  # TypeList → Type
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[86](children))
+    states.append(GOTO[states[-1] * _NN + 25])
+
+def _r87(states, symbols, builders):  # TypeList → Type , TypeList
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[87](children))
+    states.append(GOTO[states[-1] * _NN + 25])
+
+def _r88(states, symbols, builders):  # Primary → ( )
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[88](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r89(states, symbols, builders):  # Primary → ( Expr )
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[89](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r90(states, symbols, builders):  # Primary → ( Expr , )
+    children = symbols[-4:]
+    del symbols[-4:]
+    del states[-4:]
+    symbols.append(builders[90](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r91(states, symbols, builders):  # Primary → ( Expr , ExprList )
+    children = symbols[-5:]
+    del symbols[-5:]
+    del states[-5:]
+    symbols.append(builders[91](children))
+    states.append(GOTO[states[-1] * _NN + 18])
+
+def _r92(states, symbols, builders):  # ExprList → Expr
+    children = symbols[-1:]
+    del symbols[-1:]
+    del states[-1:]
+    symbols.append(builders[92](children))
+    states.append(GOTO[states[-1] * _NN + 8])
+
+def _r93(states, symbols, builders):  # ExprList → Expr , ExprList
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[93](children))
+    states.append(GOTO[states[-1] * _NN + 8])
+
+def _r94(states, symbols, builders):  # Assignable → Primary . NUMBER
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[94](children))
+    states.append(GOTO[states[-1] * _NN + 2])
+
+def _r95(states, symbols, builders):  # Type → & Type
+    children = symbols[-2:]
+    del symbols[-2:]
+    del states[-2:]
+    symbols.append(builders[95](children))
+    states.append(GOTO[states[-1] * _NN + 24])
+
+def _r96(states, symbols, builders):  # Type → & mut Type
+    children = symbols[-3:]
+    del symbols[-3:]
+    del states[-3:]
+    symbols.append(builders[96](children))
+    states.append(GOTO[states[-1] * _NN + 24])
+
+REDUCE = (_r0, _r1, _r2, _r3, _r4, _r5, _r6, _r7, _r8, _r9, _r10, _r11, _r12, _r13, _r14, _r15, _r16, _r17, _r18, _r19, _r20, _r21, _r22, _r23, _r24, _r25, _r26, _r27, _r28, _r29, _r30, _r31, _r32, _r33, _r34, _r35, _r36, _r37, _r38, _r39, _r40, _r41, _r42, _r43, _r44, _r45, _r46, _r47, _r48, _r49, _r50, _r51, _r52, _r53, _r54, _r55, _r56, _r57, _r58, _r59, _r60, _r61, _r62, _r63, _r64, _r65, _r66, _r67, _r68, _r69, _r70, _r71, _r72, _r73, _r74, _r75, _r76, _r77, _r78, _r79, _r80, _r81, _r82, _r83, _r84, _r85, _r86, _r87, _r88, _r89, _r90, _r91, _r92, _r93, _r94, _r95, _r96)
+
+def parse(tokens, builders):
+    """
+    tokens 为以 EOF 结尾的任意 token 序列或迭代器，只向前看一个 token。
+    向前看符号直接取分词时打上的终结符编号 tok.term，要求它与 TERMINALS 的编号一致
+    （lexer.TERMINALS == TERMINALS，LR1Parser 使用本模块前会核对）。
+    builders[p](children) 构造产生式 p 的语义值，返回开始符号的语义值。
+    """
+    states = [0]
+    symbols = []
+    it = iter(tokens)
+    tok = next(it)
+    t = tok.term
+    while True:
+        state = states[-1]
+        act = ACTION[state * _W + t]
+        if act > 0:
+            states.append(act - 1)
+            symbols.append(tok)
+            tok = next(it)
+            t = tok.term
+        elif act < -1:
+            REDUCE[-act - 1](states, symbols, builders)
+        elif act == -1:
+            return symbols[-1]
+        else:
+            raise SyntaxError(f"Unexpected token {tok!r} (lookahead={terminal_name(tok)}) in state {state}")
@@ -1,7 +1,13 @@
 import html
 from html import escape
+from lexer import symbol_name
 
 class ASTNode:
+    @property
+    def name(self):
+        # 带名字的节点（函数、参数、变量、标识符）只保存驻留编号 sym，名字仅用于显示
+        return symbol_name(self.sym)
+
     def graphviz(self, dot=None, parent=None, edge_label=""):
         if dot is None:
             from graphviz import Digraph
@@ -86,8 +92,8 @@ class FuncDecl(ASTNode):
 
         self.body.graphviz(dot, node_id, "body")
 
-    def __init__(self, name, params, ret_type, body,line,col):
-        self.name = name
+    def __init__(self, sym, params, ret_type, body,line,col):
+        self.sym = sym
         self.params = params
         self.ret_type = ret_type
         self.body = body
@@ -103,8 +109,8 @@ class Param(ASTNode):
             typ_str = str(self.typ)
         return f"Param\\n{mut}{self.name}: {typ_str}"
 
-    def __init__(self, name, mutable, typ,line,col):
-        self.name = name
+    def __init__(self, sym, mutable, typ,line,col):
+        self.sym = sym
         self.mutable = mutable
         self.typ = typ
         self.line = line
@@ -115,8 +121,8 @@ class VarBinding(ASTNode):
         mut = "mut " if self.mutable else ""
         return f"VarBinding\\n{mut}{self.name}"
 
-    def __init__(self, name, mutable,line,col):
-        self.name = name
+    def __init__(self, sym, mutable,line,col):
+        self.sym = sym
         self.mutable = mutable
         self.line = line
         self.col = col
@@ -127,8 +133,8 @@ class VarDecl(Stmt):
         typ = f": {self.typ}" if self.typ else ""
         return f"VarDecl\\n{mut}{self.name}{typ}"
 
-    def __init__(self, name, mutable, typ, init,line,col):
-        self.name = name
+    def __init__(self, sym, mutable, typ, init,line,col):
+        self.sym = sym
         self.mutable = mutable
         self.typ = typ
         self.init = init
@@ -180,8 +186,8 @@ class ForStmt(Stmt):
         mut = "mut " if self.mutable else ""
         return f"For\\n{mut}{self.name}"
 
-    def __init__(self, name, mutable, start, end, body,line,col):
-        self.name = name
+    def __init__(self, sym, mutable, start, end, body,line,col):
+        self.sym = sym
         self.mutable = mutable
         self.start = start
         self.end = end
@@ -291,8 +297,8 @@ class Ident(Expr):
     def _graphviz_label(self):
         return f"Identifier\\n{self.name}"
 
-    def __init__(self, name,line,col):
-        self.name = name
+    def __init__(self, sym,line,col):
+        self.sym = sym
         self.line = line
         self.col = col
         self.computed_type=None
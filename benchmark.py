@@ -0,0 +1,318 @@
+# benchmark.py  – 性能基准
+# 用法: python benchmark.py <项目> [参数...]
+#   python benchmark.py lexer [重复次数]
+#   python benchmark.py token_memory [重复次数]
+#   python benchmark.py batch_lexer [文件数] [每个文件的重复次数]
+#   python benchmark.py parser [重复次数]
+#   python benchmark.py parser_startup [轮数]
+#   python benchmark.py lr1_build
+#   python benchmark.py table_scaling [最大规模]
+#   python benchmark.py reduce [语句数]
+#   python benchmark.py sequences [元素数]
+#   python benchmark.py trace [重复次数]
+#   python benchmark.py streaming [重复次数]
+
+import importlib
+import os
+import pickle
+import py_compile
+import sys
+import tempfile
+import time
+import tracemalloc
+from lexer import tokenize, tokenize_file, tokenize_files, TokenBuffer
+from lr1_parser import LR1Parser, ParseTrace, PARSE_TABLE_FILE, compiled_parser
+from packed_tables import PackedTables
+from grammar import Grammar, build_grammar, build_lr1_states, build_parse_table
+from generate_parse_tables import profile_build
+
+SAMPLE_FILE = 'test.rs'
+
+
+def synthetic_source(repeat):
+    """把 test.rs 重复 repeat 次，函数名加后缀避免重名，得到任意大小的合法源码。"""
+    with open(SAMPLE_FILE, encoding='utf-8') as f:
+        text = f.read()
+    return '\n'.join(text.replace('fn program_', f'fn p{i}_') for i in range(repeat))
+
+
+def timeit(fn, *args, rounds=3):
+    """取 rounds 次运行中的最短耗时（秒）。"""
+    best = None
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn(*args)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def bench_lexer(repeat=200):
+    text = synthetic_source(repeat)
+    ntok = len(tokenize(text))
+    print(f"源码 {len(text) / 1e6:.2f} MB, {ntok} 个 token")
+    base = None
+    for engine in ('scan', 'regex'):
+        dt = timeit(tokenize, text, engine)
+        base = base or dt
+        print(f"  {engine:6} {dt:8.3f}s  {ntok / dt / 1e6:6.2f} M tok/s  x{base / dt:.2f}")
+
+
+def traced(fn, *args):
+    """返回 (fn 的结果, 结果常驻内存字节数, 构造过程中的峰值字节数)。"""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    result = fn(*args)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current - base, peak - base
+
+
+def bench_token_memory(repeat=200):
+    text = synthetic_source(repeat)
+    tokenize(text)  # 先填充全局驻留表，两种存储都不计入驻留字符串本身
+    tokens, list_bytes, list_peak = traced(tokenize, text)
+    buf, buf_bytes, buf_peak = traced(TokenBuffer.from_source, text)
+    n = len(tokens)
+    del tokens
+    print(f"源码 {len(text) / 1e6:.2f} MB, {n} 个 token")
+    print(f"  list[Token]  {list_bytes / 1e6:8.2f} MB  {list_bytes / n:6.1f} B/tok  峰值 {list_peak / 1e6:.2f} MB")
+    print(f"  TokenBuffer  {buf_bytes / 1e6:8.2f} MB  {buf_bytes / n:6.1f} B/tok  峰值 {buf_peak / 1e6:.2f} MB")
+    print(f"  缩减 x{list_bytes / buf_bytes:.1f}")
+
+
+def bench_batch_lexer(nfiles=64, repeat=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        text = synthetic_source(repeat)
+        paths = []
+        for i in range(nfiles):
+            path = os.path.join(tmp, f'f{i}.rs')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            paths.append(path)
+        bufs = tokenize_files(paths, workers=1)
+        ntok = sum(len(b) for b in bufs)
+        wire = sum(len(pickle.dumps(b)) for b in bufs)
+        print(f"{nfiles} 个文件, 共 {nfiles * len(text) / 1e6:.2f} MB, {ntok} 个 token, "
+              f"回传 {wire / ntok:.1f} B/tok (CPU 核数 {os.cpu_count()})")
+        base = None
+        for workers in (1, 2, 4, 8):
+            chunksize = max(1, nfiles // (workers * 4))
+            dt = timeit(tokenize_files, paths, workers, chunksize)
+            base = base or dt
+            print(f"  {workers} 进程  {dt:8.3f}s  {ntok / dt / 1e6:6.2f} M tok/s  x{base / dt:.2f}")
+
+
+def bench_parser(repeat=50):
+    t0 = time.perf_counter()
+    parser = LR1Parser()
+    init = time.perf_counter() - t0
+    tables = parser.tables
+    print(f"解析表 {len(tables)} 个状态, {tables.nbytes()} B 数组, "
+          f"{PARSE_TABLE_FILE} {os.path.getsize(PARSE_TABLE_FILE)} B, 加载 {init * 1e3:.2f} ms")
+    tokens = tokenize(synthetic_source(repeat))
+    compiled = parser.compiled
+    parser.compiled = None
+    base = timeit(parser.parse, tokens)
+    print(f"  {len(tokens)} 个 token")
+    print(f"  通用循环    {base:8.3f}s  {len(tokens) / base / 1e3:8.1f} k tok/s")
+    if compiled is None:
+        print("  （没有与当前文法一致的 _parser_tables.py，可用 generate_parse_tables.py --codegen 生成）")
+        return
+    parser.compiled = compiled
+    dt = timeit(parser.parse, tokens)
+    print(f"  生成的循环  {dt:8.3f}s  {len(tokens) / dt / 1e3:8.1f} k tok/s  x{base / dt:.2f}")
+
+
+def bench_parser_startup(rounds=50):
+    """加载解析表的耗时：pickle（原先的 dict 表 / 压缩表）、mmap 二进制文件、从 .pyc 导入生成的模块。"""
+    G = build_grammar()
+    C, first, trans = build_lr1_states(G)
+    legacy = pickle.dumps((G, *build_parse_table(C, G, trans, report=False)))
+    tables = PackedTables.open(PARSE_TABLE_FILE)
+    blob = pickle.dumps(tables)
+
+    def reimport():
+        sys.modules.pop('_parser_tables', None)
+        importlib.import_module('_parser_tables')
+
+    cases = [('pickle dict 表', lambda: pickle.loads(legacy)),
+             ('pickle 压缩表', lambda: pickle.loads(blob)),
+             ('mmap 二进制', lambda: PackedTables.open(PARSE_TABLE_FILE))]
+    codegen = compiled_parser(tables) is not None
+    if codegen:
+        py_compile.compile('_parser_tables.py')    # 确保 __pycache__ 中已有 .pyc（即使设置了 PYTHONDONTWRITEBYTECODE）
+        cases.append(('导入 .pyc', reimport))
+
+    base = None
+    for name, fn in cases:
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        dt = (time.perf_counter() - t0) / rounds
+        base = base or dt
+        print(f"  {name:12} {dt * 1e3:8.3f} ms  x{base / dt:.2f}")
+    if not codegen:
+        print("  （没有与当前文法一致的 _parser_tables.py，可用 generate_parse_tables.py --codegen 生成）")
+
+
+def bench_lr1_build():
+    """串行与 2/4/8 进程并行构造 LR(1) 项目集族的耗时，并核对结果完全相同。"""
+    G = build_grammar()
+    base = timeit(build_lr1_states, G)
+    C, _, trans = build_lr1_states(G)
+    print(f"{len(C)} 个状态, CPU 核数 {os.cpu_count()}")
+    print(f"  串行     {base * 1e3:8.1f} ms")
+    for workers in (2, 4, 8):
+        dt = timeit(build_lr1_states, G, workers)
+        C2, _, trans2 = build_lr1_states(G, workers)
+        same = '一致' if (C2, trans2) == (C, trans) else '不一致!'
+        print(f"  {workers} 进程  {dt * 1e3:8.1f} ms  x{base / dt:.2f}  {same}")
+
+
+def scaled_grammar(n):
+    """
+    在实际文法上人为扩大规模：Expr 与 AddExpr 之间插入 n 层优先级（每层两个左结合运算符），
+    再加 n 种语句形式 `kwK Expr Block`。运算符和关键字都是新终结符，n=0 时就是原文法。
+    """
+    base = build_grammar()
+    G = Grammar()
+    G.start = 'Program'
+    top = 'Level0' if n else 'AddExpr'
+    for p in base.productions[1:]:
+        G.add_prod(p.lhs, [top] if p.lhs == 'Expr' and p.rhs == ['AddExpr'] else p.rhs)
+    for k in range(n):
+        cur, nxt = f'Level{k}', f'Level{k + 1}' if k + 1 < n else 'AddExpr'
+        for op in (f'op{k}a', f'op{k}b'):
+            G.add_prod(cur, [cur, op, nxt])
+        G.add_prod(cur, [nxt])
+        G.add_prod('Stmt', [f'kw{k}', 'Expr', 'Block'])
+    G.augment()
+    G.compute_terminals()
+    return G
+
+
+def bench_table_scaling(limit=8):
+    """文法规模从 0 到 limit 逐步扩大，看各阶段构造耗时和状态数如何增长。"""
+    print(f"{'规模':>4} {'产生式':>6} {'终结符':>6} {'状态':>6} {'closure':>8} {'LR(1)项目':>10}"
+          f" {'FIRST':>8} {'项目集族':>9} {'ACTION':>8} {'压缩':>8} {'峰值':>9}")
+    for n in range(limit + 1):
+        G = scaled_grammar(n)
+        rows = profile_build(G)
+        counts = rows[1][3]
+        times = ''.join(f" {dt * 1e3:7.1f}ms" for _, dt, _, _ in rows)
+        peak = max(p for _, _, p, _ in rows)
+        print(f"{n:4} {len(G.productions):6} {len(G.terminals):6} {counts['状态']:6} "
+              f"{counts['closure 调用']:8} {counts['LR(1) 项目']:10}{times} {peak / 1e6:7.2f}MB")
+
+
+def reduce_heavy_source(n):
+    """n 条深层嵌套表达式语句：每个 token 平均要引发多次归约。"""
+    stmt = "    x = ((x + 1) * (y - 2) / 3 + *p - &q) <= [a, (b, c), d[0]][1].0;"
+    return "fn main() {\n    let mut x: i32 = 0;\n" + "\n".join([stmt] * n) + "\n}\n"
+
+
+def bench_reduce(n=5000):
+    """归约密集的输入上每次归约的开销（通用循环与生成的循环都按产生式编号取语义动作）。"""
+    parser = LR1Parser()
+    tokens = tokenize(reduce_heavy_source(n))
+    nreduce = 0
+    builders = parser.builders
+
+    def counting(b):
+        def f(children):
+            nonlocal nreduce
+            nreduce += 1
+            return b(children)
+        return f
+
+    parser.builders = [counting(b) for b in builders]
+    parser.parse(tokens)
+    parser.builders = builders
+    print(f"{len(tokens)} 个 token, {nreduce} 次归约 ({nreduce / len(tokens):.2f} 次/token)")
+    compiled = parser.compiled
+    for name, mod in (('通用循环', None), ('生成的循环', compiled)):
+        if name == '生成的循环' and compiled is None:
+            break
+        parser.compiled = mod
+        dt = timeit(parser.parse, tokens)
+        print(f"  {name:6} {dt:8.3f}s  {nreduce / dt / 1e3:8.1f} k 归约/s  {dt / nreduce * 1e9:6.0f} ns/归约")
+
+
+def long_function_source(n):
+    """一个含 n 条语句的函数。"""
+    return "fn main() {\n    let mut x: i32 = 0;\n" + "    x = x + 1;\n" * n + "}\n"
+
+
+def many_functions_source(n):
+    """n 个函数的文件，函数带参数并互相调用，参数表和实参表也各有若干项。"""
+    return ''.join(f"fn f{i}(a: i32, b: i32, c: i32) -> i32 {{ return f{i}(a, b, c); }}\n" for i in range(n))
+
+
+def bench_sequences(n=10000):
+    """长语句序列、长函数序列的解析耗时；每个元素的平均耗时应与 n 无关。"""
+    parser = LR1Parser()
+    for name, make in (('单个函数 n 条语句', long_function_source), ('n 个函数', many_functions_source)):
+        print(name)
+        for k in (n // 4, n // 2, n):
+            tokens = tokenize(make(k))
+            dt = timeit(parser.parse, tokens)
+            print(f"  n={k:6}  {len(tokens):7} 个 token  {dt:7.3f}s  {dt / k * 1e6:7.2f} µs/元素")
+
+
+def bench_trace(repeat=20):
+    """带解析过程记录的解析：记录本身的开销、内存，以及按 GUI 的方式展开全部行的耗时。"""
+    parser = LR1Parser()
+    parser.compiled = None
+    tokens = tokenize(synthetic_source(repeat))
+    base = timeit(parser.parse, tokens)
+    trace = ParseTrace(tokens, parser.productions)
+    dt = timeit(lambda: parser.parse(tokens, ParseTrace(tokens, parser.productions)))
+    _, nbytes, _ = traced(parser.parse, tokens, trace)
+    print(f"{len(tokens)} 个 token, {len(trace)} 步")
+    print(f"  不记录      {base:8.3f}s")
+    print(f"  ParseTrace  {dt:8.3f}s  x{dt / base:.2f}  {nbytes / len(trace):.1f} B/步（含 AST）")
+    t0 = time.perf_counter()
+    for _ in trace.iter_rows(max_input=40, symbols=False):
+        pass
+    print(f"  展开全部行  {time.perf_counter() - t0:8.3f}s  （输入串列最多 40 个 token，不含符号栈）")
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as f:
+        dt = timeit(lambda: parser.parse(tokens, ParseTrace(tokens, parser.productions, stream=f)), rounds=1)
+        print(f"  写入文件    {dt:8.3f}s  {f.tell() / 1e6:.2f} MB")
+
+
+def bench_streaming(repeat=200):
+    """先分词成完整的 token 表再解析，与边读边分词边解析（parse_file）的耗时和内存峰值。"""
+    parser = LR1Parser()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'big.rs')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(synthetic_source(repeat))
+        print(f"源码 {os.path.getsize(path) / 1e6:.2f} MB")
+        for name, fn in (('list[Token]', lambda: parser.parse(tokenize_file(path))),
+                         ('TokenBuffer', lambda: parser.parse(TokenBuffer.from_file(path))),
+                         ('parse_file', lambda: parser.parse_file(path))):
+            dt = timeit(fn)
+            _, _, peak = traced(fn)
+            print(f"  {name:12} {dt:8.3f}s  峰值 {peak / 1e6:8.2f} MB（含 AST）")
+
+
+BENCHES = {
+    'lexer': bench_lexer,
+    'token_memory': bench_token_memory,
+    'batch_lexer': bench_batch_lexer,
+    'parser': bench_parser,
+    'parser_startup': bench_parser_startup,
+    'lr1_build': bench_lr1_build,
+    'table_scaling': bench_table_scaling,
+    'reduce': bench_reduce,
+    'sequences': bench_sequences,
+    'trace': bench_trace,
+    'streaming': bench_streaming,
+}
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHES:
+        print(f"用法: python benchmark.py <{'|'.join(BENCHES)}> [参数...]")
+        sys.exit(1)
+    BENCHES[sys.argv[1]](*map(int, sys.argv[2:]))
@@ -1,19 +1,224 @@
 # generate_parse_tables.py
+# 用法: python generate_parse_tables.py [--lalr] [--codegen] [--full] [--jobs N] [--profile]
+#   默认生成规范 LR(1) 表；--lalr 合并同核心状态生成 LALR(1) 表，并与 LR(1) 对比规模
+#   --codegen 另外生成独立的解析器模块 _parser_tables.py（表为常量，解析循环按产生式展开）
+#   默认复用上一次构造的项目集族，只重算受文法修改影响的状态；--full 强制完整构造
+#   --jobs N 用 N 个进程并行求闭包（结果与串行完全相同）
+#   --profile 只做一次完整的串行构造，按阶段打印耗时、closure 次数、项目数、状态数和内存峰值
 
-import pickle
+import os
+import re
+import sys
+import time
 import json
-from grammar import build_grammar, build_lr1_states, build_parse_table
+import tracemalloc
+from array import array
+import grammar
+from grammar import (build_grammar, build_parse_table, merge_lalr, lalr_new_conflicts,
+                     compute_first_sets, compute_suffix_first, build_collection)
+from packed_tables import PackedTables, atomic_write, build_states
+from lr1_parser import PARSE_TABLE_FILE
 
-def main():
+PARSER_MODULE_FILE = '_parser_tables.py'
+
+def table_stats(G, ACTION, GOTO):
+    """(状态数, ACTION 表项数, GOTO 表项数, 表文件字节数, 平均加载秒数)"""
+    blob = PackedTables.from_tables(G, ACTION, GOTO).to_bytes()
+    t0 = time.perf_counter()
+    for _ in range(20):
+        PackedTables.from_buffer(blob)
+    load = (time.perf_counter() - t0) / 20
+    return (len(set(ACTION) | set(GOTO)),
+            sum(len(row) for row in ACTION.values()),
+            sum(len(row) for row in GOTO.values()),
+            len(blob), load)
+
+def _array_literal(values):
+    """把整数序列写成 array(...) 的源码：数据是一个小端 bytes 常量，导入时只需一次拷贝。"""
+    code = 'h' if all(-32768 <= v < 32768 for v in values) else 'i'
+    a = array(code, values)
+    if sys.byteorder != 'little':
+        a.byteswap()
+    return f"_load({code!r}, {a.tobytes()!r})"
+
+def emit_parser_module(tables):
+    """
+    生成独立的解析器模块源码。
+    ACTION 展开成稠密的 状态 × (终结符 + 1) 一维数组，最后一列给不认识的 token；
+    默认归约状态整行都填默认动作，解析时就不必单独判断。GOTO 也展开成稠密数组。
+    每条产生式各生成一个归约函数，弹栈个数、GOTO 列和构造函数编号都在生成时确定。
+    """
+    nstates, nterm, nnonterm = len(tables), len(tables.terminals), len(tables.nonterminals)
+    width = nterm + 1
+    action = []
+    for s in range(nstates):
+        d = tables.default_action[s]
+        action += [d] * width if d else [tables.action(s, t) for t in range(nterm)] + [0]
+    goto = []
+    for s in range(nstates):
+        for A in range(nnonterm):
+            j = tables.goto(s, A)
+            goto.append(-1 if j is None else j)
+
+    out = [
+        "# _parser_tables.py  – 由 generate_parse_tables.py --codegen 生成，请勿手工修改",
+        "import sys",
+        "from array import array",
+        "from lexer import terminal_name",
+        "",
+        "def _load(code, data):",
+        "    a = array(code, data)",
+        "    if sys.byteorder != 'little':",
+        "        a.byteswap()",
+        "    return a",
+        "",
+        f"FINGERPRINT = {tables.digest()!r}   # 生成本模块的解析表的 PackedTables.digest()",
+        f"TERMINALS = {tuple(tables.terminals)!r}",
+        f"PRODUCTIONS = {tuple((lhs, tuple(rhs)) for lhs, rhs in tables.prods)!r}",
+        f"_W = {width}          # ACTION 每行的列数",
+        f"_UNKNOWN = {nterm}    # 不认识的 token 所在的列",
+        f"_NN = {nnonterm}      # GOTO 每行的列数",
+        f"ACTION = {_array_literal(action)}",
+        f"GOTO = {_array_literal(goto)}",
+        "",
+    ]
+    for p, (lhs, rhs) in enumerate(tables.prods):
+        A = tables.nonterm_ids[lhs]
+        n = len(rhs)
+        out.append(f"def _r{p}(states, symbols, builders):  # {lhs} → {' '.join(rhs) or 'ε'}")
+        if n:
+            out += [f"    children = symbols[-{n}:]",
+                    f"    del symbols[-{n}:]",
+                    f"    del states[-{n}:]"]
+        else:
+            out.append("    children = []")
+        out += [f"    symbols.append(builders[{p}](children))",
+                f"    states.append(GOTO[states[-1] * _NN + {A}])",
+                ""]
+    out += [
+        "REDUCE = (" + ', '.join(f'_r{p}' for p in range(len(tables.prods))) + ")",
+        "",
+        "def parse(tokens, builders):",
+        '    """',
+        "    tokens 为以 EOF 结尾的任意 token 序列或迭代器，只向前看一个 token。",
+        "    向前看符号直接取分词时打上的终结符编号 tok.term，要求它与 TERMINALS 的编号一致",
+        "    （lexer.TERMINALS == TERMINALS，LR1Parser 使用本模块前会核对）。",
+        "    builders[p](children) 构造产生式 p 的语义值，返回开始符号的语义值。",
+        '    """',
+        "    states = [0]",
+        "    symbols = []",
+        "    it = iter(tokens)",
+        "    tok = next(it)",
+        "    t = tok.term",
+        "    while True:",
+        "        state = states[-1]",
+        "        act = ACTION[state * _W + t]",
+        "        if act > 0:",
+        "            states.append(act - 1)",
+        "            symbols.append(tok)",
+        "            tok = next(it)",
+        "            t = tok.term",
+        "        elif act < -1:",
+        "            REDUCE[-act - 1](states, symbols, builders)",
+        "        elif act == -1:",
+        "            return symbols[-1]",
+        "        else:",
+        '            raise SyntaxError(f"Unexpected token {tok!r} (lookahead={terminal_name(tok)}) in state {state}")',
+        "",
+    ]
+    return '\n'.join(out)
+
+def profile_build(G):
+    """
+    分阶段完整构造一次解析表（串行、不复用快照）。每个阶段先不开 tracemalloc 计时并计数，
+    再开着 tracemalloc 重跑一遍取内存峰值，免得跟踪内存拖慢计时。
+    返回 [(阶段名, 秒, 峰值字节, {计数名: 值})]。
+    """
+    out = {}
+
+    def first_sets():
+        first = compute_first_sets(G)
+        compute_suffix_first(G, first)
+        out['first'] = first
+        return {'FIRST 项': sum(len(f) for f in first.values())}
+
+    def collection():
+        C, trans, _ = build_collection(G, out['first'])
+        out['C'], out['trans'] = C, trans
+        return {'状态': len(C),
+                '核心项目': sum(len(I) for I in C),
+                'LR(1) 项目': sum(las.bit_count() for I in C for las in I.values())}
+
+    def parse_table():
+        ACTION, GOTO = build_parse_table(out['C'], G, out['trans'], report=False)
+        out['ACTION'], out['GOTO'] = ACTION, GOTO
+        return {'ACTION 项': sum(len(row) for row in ACTION.values()),
+                'GOTO 项': sum(len(row) for row in GOTO.values())}
+
+    def pack():
+        tables = PackedTables.from_tables(G, out['ACTION'], out['GOTO'])
+        return {'数组字节': tables.nbytes()}
+
+    rows = []
+    for name, phase in (('FIRST 集', first_sets), ('closure/goto', collection),
+                        ('ACTION/GOTO', parse_table), ('压缩表', pack)):
+        grammar.STATS = stats = grammar.BuildStats()
+        try:
+            t0 = time.perf_counter()
+            counts = phase()
+            dt = time.perf_counter() - t0
+        finally:
+            grammar.STATS = None
+        if stats.closure_calls:
+            counts = {'closure 调用': stats.closure_calls, '新增项目': stats.closure_items,
+                      'goto 调用': stats.goto_calls, **counts}
+        tracemalloc.start()
+        try:
+            phase()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        rows.append((name, dt, peak, counts))
+    return rows
+
+def print_profile(rows):
+    total = sum(dt for _, dt, _, _ in rows)
+    print(f"{'阶段':14} {'耗时':>9} {'占比':>6} {'内存峰值':>10}  计数")
+    for name, dt, peak, counts in rows:
+        detail = ', '.join(f"{k} {v}" for k, v in counts.items())
+        print(f"{name:14} {dt * 1e3:7.1f}ms {dt / total:6.1%} {peak / 1024:8.1f}KB  {detail}")
+    print(f"{'合计':14} {total * 1e3:7.1f}ms")
+
+def module_digest(path):
+    """不导入模块，从生成的解析器模块源码中读出 FINGERPRINT。"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            m = re.match(r"FINGERPRINT = '([0-9a-f]+)'", line)
+            if m:
+                return m.group(1)
+    return None
+
+def main(lalr=False, codegen=False, full=False, jobs=1):
     # 1) 构建文法和 LR(1) 状态机
     G = build_grammar()
-    C, first = build_lr1_states(G)
-    ACTION, GOTO = build_parse_table(C, G, first)
+    t0 = time.perf_counter()
+    C, first, trans, reused = build_states(G, incremental=not full, workers=jobs)
+    print(f"LR(1) 项目集族: {len(C)} 个状态，复用上次的 {reused} 个，用时 {(time.perf_counter() - t0) * 1e3:.1f} ms")
+    if lalr:
+        L, ltrans, members = merge_lalr(C, trans)
+        ACTION, GOTO = build_parse_table(L, G, ltrans)
+        new = lalr_new_conflicts(C, L, members, G)
+        for j, la, prods in new:
+            print(f"LALR 合并引入的归约/归约冲突: state {j}, lookahead {la}: {prods}")
+        print(f"LALR 合并新增 {len(new)} 处归约/归约冲突")
+    else:
+        ACTION, GOTO = build_parse_table(C, G, trans)
 
-    # 2) 保存为 pickle（二进制，用于 parser 加载）
-    with open('parse_tables.pkl', 'wb') as f:
-        pickle.dump((G, ACTION, GOTO), f)
-    print(f"Saved parse_tables.pkl ({len(C)} states)")
+    # 2) 压缩成整数表后保存为二进制文件（parser 用 mmap 直接读取）
+    tables = PackedTables.from_tables(G, ACTION, GOTO)
+    atomic_write(PARSE_TABLE_FILE, tables.to_bytes())
+    print(f"Saved {PARSE_TABLE_FILE} ({len(tables)} states, {'LALR(1)' if lalr else 'LR(1)'}, "
+          f"{tables.nbytes()} table bytes)")
 
     # 3) 保存为 JSON（文本，可人类阅读）
     def format_action(act):
@@ -40,5 +245,26 @@ def main():
 
     print("Saved parse_tables_debug.json (human-readable ACTION/GOTO)")
 
+    if codegen:
+        atomic_write(PARSER_MODULE_FILE, emit_parser_module(tables).encode('utf-8'))
+        print(f"Saved {PARSER_MODULE_FILE} (standalone parser)")
+    elif os.path.exists(PARSER_MODULE_FILE) and module_digest(PARSER_MODULE_FILE) != tables.digest():
+        # 旧模块是由另一份表生成的（例如从 LR(1) 换成 LALR(1)），留着只会被忽略
+        os.remove(PARSER_MODULE_FILE)
+        print(f"Removed stale {PARSER_MODULE_FILE} (rerun with --codegen to regenerate)")
+
+    # 4) LALR 模式下与规范 LR(1) 对比规模
+    if lalr:
+        rows = [('LR(1)', table_stats(G, *build_parse_table(C, G, trans, report=False))),
+                ('LALR(1)', table_stats(G, ACTION, GOTO))]
+        print(f"{'':8} {'状态':>6} {'ACTION':>8} {'GOTO':>6} {'文件':>8} {'加载':>9}")
+        for name, (n, na, ng, nb, load) in rows:
+            print(f"{name:8} {n:6} {na:8} {ng:6} {nb / 1024:8.1f}KB {load * 1e3:7.2f}ms")
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    args = sys.argv[1:]
+    jobs = int(args[args.index('--jobs') + 1]) if '--jobs' in args else 1
+    if '--profile' in args:
+        print_profile(profile_build(build_grammar()))
+        sys.exit(0)
+    main(lalr='--lalr' in args, codegen='--codegen' in args, full='--full' in args, jobs=jobs)
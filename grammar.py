@@ -1,5 +1,7 @@
 # grammar.py  – 覆盖版
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from ast_nodes import *   # 若 AST 模块需要
 
 # ─────────── 文法结构 ────────────
@@ -14,17 +16,29 @@ class Grammar:
         self.productions = []
         self.nonterminals, self.terminals = set(), set()
         self.start = ''
+        self.by_lhs = {}            # 左部 -> 该非终结符的全部产生式
+        self.suffix_first = None    # 产生式后缀的 FIRST 缓存，见 compute_suffix_first
+        self.term_ids = {}          # 终结符（含 '$'）-> 位编号，向前看集合用这些位组成的整数表示
+        self.term_names = []
     def add_prod(self, lhs: str, rhs: list[str]):
-        self.productions.append(Production(lhs, rhs))
+        p = Production(lhs, rhs)
+        self.productions.append(p)
+        self.by_lhs.setdefault(lhs, []).append(p)
         self.nonterminals.add(lhs)
     def compute_terminals(self):
         syms = {s for p in self.productions for s in p.rhs if s}
         self.terminals = syms - self.nonterminals
+        self.term_names = sorted(self.terminals | {'$'})
+        self.term_ids = {t: i for i, t in enumerate(self.term_names)}
     def augment(self):
         ns = self.start + "'"
-        self.productions.insert(0, Production(ns, [self.start]))
+        p = Production(ns, [self.start])
+        self.productions.insert(0, p)
+        self.by_lhs[ns] = [p]
         self.nonterminals.add(ns)
         self.start = ns
+        for i, p in enumerate(self.productions):
+            p.index = i     # 产生式编号，增广产生式为 0
 
 # ─────────── 构建文法 ────────────
 def build_grammar() -> Grammar:
@@ -167,6 +181,15 @@ def build_grammar() -> Grammar:
     return G
 
 # ─────────── FIRST / closure / goto ────────────
+class BuildStats:
+    """构造项目集族时的计数器，见 generate_parse_tables.profile_build。"""
+    def __init__(self):
+        self.closure_calls = 0
+        self.closure_items = 0      # closure 新加入的项目（按核心计，不含 kernel）
+        self.goto_calls = 0         # 计算出的后继核心项目集个数
+
+STATS = None    # 设为 BuildStats() 时 closure / goto 在本进程内计数，多进程构造时不统计
+
 class Item:
     def __init__(self, prod, dot, la):
         self.prod, self.dot, self.la = prod, dot, la
@@ -216,71 +239,342 @@ def first_seq(seq, first):
             out.add(X); return out
     out.add(''); return out
 
-def closure(items, G, first):
-    C=set(items)
-    while True:
-        new=set(C)
-        for it in C:
-            B=it.next_symbol()
-            if B in G.nonterminals:
-                beta=it.prod.rhs[it.dot+1:]
-                for p in G.productions:
-                    if p.lhs==B:
-                        for la in first_seq(beta+[it.la], first):
-                            new.add(Item(p,0,la))
-        if new==C: break
-        C=new
-    return C
+def compute_suffix_first(G, first):
+    """
+    预先算出每个产生式每个后缀 rhs[k:] 的 (FIRST 位集, 是否可空)，
+    结果存入 G.suffix_first[prod.index][k]，closure 中直接查表。
+    """
+    ids=G.term_ids
+    table=[]
+    for p in G.productions:
+        row=[None]*len(p.rhs)+[(0,True)]
+        for k in range(len(p.rhs)-1,-1,-1):
+            X=p.rhs[k]
+            if X in first:
+                f=0
+                for t in first[X]-{''}:
+                    f|=1<<ids[t]
+                if '' in first[X]:
+                    rest,nullable=row[k+1]
+                    row[k]=(f|rest,nullable)
+                else:
+                    row[k]=(f,False)
+            else:
+                row[k]=(1<<ids[X],False)
+        table.append(row)
+    G.suffix_first=table
+    return table
+
+def iter_bits(mask):
+    """按从低到高的顺序产出 mask 中置位的位编号。"""
+    while mask:
+        low=mask&-mask
+        yield low.bit_length()-1
+        mask^=low
+
+# 项目集表示为 {(产生式编号, 点的位置): 向前看位集}：同一核心的 LR(1) 项目合并成一项，
+# 向前看终结符按 G.term_ids 编号压成一个整数。
+def closure(kernel, G, first):
+    sfx=G.suffix_first or compute_suffix_first(G, first)
+    prods=G.productions
+    I=dict(kernel)
+    work=list(I)    # 工作队列：只展开新加入或向前看集合变大的项目
+    while work:
+        core=work.pop()
+        pi,dot=core
+        rhs=prods[pi].rhs
+        if dot<len(rhs) and rhs[dot] in G.by_lhs:
+            f,nullable=sfx[pi][dot+1]
+            las=f|I[core] if nullable else f
+            for p in G.by_lhs[rhs[dot]]:
+                c=(p.index,0)
+                old=I.get(c,0)
+                if las&~old:
+                    I[c]=old|las; work.append(c)
+    if STATS is not None:
+        STATS.closure_calls+=1
+        STATS.closure_items+=len(I)-len(kernel)
+    return I
 
 def goto(I,X,G,first):
-    moved={Item(it.prod,it.dot+1,it.la) for it in I if it.next_symbol()==X}
+    prods=G.productions
+    moved={}
+    for (pi,dot),las in I.items():
+        rhs=prods[pi].rhs
+        if dot<len(rhs) and rhs[dot]==X:
+            moved[(pi,dot+1)]=las
     return closure(moved,G,first)
 
-def build_lr1_states(G):
+def expand_items(I, G):
+    """把按核心合并的项目集展开成 Item 列表，便于调试打印。"""
+    return [Item(G.productions[pi],dot,G.term_names[t])
+            for (pi,dot),las in sorted(I.items()) for t in iter_bits(las)]
+
+def _symbol_order(G):
+    return {X:k for k,X in enumerate(sorted(G.nonterminals)+sorted(G.terminals))}
+
+def _successors(I, G, order):
+    """按下一个符号把 I 中的项目分组并右移点，返回按符号顺序排列的 [(X, 后继核心项目集)]。"""
+    prods=G.productions
+    moved=defaultdict(dict)
+    for (pi,dot),las in I.items():
+        rhs=prods[pi].rhs
+        if dot<len(rhs):
+            moved[rhs[dot]][(pi,dot+1)]=las
+    if STATS is not None:
+        STATS.goto_calls+=len(moved)
+    return [(X,moved[X]) for X in sorted(moved,key=order.__getitem__)]
+
+def _expand(kernel, G, first, order):
+    I=closure(kernel,G,first)
+    return I,_successors(I,G,order)
+
+_worker_args=None
+
+def _init_worker(G, first):
+    global _worker_args
+    _worker_args=(G,first,_symbol_order(G))
+
+def _expand_in_worker(kernel):
+    return _expand(kernel,*_worker_args)
+
+def _collection(G, first, reuse=None, pool=None, workers=1):
+    """
+    项目集族的逐层（按广度优先的波次）构造。每一层新出现的核心项目集先全部求闭包和后继
+    （给了进程池 pool 时分给各进程并行计算），再由本进程按编号顺序去重、给新核心编号，
+    编号顺序与逐个状态串行处理时完全相同。
+    reuse 为 {核心项目集键: 闭包}，命中时直接取用，不再求闭包。
+    返回 (C, trans, 各状态的核心项目集键)。
+    """
+    order=_symbol_order(G)
+    reuse=reuse or {}
+
+    def expand_all(kernels):
+        if pool is None or len(kernels)<2:
+            return [_expand(k,G,first,order) for k in kernels]
+        chunk=max(1,len(kernels)//(workers*4))
+        return list(pool.map(_expand_in_worker,kernels,chunksize=chunk))
+
+    k0={(0,0):1<<G.term_ids['$']}
+    keys=[frozenset(k0.items())]
+    index={keys[0]:0}
+    C,trans=[],[]
+    wave=[k0]
+    while wave:
+        start=len(C)
+        results=[None]*len(wave)
+        todo=[]
+        for n,kernel in enumerate(wave):
+            I=reuse.get(keys[start+n])
+            if I is None:
+                todo.append(n)
+            else:
+                results[n]=(I,_successors(I,G,order))
+        for n,r in zip(todo,expand_all([wave[n] for n in todo])):
+            results[n]=r
+        wave=[]
+        for I,succ in results:
+            C.append(I)
+            row={}
+            for X,kernel in succ:
+                key=frozenset(kernel.items())
+                j=index.get(key)
+                if j is None:
+                    j=index[key]=len(keys)
+                    keys.append(key); wave.append(kernel)
+                row[X]=j
+            trans.append(row)
+    return C,trans,keys
+
+def build_collection(G, first, workers=1, reuse=None):
+    """由已算好的 FIRST 集构造项目集族，返回 (C, trans, 各状态的核心项目集键)。"""
+    if workers==1:
+        return _collection(G, first, reuse)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(G, first)) as pool:
+        return _collection(G, first, reuse, pool, workers or os.cpu_count())
+
+def build_lr1_states(G, workers=1):
+    """
+    构造规范 LR(1) 项目集族。状态以核心项目集（kernel）为键存入字典，
+    每个状态的 goto 只在出队时按下一个符号分组计算一次，结果记入转移表 trans：
+    trans[i][X] = j。符号按固定顺序遍历，状态编号在多次运行之间保持一致。
+    workers 不为 1 时用这么多个进程（None 为 CPU 核数）并行求闭包，结果与串行完全相同。
+    """
     first=compute_first_sets(G)
-    I0=closure({Item(G.productions[0],0,'$')},G,first)
-    C=[I0]; changed=True
-    while changed:
-        changed=False
-        for I in list(C):
-            for X in G.nonterminals|G.terminals:
-                J=goto(I,X,G,first)
-                if J and J not in C:
-                    C.append(J); changed=True
-    return C,first
+    compute_suffix_first(G, first)
+    C,trans,_=build_collection(G, first, workers)
+    return C,first,trans
+
+class LR1Snapshot:
+    """
+    保存下来的项目集族，供文法修改后增量构造：每个状态记下核心项目集、闭包，
+    以及闭包所依赖的非终结符（闭包中任一项目点之后出现的非终结符）。
+    产生式和终结符都按文本保存，编号变化后可以重新映射。
+    """
+    def __init__(self, G, first, C, keys):
+        self.prods=[(p.lhs,tuple(p.rhs)) for p in G.productions]
+        self.term_names=list(G.term_names)
+        self.first={A:frozenset(f) for A,f in first.items()}
+        self.states=[]
+        for key,I in zip(keys,C):
+            deps=set()
+            for (pi,dot) in I:
+                deps.update(X for X in G.productions[pi].rhs[dot:] if X in G.by_lhs)
+            self.states.append((key,I,frozenset(deps)))
+
+    def dirty_nonterminals(self, G, first):
+        """产生式集合或 FIRST 集合（含是否可空）发生变化的非终结符。"""
+        old=defaultdict(list)       # 用列表而非集合：重复的产生式也算一次修改
+        for lhs,rhs in self.prods:
+            old[lhs].append(rhs)
+        new=defaultdict(list)
+        for p in G.productions:
+            new[p.lhs].append(tuple(p.rhs))
+        for rows in (old,new):
+            for rhss in rows.values():
+                rhss.sort()
+        names=set(old)|set(new)
+        return {A for A in names
+                if old.get(A)!=new.get(A) or self.first.get(A)!=frozenset(first.get(A,()))}
+
+    def reusable(self, G, first):
+        """
+        返回在新文法下仍然成立的闭包 {核心项目集键: 闭包}，取出的闭包已换成新的产生式编号和向前看位。
+        闭包不依赖任何变化了的非终结符时，新文法下求得的闭包与原来完全相同。
+        """
+        dirty=self.dirty_nonterminals(G, first)
+        # 文法里可能有重复的产生式，按 (文本, 第几次出现) 对应
+        index,seen={},defaultdict(int)
+        for p in G.productions:
+            pr=(p.lhs,tuple(p.rhs))
+            index[pr,seen[pr]]=p.index; seen[pr]+=1
+        pmap,seen=[],defaultdict(int)
+        for pr in self.prods:
+            pmap.append(index.get((pr,seen[pr]))); seen[pr]+=1
+        bmap=[G.term_ids.get(t) for t in self.term_names]
+        same_bits=bmap==list(range(len(bmap)))
+
+        def remap(I):
+            if identity:
+                return I
+            out={}
+            for (pi,dot),las in I.items():
+                npi=pmap[pi]
+                if npi is None:
+                    return None
+                if not same_bits:
+                    m=0
+                    for t in iter_bits(las):
+                        if bmap[t] is None:
+                            return None
+                        m|=1<<bmap[t]
+                    las=m
+                out[(npi,dot)]=las
+            return out
+
+        identity=same_bits and pmap==list(range(len(pmap))) and len(pmap)==len(G.productions)
+        reuse=_Reuse(remap)
+        for key,I,deps in self.states:
+            if deps&dirty:
+                continue
+            kernel=remap(dict(key))
+            if kernel is not None:
+                reuse[frozenset(kernel.items())]=I
+        return reuse
+
+class _Reuse(dict):
+    """{核心项目集键: 旧闭包}，取用时才把旧闭包换成新编号。"""
+    def __init__(self, remap):
+        super().__init__()
+        self.remap=remap
+    def get(self, key):
+        I=dict.get(self, key)
+        return None if I is None else self.remap(I)
+
+def build_lr1_states_incremental(G, prev=None, workers=1):
+    """
+    增量构造：prev 为上一次的 LR1Snapshot，未受文法修改影响的状态直接复用其闭包，
+    其余状态重新求闭包，再按与 build_lr1_states 相同的顺序重新编号。
+    结果与完整构造完全一致。返回 (C, first, trans, 新的 LR1Snapshot, 复用的状态数)。
+    """
+    first=compute_first_sets(G)
+    compute_suffix_first(G, first)
+    reuse=prev.reusable(G, first) if prev is not None else {}
+    C,trans,keys=build_collection(G, first, workers, reuse)
+    reused=sum(1 for k in keys if k in reuse)
+    return C,first,trans,LR1Snapshot(G, first, C, keys),reused
+
+def merge_lalr(C, trans):
+    """
+    LALR(1)：把核心相同的规范 LR(1) 状态合并，向前看位集取并集。
+    新状态按其第一个成员在 C 中出现的顺序编号。
+    返回 (合并后的项目集族, 转移表, 每个新状态包含的规范状态编号列表)。
+    """
+    index, L, members = {}, [], []
+    for i,I in enumerate(C):
+        key=frozenset(I)
+        j=index.get(key)
+        if j is None:
+            j=index[key]=len(L)
+            L.append(dict(I)); members.append([i])
+        else:
+            merged=L[j]
+            for core,las in I.items():
+                merged[core]|=las
+            members[j].append(i)
+    remap=[index[frozenset(I)] for I in C]
+    ltrans=[{X:remap[j] for X,j in trans[m[0]].items()} for m in members]
+    return L, ltrans, members
+
+def reduce_sets(I, G):
+    """状态 I 中每个向前看位对应的可归约产生式编号集合。"""
+    prods=G.productions
+    out=defaultdict(set)
+    for (pi,dot),las in I.items():
+        if dot==len(prods[pi].rhs):
+            for t in iter_bits(las):
+                out[t].add(pi)
+    return out
+
+def lalr_new_conflicts(C, L, members, G):
+    """
+    找出合并后才出现的归约/归约冲突：合并状态在某个向前看上有多条可归约产生式，
+    而任何一个成员状态在该向前看上都没有完全相同的一组。返回 [(状态, 向前看, [产生式])]。
+    """
+    out=[]
+    for j,I in enumerate(L):
+        parts=[reduce_sets(C[i],G) for i in members[j]]
+        for t,pis in sorted(reduce_sets(I,G).items()):
+            if len(pis)>1 and all(r.get(t)!=pis for r in parts):
+                out.append((j,G.term_names[t],[G.productions[pi] for pi in sorted(pis)]))
+    return out
 
 # ─────────── ACTION / GOTO ────────────
-def build_parse_table(C, G, first):
+def build_parse_table(C, G, trans, report=True):
+    """
+    由项目集族和转移表生成 ACTION/GOTO。冲突的处理方式：
+    移进优先于归约；归约/归约冲突取产生式编号较小（在文法中先出现）的一条。
+    report 为 False 时不打印冲突。
+    """
     ACTION, GOTO = defaultdict(dict), defaultdict(dict)
+    prods, names = G.productions, G.term_names
     for i,I in enumerate(C):
-        for it in I:
-            # REDUCE
-            if it.dot == len(it.prod.rhs):
-                if it.prod.lhs!=G.start:
-                    if it.la not in ACTION[i]:
-                        ACTION[i][it.la] = ('reduce', it.prod)
-                    else:
-                        print(f"冲突在 state {i}, lookahead {it.la}: 已存在 {ACTION[i][it.la]}，新动作为 ('reduce', {it.prod})")
-                elif it.prod.lhs==G.start:
+        for X,j in trans[i].items():
+            if X in G.terminals:
+                ACTION[i][X] = ('shift', j)
+            else:
+                GOTO[i][X] = j
+        done=sorted(pi for (pi,dot) in I if dot==len(prods[pi].rhs))
+        for pi in done:
+            prod=prods[pi]
+            for t in iter_bits(I[(pi,len(prod.rhs))]):
+                la=names[t]
+                if prod.lhs==G.start:
                     ACTION[i]['$'] = ('accept', None)
-
-            # SHIFT
-            a = it.next_symbol()
-            if a in G.terminals:
-                j = C.index(goto(I, a, G, first))
-                ACTION[i][a] = ('shift', j)
-            # a = it.next_symbol()
-            # if a in G.terminals:
-            #     j = C.index(goto(I,a,G,first))
-            #     ACTION[i].setdefault(a, ('shift', j))            # ★ 修改 shift 优先
-            # if it.dot == len(it.prod.rhs) and it.prod.lhs != G.start:
-            #     ACTION[i].setdefault(it.la, ('reduce', it.prod)) # ★ reduce 若无 shift
-            # if it.dot == len(it.prod.rhs) and it.prod.lhs == G.start:
-            #     ACTION[i]['$'] = ('accept', None)
-        for A in G.nonterminals:
-            J = goto(I,A,G,first)
-            if J:
-                GOTO[i][A] = C.index(J)
+                elif la not in ACTION[i]:
+                    ACTION[i][la] = ('reduce', prod)
+                elif report:
+                    print(f"冲突在 state {i}, lookahead {la}: 已存在 {ACTION[i][la]}，新动作为 ('reduce', {prod})")
     return ACTION, GOTO
 
 # ———— 调试入口 (可选验证) ————
@@ -288,20 +582,18 @@ if __name__ == '__main__':
     # G = build_grammar()
     # states, first = build_lr1_states(G)
     # ACTION, GOTO  = build_parse_table(states, G, first)
-    import pickle
     import os
-    PARSE_TABLE_FILE = 'parse_tables.pkl'
+    from packed_tables import PackedTables
+    PARSE_TABLE_FILE = 'parse_tables.bin'
     if os.path.exists(PARSE_TABLE_FILE):
-        with open(PARSE_TABLE_FILE, 'rb') as f:
-            G, ACTION, GOTO = pickle.load(f)
-            # states=build_lr1_states(G)[0]
+        productions = PackedTables.open(PARSE_TABLE_FILE).productions
+        # states=build_lr1_states(G)[0]
     else:
         G = build_grammar()
-        C, first = build_lr1_states(G)
-        ACTION, GOTO = build_parse_table(C, G, first)
+        C, first, trans = build_lr1_states(G)
+        ACTION, GOTO = build_parse_table(C, G, trans)
         states = C
-        with open(PARSE_TABLE_FILE, 'wb') as f:
-            pickle.dump((G, ACTION, GOTO), f)
+        productions = G.productions
 
     # target = 82
     # print(f"\n=====  State {target}  =====")
@@ -311,6 +603,6 @@ if __name__ == '__main__':
     # for sym, act in ACTION[target].items():
     #     print(f"  {sym!r:10} -> {act}")
     print("所有以 Stmt → 开头的产生式：")
-    for prod in G.productions:
+    for prod in productions:
         if prod.lhs == 'Stmt':
             print(prod)
@@ -1,19 +1,30 @@
 from ast_nodes import *
+from lexer import symbol_id, symbol_name
 
 class IRGenerator:
     def __init__(self):
-        self.code = []          # 存储四元组列表，形如 (op, arg1, arg2, result)
+        self.code = []          # 存储四元组列表，形如 (op, arg1, arg2, result)；名字是驻留编号(int)，常量是字符串
         self.temp_count = 0     # 临时变量计数器
         self.temp_label=0
         self.loop_stack = []  # 用于管理 break/goto label
 
-    def new_temp(self): #生成唯一的临时变量名t1, t2...
+    def new_temp(self): #生成唯一的临时变量名t1, t2...（返回其驻留编号）
         self.temp_count += 1
-        return f"t{self.temp_count}"
+        return symbol_id(f"t{self.temp_count}")
 
     def new_label(self):
         self.temp_label += 1
-        return f"L{self.temp_label}"
+        return symbol_id(f"L{self.temp_label}")
+
+    def listing(self):
+        """把四元组里的名字编号换回文本，供显示使用。"""
+        def show(x):
+            if isinstance(x, int):
+                return symbol_name(x)
+            if isinstance(x, list):
+                return [show(y) for y in x]
+            return x
+        return [tuple(show(x) for x in quad) for quad in self.code]
 
     def generate(self, node): #根据传入AST节点类型，动态调用对应的gen_类型名函数生成IR
         """主入口，根据节点类型调度到对应方法"""
@@ -30,36 +41,36 @@ class IRGenerator:
 
     def gen_FuncDecl(self, node: FuncDecl):
         # 生成函数声明，生成label，处理参数，生成函数体
-        self.code.append(('func_start', node.name, None, None))
+        self.code.append(('func_start', node.sym, None, None))
         for param in node.params:
             self.generate(param)
         ret_val = self.generate(node.body)  # 获取 block 的返回值
         if ret_val is not None:
             self.code.append(('return', ret_val, None, None))
-        self.code.append(('func_end', node.name, None, None))
+        self.code.append(('func_end', node.sym, None, None))
 
     def gen_Param(self, node: Param):
-        self.code.append(('param', node.name, node.typ, None))
+        self.code.append(('param', node.sym, node.typ, None))
         pass
 
     def gen_VarBinding(self, node: VarBinding):
         # 生成绑定表达式的值
         val = self.generate(node.expr)  # 递归生成表达式结果
         # 生成赋值代码，将表达式结果赋给变量名
-        var_name = node.name if isinstance(node.name, str) else self.generate(node.name)
+        var_name = node.sym
         self.code.append(('assign', val, None, var_name))
         return var_name
 
     def gen_VarDecl(self, node):
         # 先生成变量声明
-        self.code.append(('decl', node.name, node.typ, None))
+        self.code.append(('decl', node.sym, node.typ, None))
         # 若有初始化表达式，再生成赋值四元组
         if node.init:
             # 如果初始化是 Block或 IfStmt，则标记为表达式上下文
             if isinstance(node.init, (Block,IfStmt)):
                 node.init.as_expr = True
             val = self.generate(node.init)
-            self.code.append(('assign', val, None, node.name))
+            self.code.append(('assign', val, None, node.sym))
         else:
             # 无初始化不生成代码，假设声明在符号表
             pass
@@ -67,7 +78,7 @@ class IRGenerator:
     def gen_AssignStmt(self, node):
         val = self.generate(node.expr)
         # 赋值四元组 (assign, val, None, target)
-        target_name = node.target.name if hasattr(node.target, 'name') else str(node.target)
+        target_name = node.target.sym if hasattr(node.target, 'sym') else str(node.target)
         self.code.append(('assign', val, None, target_name))
 
     def gen_ReturnStmt(self, node): #生成返回语句四元组
@@ -125,7 +136,7 @@ class IRGenerator:
         self.loop_stack.pop()
 
     def gen_ForStmt(self, node: ForStmt):
-        loop_var = node.name  # 循环变量名
+        loop_var = node.sym  # 循环变量名
         start_temp = self.generate(node.start)  # 计算起始值
         self.code.append(('assign', start_temp, None, loop_var))  # i = start
 
@@ -231,8 +242,8 @@ class IRGenerator:
     def gen_NumberLit(self, node): #直接返回数字常量字符串
         return str(node.value)
 
-    def gen_Ident(self, node): #返回标识符名字
-        return node.name
+    def gen_Ident(self, node): #返回标识符名字的驻留编号
+        return node.sym
 
     def gen_FuncCall(self, node): #递归生成函数名和参数表达式，生成调用四元组，结果存入临时变量
         args = []
@@ -279,5 +290,5 @@ class IRGenerator:
     def gen_MemberExpr(self, node: MemberExpr):
         base = self.generate(node.base)
         temp = self.new_temp()
-        self.code.append(('member_access', base, node.field, temp))
+        self.code.append(('member_access', base, str(node.field), temp))
         return temp
\ No newline at end of file
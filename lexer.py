@@ -1,3 +1,7 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum, auto
 
 class TokenKind(Enum):
@@ -9,26 +13,179 @@ class TokenKind(Enum):
     EOF     = auto()
     ERROR   = auto()
 
+_NEWLINE = re.compile('\n')
+
+class LineIndex:
+    """
+    行首偏移表：用二分查找把字符偏移换算成 (行, 列)，行列均从 1 开始。
+    由整段源码构造时，行首表推迟到第一次查询才建立；
+    流式分词时用空表构造，再随每个文本块 feed 进来。
+    编辑时不逐项平移编辑点之后的行首：_starts[_gap:] 存的是真实偏移减去 _shift，
+    下一次编辑只需把 _gap 挪到新的编辑点，代价与两次编辑之间的行数成正比。
+    """
+    def __init__(self, text=None):
+        self._text = text
+        self._starts = array('q', [0]) if text is None else None
+        self._gap = 0
+        self._shift = 0
+
+    def feed(self, chunk, base):
+        """登记从偏移 base 开始的文本块中的换行。"""
+        base -= self._shift
+        self._starts.extend(base + m.end() for m in _NEWLINE.finditer(chunk))
+
+    def _build(self):
+        starts = array('q', [0])
+        starts.extend(m.end() for m in _NEWLINE.finditer(self._text))
+        self._starts = starts
+        return starts
+
+    def _upper(self, starts, offset):
+        # 第一个真实偏移大于 offset 的行首下标；_gap 两侧各自有序，分别二分
+        gap, shift = self._gap, self._shift
+        if gap < len(starts) and offset >= starts[gap] + shift:
+            return bisect_right(starts, offset - shift, gap)
+        return bisect_right(starts, offset, 0, gap)
+
+    def _move_gap(self, starts, k):
+        gap, shift = self._gap, self._shift
+        if k > gap:
+            starts[gap:k] = array('q', (s + shift for s in starts[gap:k]))
+        elif k < gap:
+            starts[k:gap] = array('q', (s - shift for s in starts[k:gap]))
+        self._gap = k
+
+    def position(self, offset):
+        starts = self._starts
+        if starts is None:
+            starts = self._build()
+        gap, shift = self._gap, self._shift
+        if gap < len(starts) and offset >= starts[gap] + shift:
+            i = bisect_right(starts, offset - shift, gap) - 1
+            return i + 1, offset - shift - starts[i] + 1
+        i = bisect_right(starts, offset, 0, gap) - 1
+        return i + 1, offset - starts[i] + 1
+
+    def line_offset(self, line):
+        """第 line 行（从 1 开始）行首的偏移。"""
+        starts = self._starts
+        if starts is None:
+            starts = self._build()
+        i = line - 1
+        return starts[i] + self._shift if i >= self._gap else starts[i]
+
+    def edit(self, offset, deleted, inserted):
+        """源码在 offset 处删去 deleted 个字符并插入 inserted 后，就地修补行首表。"""
+        starts = self._starts
+        if starts is None:
+            starts = self._build()
+        lo = self._upper(starts, offset)
+        hi = self._upper(starts, offset + deleted)
+        self._move_gap(starts, hi)
+        patch = array('q', (offset + m.end() for m in _NEWLINE.finditer(inserted)))
+        starts[lo:hi] = patch
+        self._gap = lo + len(patch)
+        self._shift += len(inserted) - deleted
+
+    def __getstate__(self):
+        # 跨进程传递时只带行首表，不带整段源码
+        starts = self._starts
+        if starts is None:
+            starts = self._build()
+        self._move_gap(starts, len(starts))
+        self._gap = self._shift = 0
+        return starts
+
+    def __setstate__(self, starts):
+        self._text = None
+        self._starts = starts
+        self._gap = self._shift = 0
+
+class Interner:
+    """
+    全局字符串驻留表：文本 <-> 整数编号。标识符等在分词时登记，
+    之后的 AST、符号表和中间代码都只传递编号，显示时再换回文本。
+    登记过的条目永不释放：编号被这些结构长期引用，无法判断何时不再使用。
+    因此表的大小随进程内见过的不同词素数增长，而不是随当前源码大小增长——
+    GUI 每次按键都经 IncrementalLexer 重新分词，打字过程中的半截标识符也会留在表里，
+    每次按键至多新增几项，这点增长是有意接受的。
+    """
+    def __init__(self):
+        self.names = []     # 编号 -> 文本
+        self._ids = {}      # 文本 -> 编号
+
+    def intern(self, text):
+        sid = self._ids.get(text)
+        if sid is None:
+            sid = self._ids[text] = len(self.names)
+            self.names.append(text)
+        return sid
+
+    def name(self, sid):
+        return self.names[sid]
+
+    def __len__(self):
+        return len(self.names)
+
+SYMBOLS = Interner()
+symbol_id = SYMBOLS.intern
+symbol_name = SYMBOLS.name
+
 class Token:
-    def __init__(self, kind: TokenKind, value: str, line: int, col: int):
+    """
+    词法单元。只记录词素首字符的偏移 offset，line/col 在需要时
+    （报错、构造 AST 节点、显示）才通过 LineIndex 换算。
+    sym 是词素文本在 SYMBOLS 中的编号，value 是驻留后的同一个 str 对象。
+    term 是该词素对应的文法终结符编号（见 TERMINALS），解析器直接用它查 ACTION 表。
+    """
+    __slots__ = ('kind', 'value', 'sym', 'term', 'offset', 'lines')
+
+    def __init__(self, kind: TokenKind, value: str, offset: int, lines: LineIndex):
         self.kind = kind
-        self.value = value
-        self.line = line
-        self.col = col
+        self.sym = sym = symbol_id(value)
+        self.value = SYMBOLS.names[sym]
+        term = _KIND_TERMS.get(kind)
+        self.term = _SYM_TERMS.get(sym, UNKNOWN_TERM) if term is None else term
+        self.offset = offset
+        self.lines = lines
+
+    @property
+    def line(self):
+        return self.lines.position(self.offset)[0]
+
+    @property
+    def col(self):
+        return self.lines.position(self.offset)[1]
 
     def __repr__(self):
-        return f"{self.kind.name}({self.value!r})@{self.line}:{self.col}"
+        line, col = self.lines.position(self.offset)
+        return f"{self.kind.name}({self.value!r})@{line}:{col}"
+
+def _punct_table(ops, delims):
+    """
+    运算符/分隔符的首字符分派表：首字符 -> ((词素, 种类), ...)，
+    同一首字符下按长度从长到短排列，运算符排在分隔符前面，实现最长匹配。
+    """
+    table = {}
+    for text, kind in [(op, TokenKind.OP) for op in ops] + [(d, TokenKind.DELIM) for d in delims]:
+        table.setdefault(text[0], []).append((text, kind))
+    return {c: tuple(sorted(cands, key=lambda x: -len(x[0]))) for c, cands in table.items()}
 
 class Lexer:
     KEYWORDS = {'let','mut','if','else','while','return','fn','i32','for','in','loop','break','continue'}
     OPS = {'==','!=','>=','<=','->','..','+','-','*','/','>','<','=','.', '&'}
     DELIMS = {';', ',', ':', '(', ')', '{', '}', '[', ']'}
+    PUNCT = _punct_table(OPS, DELIMS)
+
+    def __init_subclass__(cls, **kwargs):
+        # 子类改写 OPS/DELIMS 时，分派表在类创建时重建一次
+        super().__init_subclass__(**kwargs)
+        cls.PUNCT = _punct_table(cls.OPS, cls.DELIMS)
 
     def __init__(self, source):
         self.source = source
         self.pos = 0
-        self.line = 1
-        self.col = 1
+        self.lines = LineIndex(source)
 
     def peek(self):
         return self.source[self.pos] if self.pos < len(self.source) else None
@@ -36,11 +193,6 @@ class Lexer:
     def advance(self):
         c = self.peek()
         self.pos += 1
-        if c == '\n':
-            self.line += 1
-            self.col = 1
-        else:
-            self.col += 1
         return c
 
     def match(self, s):
@@ -60,7 +212,7 @@ class Lexer:
                 return
 
     def lex_number(self):
-        start_line, start_col = self.line, self.col
+        start = self.pos
         num = ''
         if self.match('0x') or self.match('0X'):
             num += self.advance()  # 0
@@ -82,46 +234,459 @@ class Lexer:
                 num += self.advance()
         if self.peek() and (self.peek().isalpha() or self.peek() == '_'):
             num += self.advance()
-            return Token(TokenKind.ERROR, num, start_line, start_col)
-        return Token(TokenKind.NUMBER, num, start_line, start_col)
+            return Token(TokenKind.ERROR, num, start, self.lines)
+        return Token(TokenKind.NUMBER, num, start, self.lines)
 
     def next_token(self):
         self.skip_whitespace_and_comments()
         c = self.peek()
         if c is None:
-            return Token(TokenKind.EOF, '', self.line, self.col)
+            return Token(TokenKind.EOF, '', self.pos, self.lines)
 
-        start_line, start_col = self.line, self.col
+        start = self.pos
 
         if c.isalpha() or c == '_':
             ident = ''
             while self.peek() is not None and (self.peek().isalnum() or self.peek() == '_'):
                 ident += self.advance()
             kind = TokenKind.KEYWORD if ident in self.KEYWORDS else TokenKind.IDENT
-            return Token(kind, ident, start_line, start_col)
+            return Token(kind, ident, start, self.lines)
 
         if c.isdigit():
             return self.lex_number()
 
-        for op in sorted(self.OPS, key=lambda x: -len(x)):
-            if self.match(op):
-                for _ in op:
-                    self.advance()
-                return Token(TokenKind.OP, op, start_line, start_col)
+        for text, kind in self.PUNCT.get(c, ()):
+            if self.match(text):
+                # 运算符与分隔符都不含换行，直接前移
+                self.pos += len(text)
+                return Token(kind, text, start, self.lines)
 
-        if c in self.DELIMS:
-            return Token(TokenKind.DELIM, self.advance(), start_line, start_col)
+        return Token(TokenKind.ERROR, self.advance(), start, self.lines)
 
-        return Token(TokenKind.ERROR, self.advance(), start_line, start_col)
+def _master_pattern(ops, delims):
+    """
+    把所有词素拼成一条主正则；分组顺序即 Lexer.next_token 的判断顺序。
+    连续的空白和注释合并成一个 SKIP 匹配。
+    """
+    ops = sorted(ops, key=lambda x: -len(x))
+    return re.compile('|'.join([
+        r'(?P<SKIP>(?:\s|//[^\n]*)+)',
+        r'(?P<NUMBER>(?:0[xX][0-9a-fA-F]*|0[oO][0-7]*|0[bB][01]*|[0-9]+)(?P<BAD>[A-Za-z_])?)',
+        r'(?P<IDENT>[A-Za-z_]\w*)',
+        '(?P<OP>' + '|'.join(re.escape(op) for op in ops) + ')',
+        '(?P<DELIM>[' + ''.join(re.escape(d) for d in sorted(delims)) + '])',
+        r'(?P<OTHER>.)',
+    ]), re.DOTALL)
 
-def tokenize_file(path):
-    with open(path, encoding='utf-8') as f:
-        text = f.read()
-    lexer = Lexer(text)
+class RegexLexer:
+    """
+    单遍正则分词引擎：scan 在按块到达的文本上循环调用主正则的 PATTERN.match，
+    每次从当前位置切出一个词素，输出与 Lexer 完全相同的 Token 流
+    （含 12abc 之类的 ERROR 以及 0x/0o/0b 数字）。
+    一个词素若一直匹配到当前缓冲区末尾，就可能被下一块接长，因此先不产出，
+    留到下一块拼上后从它的起点重新匹配；只有最后一块之后才按原样切出。
+    正则只描述 ASCII 部分；遇到非 ASCII 字符可能改变词素边界时，
+    当前这个词素退回 Lexer 逐字符处理，保证 isalpha/isdigit 的语义一致。
+    """
+    KEYWORDS = Lexer.KEYWORDS
+    PATTERN = _master_pattern(Lexer.OPS, Lexer.DELIMS)
+
+    def __init__(self, source):
+        self.source = source
+        self.lines = LineIndex(source)
+        self._tokens = self.scan((source,), self.lines)
+        self._eof = None
+
+    def next_token(self):
+        if self._eof is None:
+            tok = next(self._tokens)
+            if tok.kind == TokenKind.EOF:
+                self._eof = tok
+            return tok
+        return self._eof
+
+    @staticmethod
+    def _slow_token(buf, pos):
+        lexer = Lexer(buf)
+        lexer.pos = pos
+        return lexer.next_token(), lexer.pos
+
+    @classmethod
+    def scan(cls, chunks, lines=None, begin=0):
+        """
+        在一串文本块上分词并逐个产出 Token，最后产出 EOF。
+        词素可能跨越块边界：凡是一直匹配到缓冲区末尾的词素（数字、标识符、
+        '=' 之后可能的 '='、注释……）都先留在缓冲区里，等下一块到齐后再切分。
+        保留的尾巴很长时（例如超长注释）会多攒几块再重扫，总开销保持线性。
+        lines 为 None 时新建一个 LineIndex，边读边登记各块中的换行。
+        begin 指定从第一块的哪个偏移开始分词（增量重新分词时使用）。
+        """
+        feed = lines is None
+        if feed:
+            lines = LineIndex()
+        keywords = cls.KEYWORDS
+        match = cls.PATTERN.match
+        buf, base = '', 0            # base: buf[0] 在整个输入中的偏移
+        pending = 0                  # 上次扫描留下的未完成尾巴长度
+        chunks = iter(chunks)
+        while True:
+            chunk = next(chunks, None)
+            final = chunk is None
+            if not final:
+                if feed:
+                    lines.feed(chunk, base + len(buf))
+                buf += chunk
+                if len(buf) < 2 * pending:
+                    continue
+            n = len(buf)
+            pos, begin = begin, 0
+            while pos < n:
+                m = match(buf, pos)
+                start, end = pos, m.end()
+                if end == n and not final:
+                    break
+                group = m.lastgroup
+                if group == 'SKIP':
+                    pos = end
+                    continue
+                value = m.group()
+                if group == 'IDENT':
+                    kind = TokenKind.KEYWORD if value in keywords else TokenKind.IDENT
+                elif group == 'OP':
+                    kind = TokenKind.OP
+                elif group == 'DELIM':
+                    kind = TokenKind.DELIM
+                elif group == 'NUMBER' and (m.group('BAD') is not None or end == n or buf[end] <= '\x7f'):
+                    kind = TokenKind.ERROR if m.group('BAD') is not None else TokenKind.NUMBER
+                elif group == 'OTHER' and value <= '\x7f':
+                    kind = TokenKind.ERROR
+                else:
+                    # 非 ASCII 字符可能改变词素边界（isalpha/isdigit），这一个词素交给 Lexer
+                    tok, end = cls._slow_token(buf, start)
+                    if end == n and not final:
+                        break
+                    tok.offset = base + start
+                    tok.lines = lines
+                    yield tok
+                    pos = end
+                    continue
+                yield Token(kind, value, base + start, lines)
+                pos = end
+            if final:
+                break
+            buf = buf[pos:]
+            base += pos
+            pending = len(buf)
+        yield Token(TokenKind.EOF, '', base + len(buf), lines)
+
+ENGINES = {'scan': Lexer, 'regex': RegexLexer}
+DEFAULT_ENGINE = 'regex'
+
+# 文法终结符的编号：全部关键字、运算符、分隔符再加上 IDENT、NUMBER 和 '$'，按文本排序，
+# 与 grammar.Grammar.term_names、解析表 PackedTables.terminals 的编号相同（LR1Parser 加载表时核对）。
+# 标识符、数字、EOF 按种类归到 IDENT/NUMBER/'$'，其余词素按文本；不是终结符的词素编号为 UNKNOWN_TERM。
+TERMINALS = sorted(Lexer.KEYWORDS | Lexer.OPS | Lexer.DELIMS | {'IDENT', 'NUMBER', '$'})
+UNKNOWN_TERM = len(TERMINALS)
+_KIND_TERMS = {TokenKind.IDENT: TERMINALS.index('IDENT'),
+               TokenKind.NUMBER: TERMINALS.index('NUMBER'),
+               TokenKind.EOF: TERMINALS.index('$')}
+_SYM_TERMS = {symbol_id(t): i for i, t in enumerate(TERMINALS) if t not in ('IDENT', 'NUMBER', '$')}
+
+def terminal_name(tok):
+    """token 作为向前看符号时的终结符名字（报错用）。"""
+    if tok.kind == TokenKind.IDENT:
+        return 'IDENT'
+    if tok.kind == TokenKind.NUMBER:
+        return 'NUMBER'
+    return tok.value if tok.value != '' else '$'
+
+def tokenize(text, engine=DEFAULT_ENGINE):
+    """对一段源码分词，返回以 EOF 结尾的 Token 列表。engine 取 'regex' 或 'scan'。"""
+    lexer = ENGINES[engine](text)
     tokens = []
     while True:
         tok = lexer.next_token()
         tokens.append(tok)
         if tok.kind == TokenKind.EOF:
             break
-    return tokens
\ No newline at end of file
+    return tokens
+
+def tokenize_file(path, engine=DEFAULT_ENGINE):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    return tokenize(text, engine)
+
+CHUNK_SIZE = 1 << 16
+
+def iter_tokens(path, chunk_size=CHUNK_SIZE):
+    """
+    惰性分词：按 chunk_size 个字符分块读取文件，边读边产出 Token，最后产出 EOF。
+    内存占用只取决于块大小，不随文件大小增长。
+    """
+    with open(path, encoding='utf-8') as f:
+        yield from RegexLexer.scan(iter(lambda: f.read(chunk_size), ''))
+
+_KIND_BY_VALUE = {k.value: k for k in TokenKind}
+
+class TokenView(Token):
+    """TokenBuffer 中第 i 个 token 的只读视图，接口与 Token 相同，按需从各列取值。"""
+    __slots__ = ('_buf', '_i')
+
+    def __init__(self, buf, i):
+        self._buf = buf
+        self._i = i
+
+    @property
+    def kind(self):
+        return _KIND_BY_VALUE[self._buf.kinds[self._i]]
+
+    @property
+    def value(self):
+        return SYMBOLS.names[self._buf.value_ids[self._i]]
+
+    @property
+    def sym(self):
+        return self._buf.value_ids[self._i]
+
+    @property
+    def term(self):
+        term = _KIND_TERMS.get(self.kind)
+        return _SYM_TERMS.get(self.sym, UNKNOWN_TERM) if term is None else term
+
+    @property
+    def lines(self):
+        return self._buf.lines
+
+    @property
+    def offset(self):
+        return self._buf.starts[self._i]
+
+    @property
+    def end(self):
+        return self._buf.ends[self._i]
+
+class TokenBuffer:
+    """
+    列式（struct-of-arrays）的 token 序列：kind、起止偏移、值编号各占一列 array，
+    值编号即 SYMBOLS 中的驻留编号，行列号由共享的 LineIndex 按需换算。
+    下标访问返回 TokenView，可直接交给 LR1Parser.parse。
+    """
+    def __init__(self):
+        self.kinds = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.value_ids = array('I')
+        self.lines = None       # 源码的 LineIndex，取自第一个 token
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        buf = cls()
+        buf.extend(tokens)
+        return buf
+
+    @classmethod
+    def from_source(cls, text):
+        return cls.from_tokens(RegexLexer.scan((text,)))
+
+    @classmethod
+    def from_file(cls, path, chunk_size=CHUNK_SIZE):
+        return cls.from_tokens(iter_tokens(path, chunk_size))
+
+    def append(self, tok):
+        self.kinds.append(tok.kind.value)
+        self.starts.append(tok.offset)
+        self.ends.append(tok.offset + len(tok.value))
+        self.value_ids.append(tok.sym)
+        if self.lines is None:
+            self.lines = tok.lines
+
+    def extend(self, tokens):
+        for tok in tokens:
+            self.append(tok)
+
+    def nbytes(self):
+        """各列 array 占用的字节数（不含驻留表中的字符串）。"""
+        cols = (self.kinds, self.starts, self.ends, self.value_ids)
+        return sum(c.itemsize * len(c) for c in cols)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [TokenView(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('TokenBuffer index out of range')
+        return TokenView(self, i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield TokenView(self, i)
+
+    def __getstate__(self):
+        # 驻留编号只在本进程内有效：改写成局部编号，并附上用到的文本
+        local = {}
+        value_ids = array('I', (local.setdefault(v, len(local)) for v in self.value_ids))
+        names = [SYMBOLS.names[v] for v in local]
+        return self.kinds, self.starts, self.ends, value_ids, names, self.lines
+
+    def __setstate__(self, state):
+        self.kinds, self.starts, self.ends, value_ids, names, self.lines = state
+        ids = [SYMBOLS.intern(n) for n in names]
+        self.value_ids = array('I', map(ids.__getitem__, value_ids))
+
+def _tokenize_buffer(path):
+    with open(path, encoding='utf-8') as f:
+        return TokenBuffer.from_source(f.read())
+
+def tokenize_files(paths, workers=None, chunksize=1):
+    """
+    批量分词：把文件分派到 workers 个进程（None 为 CPU 核数），按输入顺序返回 TokenBuffer 列表。
+    结果以列式 array 加局部字符串表的形式回传，避免逐个序列化 Token 对象。
+    chunksize 为每次派给一个进程的文件数，小文件很多时调大可以减少进程间往返。
+    workers=1 时直接在本进程内完成，不启动进程池。
+    """
+    if workers == 1:
+        return [_tokenize_buffer(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_tokenize_buffer, paths, chunksize=chunksize))
+
+def _token_start(tok):
+    return tok.offset
+
+def _token_end(tok):
+    return tok.offset + len(tok.value)
+
+_PROBE = 64             # 求公共前后缀时第一块比较的字符数
+_PROBE_MAX = 1 << 16    # 逐次翻倍的上限
+
+def _common_run(a, b, limit, tail=False):
+    """
+    a、b 开头（tail 为真时为结尾）相同部分的长度，不超过 limit。
+    先用逐次翻倍的块顺着比较下去，遇到第一个不同的块再在块内折半定位，
+    每个字符只被复制比较常数次。
+    """
+    if tail:
+        la, lb = len(a), len(b)
+        seg_a = lambda i, k: a[la - k:la - i]
+        seg_b = lambda i, k: b[lb - k:lb - i]
+    else:
+        seg_a = lambda i, k: a[i:k]
+        seg_b = lambda i, k: b[i:k]
+    i, step = 0, _PROBE
+    while True:
+        k = min(i + step, limit)
+        if seg_a(i, k) != seg_b(i, k):
+            break
+        if k == limit:
+            return limit
+        i, step = k, min(step * 2, _PROBE_MAX)
+    while k - i > 1:        # 第一个不同的字符落在 [i, k) 里
+        mid = (i + k) // 2
+        if seg_a(i, mid) == seg_b(i, mid):
+            i = mid
+        else:
+            k = mid
+    return i
+
+class IncrementalLexer:
+    """
+    增量分词：保存当前源码及其 token 列表（以 EOF 结尾）。
+    edit() 只从编辑点之前最近的安全重启点开始重新分词——即最后一个在编辑点之前
+    就已结束的 token 的末尾，它的边界不受编辑影响；一旦某个新 token 与编辑点之后的
+    旧 token 落在同一位置，剩余 token 流必然相同，可以原样复用。
+    复用的 token 不逐个平移偏移：和 LineIndex 一样，_tokens[_gap:] 的 offset
+    存的是真实偏移减去 _shift，只在 tokens / tokens_between 交出去之前才补上。
+    """
+    def __init__(self, source):
+        self.source = source
+        self.lines = LineIndex(source)
+        self._tokens = list(RegexLexer.scan((source,), self.lines))
+        self._gap = 0
+        self._shift = 0
+
+    @property
+    def tokens(self):
+        """
+        完整的 token 列表，偏移均已是真实值。
+        列表和其中的 Token 都归本对象所有，只在下一次 edit()/update() 之前有效：
+        编辑会就地替换列表片段、改写后面 token 的 offset，之前拿到的 token 再读
+        line/col 会得到错误的位置。需要跨编辑保留位置的调用方应当及时自行换算保存。
+        """
+        self._move_gap(len(self._tokens))
+        return self._tokens
+
+    def _move_gap(self, k):
+        toks, gap, shift = self._tokens, self._gap, self._shift
+        if k > gap:
+            for n in range(gap, k):
+                toks[n].offset += shift
+        elif k < gap:
+            for n in range(k, gap):
+                toks[n].offset -= shift
+        self._gap = k
+
+    def _search(self, offset, key):
+        # 第一个 key(真实位置) >= offset 的 token 下标；_gap 两侧各自有序，分别二分
+        toks, gap = self._tokens, self._gap
+        if gap and key(toks[gap - 1]) >= offset:
+            return bisect_left(toks, offset, 0, gap, key=key)
+        return bisect_left(toks, offset - self._shift, gap, key=key)
+
+    def edit(self, offset, deleted, inserted):
+        """
+        在 offset 处删去 deleted 个字符并插入 inserted，更新 token 列表。
+        返回新源码中被重新分词的区间 (lo, hi)。
+        """
+        src = self.source[:offset] + inserted + self.source[offset + deleted:]
+        return self._relex(src, offset, deleted, inserted)
+
+    def _relex(self, src, offset, deleted, inserted):
+        # src 是编辑后的完整源码，已由调用方拼好
+        delta = len(inserted) - deleted
+        self.source = src
+        self.lines.edit(offset, deleted, inserted)
+
+        i = self._search(offset, _token_end)
+        self._move_gap(i)
+        old, shift = self._tokens, self._shift
+        restart = _token_end(old[i - 1]) if i else 0
+        stable = offset + len(inserted)     # 新源码中从这里往后与旧源码一致
+        j = i
+        fresh = []
+        for tok in RegexLexer.scan((src,), self.lines, restart):
+            if tok.offset >= stable:
+                target = tok.offset - delta - shift
+                while old[j].offset < target:
+                    j += 1
+                if old[j].offset == target:
+                    break
+            fresh.append(tok)
+        old[i:j] = fresh
+        self._gap = i + len(fresh)
+        self._shift = shift + delta
+        hi = _token_end(fresh[-1]) if fresh else restart
+        return restart, max(hi, stable)
+
+    def update(self, source):
+        """
+        把源码整体替换为 source：先求出新旧文本之间的单处差异，再交给 edit()。
+        内容没有变化时返回 None。
+        """
+        old = self.source
+        if old == source:
+            return None
+        n = min(len(old), len(source))
+        prefix = _common_run(old, source, n)
+        suffix = _common_run(old, source, n - prefix, tail=True)   # 不与前缀重叠
+        return self._relex(source, prefix, len(old) - prefix - suffix, source[prefix:len(source) - suffix])
+
+    def tokens_between(self, lo, hi):
+        """起始偏移落在 [lo, hi) 内的 token，同样只在下一次编辑之前有效（见 tokens）。"""
+        i = self._search(lo, _token_start)
+        j = self._search(hi, _token_start)
+        if j > self._gap:
+            self._move_gap(j)
+        return self._tokens[i:j]
@@ -1,525 +1,565 @@
 # lr1_parser.py
 
 import os
-import pickle
 import sys
-from lexer import tokenize_file, TokenKind, Token
+from array import array
+from lexer import tokenize_file, iter_tokens, CHUNK_SIZE, TERMINALS, Token, symbol_id, terminal_name
 from ast_nodes import *
+from packed_tables import load_tables
 os.environ["PATH"] += os.pathsep + r"C:\Program Files\Graphviz\bin"
 
-PARSE_TABLE_FILE = 'parse_tables.pkl'
+PARSE_TABLE_FILE = 'parse_tables.bin'
+
+_compiled_parsers = {}  # 表的 digest -> 与之一致的生成解析器模块（或 None）
+
+def compiled_parser(tables):
+    """
+    generate_parse_tables.py --codegen 生成的独立解析器模块 _parser_tables，
+    仅当它是由与 tables 内容完全相同的表生成时才返回，否则返回 None 并卸载该模块。
+    """
+    digest = tables.digest()
+    if digest not in _compiled_parsers:
+        try:
+            import _parser_tables
+        except ImportError:
+            _parser_tables = None
+        if _parser_tables is not None and _parser_tables.FINGERPRINT != digest:
+            sys.modules.pop('_parser_tables', None)     # 过期的模块不留在内存里
+            _parser_tables = None
+        _compiled_parsers[digest] = _parser_tables
+    return _compiled_parsers[digest]
+
+
+# ─────────── 归约动作 ────────────
+# NODE_BUILDERS[(lhs, rhs)] 是产生式 lhs → rhs 的语义动作 fn(children)，
+# children 按产生式右部的顺序排列。没有登记的产生式使用 _default_node。
+# LR1Parser 加载解析表时按产生式编号把它们绑定成列表，归约时直接下标取用。
+NODE_BUILDERS = {}
+
+def reduces(*prods):
+    """登记语义动作的装饰器，参数形如 'Stmt → break ;'，右部为空写 'ε'。"""
+    def register(fn):
+        for text in prods:
+            lhs, rhs = text.split('→')
+            rhs = tuple(s for s in rhs.split() if s != 'ε')
+            NODE_BUILDERS[(lhs.strip(), rhs)] = fn
+        return fn
+    return register
+
+def builders_for(productions):
+    """按产生式编号排列的语义动作列表。"""
+    return [NODE_BUILDERS.get((p.lhs, tuple(p.rhs)), _default_node) for p in productions]
+
+def _at(tok):
+    """token 所在的 (行, 列)。分别读 tok.line、tok.col 会各做一次 LineIndex 二分，这里只做一次。"""
+    return tok.lines.position(tok.offset)
+
+def _default_node(children):
+    # 单个子节点的产生式（如 Expr → SelectExpr、Primary → FuncExprBlock）直接上传子节点
+    if not children:
+        return None
+    last = children[-1]
+    if isinstance(last, Expr):
+        return last
+    while isinstance(last, ExprStmt):
+        last = last.expr
+    if isinstance(last, Token):
+        return Ident(last.sym, children[0].line, children[0].col)
+    return last
+
+@reduces('Decl → FnDecl', 'Expr → AddExpr', 'AddExpr → MulExpr', 'MulExpr → Primary',
+         'Primary → Assignable', 'Iterable → Expr')
+def _pass_first(children):
+    return children[0]
+
+class _RevList(list):
+    """
+    右递归序列（StmtList → Stmt StmtList 等）归约过程中的中间值。右递归总是先归约最后一项，
+    所以元素按逆序存放：每次归约只在末尾追加新的第一项，均摊 O(1)，
+    整个序列的构造是 O(n)。使用该序列的产生式用 _finish 一次性翻转成普通 list。
+    """
+    __slots__ = ()
+
+def _finish(rev, *head):
+    """head 后面接上逆序存放的 rev，得到按源码顺序排列的普通 list。"""
+    out = list(head)
+    out.extend(reversed(rev))
+    return out
+
+@reduces('StmtList → ε', 'DeclList → ε', 'ParamList → ε', 'ArgList → ε', 'ExprList → ε')
+def _empty_list(children):
+    return _RevList()
+
+@reduces('StmtList → Stmt', 'ParamList → Param', 'ArgList → Expr', 'FuncStmtList → Stmt',
+         'FuncStmtList → Expr', 'ExprList → Expr', 'TypeList → Type')
+def _single_list(children):
+    return _RevList(children[:1])
+
+# X → Y X 与 X → Y , X：Y 是序列的第一项，逆序存放时追加在末尾
+@reduces('StmtList → Stmt StmtList', 'DeclList → Decl DeclList', 'FuncStmtList → Stmt FuncStmtList')
+def _cons_list(children):
+    rest = children[1]
+    rest.append(children[0])
+    return rest
+
+@reduces('ParamList → Param , ParamList', 'ArgList → Expr , ArgList',
+         'ExprList → Expr , ExprList', 'TypeList → Type , TypeList')
+def _cons_sep_list(children):
+    rest = children[2]
+    rest.append(children[0])
+    return rest
+
+# ① 程序与函数 ----------------------------------------------------------
+@reduces('Program → DeclList')
+def _program(children):
+    decls = _finish(children[0])
+    first_decl = decls[0] if isinstance(decls, list) and decls else None
+    line = first_decl.line if first_decl else 1
+    col = first_decl.col if first_decl else 1
+    return Program(decls, line, col)
+
+@reduces('FnDecl → FnHead Block', 'FnDecl → FnHead FuncExprBlock')
+def _fn_decl(children):
+    name, params, ret, line, col = children[0]
+    return FuncDecl(symbol_id(name), params, ret, children[1], line, col)
+
+@reduces('FnHead → fn IDENT ( ParamList ) -> Type')
+def _fn_head_ret(children):
+    return (children[1].value, _finish(children[3]), children[6], *_at(children[0]))
+
+@reduces('FnHead → fn IDENT ( ParamList )')
+def _fn_head(children):
+    return (children[1].value, _finish(children[3]), None, *_at(children[0]))
+
+@reduces('Param → VariableInternal : Type')
+def _param(children):
+    var, typ = children[0], children[2]
+    return Param(var.sym, var.mutable, typ, children[0].line, children[0].col)
+
+@reduces('VariableInternal → mut IDENT')
+def _var_mut(children):
+    return VarBinding(children[1].sym, True, *_at(children[0]))
+
+@reduces('VariableInternal → IDENT')
+def _var(children):
+    return VarBinding(children[0].sym, False, *_at(children[0]))
+
+# ② 语句块 ----------------------------------------------------------
+@reduces('Block → { }')
+def _block_empty(children):
+    return Block([], *_at(children[0]))
+
+@reduces('Block → { Stmt StmtList }')
+def _block(children):
+    return Block(_finish(children[2], children[1]), *_at(children[0]))
+
+@reduces('FuncExprBlock → { FuncStmtList }')
+def _func_expr_block(children):
+    stmts = children[1]
+    if not isinstance(stmts, list):
+        stmts = [ExprStmt(stmts, stmts.line, stmts.col)]
+    return Block(_finish(stmts), *_at(children[0]))
+
+# ③ 语句 ----------------------------------------------------------
+@reduces('Stmt → ;')
+def _empty_stmt(children):
+    return EmptyStmt()
+
+@reduces('Stmt → Expr ;')
+def _expr_stmt(children):
+    return ExprStmt(children[0], children[0].line, children[0].col)
+
+@reduces('Stmt → return ;')
+def _return_none(children):
+    return ReturnStmt(None, *_at(children[0]))
+
+@reduces('Stmt → return Expr ;')
+def _return(children):
+    return ReturnStmt(children[1], *_at(children[0]))
+
+@reduces('Stmt → break ;')
+def _break_none(children):
+    return BreakStmt(None, *_at(children[0]))
+
+@reduces('Stmt → break Expr ;')
+def _break(children):
+    return BreakStmt(children[1], *_at(children[0]))
+
+@reduces('Stmt → continue ;')
+def _continue(children):
+    return ContinueStmt(*_at(children[0]))
+
+def _unwrap(expr):
+    return expr.expr if isinstance(expr, ExprStmt) else expr
+
+@reduces('Stmt → let VariableInternal = Expr ;')
+def _let_init(children):
+    var = children[1]
+    return VarDecl(var.sym, var.mutable, None, _unwrap(children[3]), *_at(children[0]))
+
+@reduces('Stmt → let VariableInternal : Type = Expr ;')
+def _let_typed_init(children):
+    var = children[1]
+    return VarDecl(var.sym, var.mutable, children[3], _unwrap(children[5]), *_at(children[0]))
+
+@reduces('Stmt → let VariableInternal : Type ;')
+def _let_typed(children):
+    var = children[1]
+    return VarDecl(var.sym, var.mutable, children[3], None, *_at(children[0]))
+
+@reduces('Stmt → let VariableInternal ;')
+def _let(children):
+    var = children[1]
+    return VarDecl(var.sym, var.mutable, None, None, *_at(children[0]))
+
+@reduces('Stmt → Assignable = Expr ;')
+def _assign(children):
+    return AssignStmt(_unwrap(children[0]), _unwrap(children[2]), children[0].line, children[0].col)
+
+@reduces('Stmt → if Expr Block ElsePart')
+def _if(children):
+    return IfStmt(children[1], children[2], children[3], *_at(children[0]))
+
+@reduces('ElsePart → ε')
+def _no_else(children):
+    return None
+
+@reduces('ElsePart → else Block')
+def _else(children):
+    return children[1]
+
+@reduces('ElsePart → else if Expr Block ElsePart')
+def _else_if(children):
+    return IfStmt(children[2], children[3], children[4], *_at(children[1]))
+
+@reduces('Stmt → while Expr Block')
+def _while(children):
+    return WhileStmt(children[1], children[2], *_at(children[0]))
+
+@reduces('Stmt → for VariableInternal in Iterable Block')
+def _for(children):
+    var, iterable, body_blk = children[1], children[3], children[4]
+    # range 形式由 Iterable → Expr .. Expr 构造；否则直接留给语义检查处理
+    if isinstance(iterable, tuple) and iterable[0] == 'range':
+        return ForStmt(var.sym, var.mutable, iterable[1], iterable[2], body_blk, *_at(children[0]))
+    return ForStmt(var.sym, var.mutable, iterable, None, body_blk, *_at(children[0]))
+
+@reduces('Iterable → Expr .. Expr')
+def _range(children):
+    return ('range', children[0], children[2])
+
+@reduces('Stmt → loop Block')
+def _loop(children):
+    return LoopStmt(children[1], *_at(children[0]))
+
+# ④ 表达式 ----------------------------------------------------------
+@reduces(*(f'Expr → Expr {op} Expr' for op in ('==', '!=', '<', '<=', '>', '>=')),
+         'AddExpr → AddExpr + MulExpr', 'AddExpr → AddExpr - MulExpr',
+         'MulExpr → MulExpr * Primary', 'MulExpr → MulExpr / Primary')
+def _binary(children):
+    return BinaryOp(children[1].value, children[0], children[2], children[0].line, children[0].col)
+
+@reduces('SelectExpr → if Expr FuncExprBlock else FuncExprBlock')
+def _select(children):
+    return IfStmt(children[1], children[2], children[4], *_at(children[0]))  # 复用现有 IfStmt AST
+
+@reduces('LoopExpr → loop FuncExprBlock')
+def _loop_expr(children):
+    return LoopStmt(children[1], *_at(children[0]))
+
+@reduces('Primary → IDENT ( ArgList )')
+def _call(children):
+    args = _finish(children[2]) if children[2] is not None else []
+    line, col = _at(children[0])
+    return FuncCall(Ident(children[0].sym, line, col), args, line, col)
+
+@reduces('Primary → ( Expr )')
+def _paren(children):
+    return children[1]
+
+@reduces('Primary → NUMBER')
+def _number(children):
+    return NumberLit(int(children[0].value, 0), *_at(children[0]))
+
+@reduces('Primary → IDENT', 'Assignable → IDENT')
+def _ident(children):
+    return Ident(children[0].sym, *_at(children[0]))
+
+@reduces('Primary → * Primary', 'Assignable → * Primary')
+def _deref(children):
+    return DerefExpr(children[1], *_at(children[0]))
+
+@reduces('Primary → & Primary')
+def _borrow(children):
+    return BorrowExpr(children[1], False, *_at(children[0]))
+
+@reduces('Primary → & mut Primary')
+def _borrow_mut(children):
+    return BorrowExpr(children[2], True, *_at(children[0]))
+
+@reduces('Primary → [ ExprList ]')
+def _array(children):
+    return ArrayLiteral(_finish(children[1]), *_at(children[0]))
+
+@reduces('Primary → ( )', 'Type → ( )')
+def _unit(children):
+    return TupleLiteral([], *_at(children[0]))
+
+@reduces('Primary → ( Expr , )', 'Type → ( Type , )')
+def _tuple1(children):
+    return TupleLiteral([children[1]], *_at(children[0]))
+
+@reduces('Primary → ( Expr , ExprList )')
+def _tuple(children):
+    return TupleLiteral(_finish(children[3], children[1]), *_at(children[0]))
+
+@reduces('Assignable → Primary [ Expr ]')
+def _index(children):
+    return IndexExpr(children[0], children[2], children[0].line, children[0].col)
+
+@reduces('Assignable → Primary . NUMBER')
+def _member(children):
+    return MemberExpr(children[0], int(children[2].value, 0), children[0].line, children[0].col)
+
+# ⑤ 类型（用字符串或元组表示） ------------------------------------------
+@reduces('Type → i32')
+def _i32(children):
+    return 'i32'
+
+@reduces('Type → & Type')
+def _ref_type(children):
+    return ('&', children[1])
+
+@reduces('Type → & mut Type')
+def _ref_mut_type(children):
+    return ('&mut', children[2])
+
+@reduces('Type → [ Type ; NUMBER ]')
+def _array_type(children):
+    return ('array', children[1], int(children[3].value, 0))
+
+@reduces('Type → ( TypeList )')
+def _tuple_type(children):
+    return TupleLiteral(_finish(children[1]), *_at(children[0]))
+
+
+# ─────────── 解析过程记录 ────────────
+def _symbol_repr(s, length=-1):
+    """符号栈中一项的显示文本；length >= 0 时 s 是当时只有前 length 项的 _RevList。"""
+    if isinstance(s, Token):
+        return f"{s.kind.name}({s.value})"
+    elif isinstance(s, ASTNode):
+        return s.__class__.__name__
+    elif isinstance(s, tuple):
+        return f"tuple({', '.join(str(x) for x in s)})"
+    elif length >= 0:
+        return str(s[length - 1::-1] if length else [])
+    else:
+        return str(s)
+
+class ParseTrace:
+    """
+    LR1Parser.parse 的增量记录，用作 trace_output。每一步只记三个整数：动作（与解析表相同的编码，
+    j+1 移进到状态 j，-(p+1) 按产生式 p 归约，-1 接受）、当时的 token 下标、压入的状态；
+    归约另外保存得到的语义值（只是引用，与 AST 共享）。
+    完整的一行 {'state', 'symbol', 'input', 'action'} 在取用时从头重放状态栈和符号栈得到。
+    stream 为打开的文本文件时，每一步同时写出一行 "动作<TAB>token 下标<TAB>压入的状态"。
+    """
+    def __init__(self, tokens, productions, stream=None):
+        self.tokens = tokens
+        self.productions = productions
+        self.stream = stream
+        self.actions = array('i')
+        self.positions = array('i')
+        self.targets = array('i')
+        self.values = []            # 各次归约的语义值
+        self.lengths = array('i')   # 语义值为 _RevList 时记下它当时的长度，否则为 -1
+
+    def __len__(self):
+        return len(self.actions)
+
+    def record(self, act, idx, target, value=None):
+        self.actions.append(act)
+        self.positions.append(idx)
+        self.targets.append(target)
+        if act < -1:
+            self.values.append(value)
+            self.lengths.append(len(value) if isinstance(value, _RevList) else -1)
+        if self.stream is not None:
+            self.stream.write(f"{self.describe(act)}\t{idx}\t{target}\n")
+
+    def describe(self, act):
+        """动作列的文本"""
+        if act > 0:
+            return f'shift {act - 1}'
+        if act == -1:
+            return 'accept'
+        prod = self.productions[-act - 1]
+        return f"reduce {prod.lhs} → {' '.join(prod.rhs) if prod.rhs else 'ε'}"
+
+    def iter_rows(self, start=0, stop=None, max_input=None, symbols=True):
+        """
+        按顺序重放，产出第 start 到 stop 步（执行该步之前）的行。
+        max_input 限制输入串列最多列出的 token 数，多出的部分用 '…' 表示；
+        symbols 为假时不渲染符号栈（该列为空列表）。
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        tokens = self.tokens
+        states, syms = [0], []
+        nreduce = 0
+        for k in range(stop):
+            act, idx = self.actions[k], self.positions[k]
+            if k >= start:
+                if act == -1:
+                    rest = []
+                else:
+                    end = len(tokens) if max_input is None else min(len(tokens), idx + max_input)
+                    rest = [str(tokens[i].value) for i in range(idx, end)]
+                    if end < len(tokens):
+                        rest.append('…')
+                yield {
+                    'state': list(states),
+                    'symbol': [_symbol_repr(*s) for s in syms] if symbols else [],
+                    'input': rest,
+                    'action': self.describe(act),
+                }
+            if act > 0:
+                syms.append((tokens[idx],))
+            elif act < -1:
+                n = len(self.productions[-act - 1].rhs)
+                if n:
+                    del states[-n:]
+                    del syms[-n:]
+                syms.append((self.values[nreduce], self.lengths[nreduce]))
+                nreduce += 1
+            else:
+                continue
+            states.append(self.targets[k])
+
+    def __iter__(self):
+        return self.iter_rows()
+
+    def __getitem__(self, k):
+        """第 k 步的完整一行，需要从头重放，O(k)。"""
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(k)
+        return next(self.iter_rows(k, k + 1))
 
 
 class LR1Parser:
     def __init__(self):
-        # 尝试加载离线生成的解析表
-        if os.path.exists(PARSE_TABLE_FILE):
-            with open(PARSE_TABLE_FILE, 'rb') as f:
-                G, ACTION, GOTO = pickle.load(f)
-        else:
-            # 动态构建并保存
-            from grammar import build_grammar, build_lr1_states, build_parse_table
-            G = build_grammar()
-            C, first = build_lr1_states(G)
-            ACTION, GOTO = build_parse_table(C, G, first)
-            with open(PARSE_TABLE_FILE, 'wb') as f:
-                pickle.dump((G, ACTION, GOTO), f)
-
-        self.grammar = G
-        self.ACTION  = ACTION
-        self.GOTO    = GOTO
+        # 优先使用离线生成的解析表；与当前文法不符时改用（或重建）用户缓存中的表
+        tables = load_tables(PARSE_TABLE_FILE)
+        self.tables = tables
+        self.productions = tables.productions
+        # 分词时打上的终结符编号 token.term 与解析表的编号一致时，直接用它查表；
+        # 否则（文法的终结符与词法分析器的词素表不一致）每一步按 token 文本查 term_ids
+        self.tagged = list(tables.terminals) == TERMINALS
+        # 生成的解析器模块与这份表一致时，不需要跟踪输出的解析都交给它
+        self.compiled = compiled_parser(tables) if self.tagged else None
+        self.builders = builders_for(self.productions)
 
     def parse(self, tokens, trace_output=None):
-        def _symbol_repr(s):
-            # print(f"type: {type(s)}, isinstance(s, ASTNode): {isinstance(s, ASTNode)}")
-            if isinstance(s, Token):
-                return f"{s.kind.name}({s.value})"
-            elif isinstance(s, ASTNode):
-                return s.__class__.__name__
-            elif isinstance(s, tuple):
-                return f"tuple({', '.join(str(x) for x in s)})"
-            else:
-                return str(s)
+        """
+        解析以 EOF 结尾的 token 序列，返回 AST。不需要跟踪输出时 tokens 可以是任意迭代器：
+        解析器只向前看一个 token，已移进并归约掉的 token 随即释放。
+        trace_output 为 list（追加完整的行）或 ParseTrace，此时 tokens 须支持下标访问。
+        """
+        if trace_output is None and self.compiled is not None:
+            try:
+                return self.compiled.parse(tokens, self.builders)
+            except StopIteration:
+                raise SyntaxError("Unexpected end of input: token stream ended without EOF") from None
+        if isinstance(trace_output, list):
+            # 兼容旧接口：先增量记录，结束（包括出错）时再展开成完整的行
+            trace = ParseTrace(tokens, self.productions)
+            try:
+                return self.parse(tokens, trace)
+            finally:
+                trace_output.extend(trace)
+        trace = trace_output
+
+        T = self.tables
+        term_ids, prods, builders = T.term_ids, self.productions, self.builders
+        arow, abase, acheck, avalue = T.action_row, T.action_base, T.action_check, T.action_value
+        grow, gbase, gcheck, gvalue = T.goto_row, T.goto_base, T.goto_check, T.goto_value
+        prod_lhs, prod_len = T.prod_lhs, T.prod_len
+        default_action = T.default_action
+        tagged, nterm = self.tagged, len(T.terminals)
 
         state_stack = [0]
         symbol_stack = []
+        it = iter(tokens)
+        tok = next(it, None)
         idx = 0
 
         while True:
             state = state_stack[-1]
-            tok = tokens[idx]
-
-            if tok.kind == TokenKind.IDENT:
-                look = 'IDENT'
-            elif tok.kind == TokenKind.NUMBER:
-                look = 'NUMBER'
-            else:
-                look = tok.value if tok.value != '' else '$'
-
-            action = self.ACTION[state].get(look)
-            if action is None:
-                raise SyntaxError(f"Unexpected token {tok!r} (lookahead={look}) in state {state}")
-
-            cmd, arg = action
-
-            if cmd == 'shift':
-                if trace_output is not None:
-                    trace_output.append({
-                        'state': list(state_stack),
-                        'symbol': [_symbol_repr(s) for s in symbol_stack],
-                        'input': [str(t.value) for t in tokens[idx:]],
-                        'action': f'shift {arg}'
-                    })
+            if tok is None:
+                raise SyntaxError("Unexpected end of input: token stream ended without EOF")
+
+            # 默认归约不看向前看符号
+            act = default_action[state]
+            if act == 0:
+                t = tok.term if tagged else term_ids.get(terminal_name(tok), nterm)
+                if t < nterm:
+                    r = arow[state]
+                    i = abase[r] + t
+                    if acheck[i] == r:
+                        act = avalue[i]
+                if act == 0:
+                    raise SyntaxError(f"Unexpected token {tok!r} (lookahead={terminal_name(tok)}) in state {state}")
+
+            if act > 0:
+                arg = act - 1
+                if trace is not None:
+                    trace.record(act, idx, arg)
                 state_stack.append(arg)
                 symbol_stack.append(tok)
+                tok = next(it, None)
                 idx += 1
 
-            elif cmd == 'reduce':
-                prod = arg
-                if trace_output is not None:
-                    rhs_str = ' '.join(prod.rhs) if prod.rhs else 'ε'
-                    trace_output.append({
-                        'state': list(state_stack),
-                        'symbol': [_symbol_repr(s) for s in symbol_stack],
-                        'input': [str(t.value) for t in tokens[idx:]],
-                        'action': f'reduce {prod.lhs} → {rhs_str}'
-                    })
-
-                n = len(prod.rhs)
+            elif act != -1:
+                p = -act - 1
+                prod = prods[p]
+                n = prod_len[p]
+                A = prod_lhs[p]
 
                 if n == 0:
-                    goto_state = self.GOTO[state_stack[-1]].get(prod.lhs)
+                    goto_state = T.goto(state_stack[-1], A)
                     if goto_state == state_stack[-1]:
                         raise RuntimeError(
-                            f"infinite ε‑reduce on {prod} with lookahead {look}"
+                            f"infinite ε‑reduce on {prod} with lookahead {tok.value!r}"
                         )
 
-                children = [symbol_stack.pop() for _ in range(n)]
-                children.reverse()
-                for _ in range(n):
-                    state_stack.pop()
+                if n:
+                    children = symbol_stack[-n:]
+                    del symbol_stack[-n:]
+                    del state_stack[-n:]
+                else:
+                    children = []
 
-                node = self._make_node(prod, children)
+                node = builders[p](children)
                 symbol_stack.append(node)
 
-                goto_state = self.GOTO[state_stack[-1]][prod.lhs]
-                state_stack.append(goto_state)
-
-            elif cmd == 'accept':
-                if trace_output is not None:
-                    trace_output.append({
-                        'state': list(state_stack),
-                        'symbol': [_symbol_repr(s) for s in symbol_stack],
-                        'input': [],
-                        'action': 'accept'
-                    })
+                r = grow[state_stack[-1]]
+                state_stack.append(gvalue[gbase[r] + A])
+                if trace is not None:
+                    trace.record(act, idx, state_stack[-1], node)
+
+            else:
+                if trace is not None:
+                    trace.record(act, idx, 0)
                 return symbol_stack[-1]
 
-    def _make_node(self, prod, children):
+    def parse_file(self, path, chunk_size=CHUNK_SIZE):
         """
-        根据 prod.lhs 和 prod.rhs，用 children 列表构造对应 AST 节点。
-        children 是一个列表，按产生式右侧符号的顺序对应。
+        分词与解析串成流水线：lexer.iter_tokens 按块读文件产出 token，解析器逐个取用，
+        读完文件之前就开始解析，内存中不保留完整的 token 列表。
         """
-        lhs, rhs = prod.lhs, prod.rhs
-        # print(f"==> MAKING NODE: {lhs} ← {rhs}")
-        # print(f"BUILD NODE: {lhs}  <- {[type(c) for c in children]}")
-        # ① 语句块 ----------------------------------------------------------
-        # Block → { StmtList }
-        if lhs == 'Block' and rhs == ['{', 'StmtList', '}']:
-            stmt_list = children[1]  # children = ['{', StmtList, '}']
-            return Block(stmt_list,children[0].line, children[0].col)
-
-        # Block → { Stmt StmtList }
-        if lhs == 'Block' and rhs == ['{', 'Stmt', 'StmtList', '}']:
-            return Block([children[1]] + children[2],children[0].line, children[0].col)
-
-        if lhs == 'Block' and rhs == ['{', '}']:
-            return Block([], children[0].line, children[0].col)
-
-        # ② 语句串 ----------------------------------------------------------
-        # if lhs == 'StmtList':
-        #     print("==> STMTLIST", rhs, children)
-        # StmtList → ε
-        if lhs == 'StmtList' and not rhs:
-            return []
-
-        # StmtList → Stmt
-        if lhs == 'StmtList' and rhs == ['Stmt']:
-            # print("!!! DEBUG: StmtList → Stmt, got:", children[0])
-            return [children[0]]
-
-        # StmtList → Stmt StmtList
-        if lhs == 'StmtList' and rhs == ['Stmt', 'StmtList']:
-            return [children[0]] + children[1]
-
-        # VariableInternal -> mut IDENT
-        if lhs == 'VariableInternal' and rhs == ['mut', 'IDENT']:
-            ident_tok = children[1]  # Token of kind IDENT
-            return VarBinding(ident_tok.value, True,children[0].line, children[0].col)
-
-        # VariableInternal -> IDENT
-        if lhs == 'VariableInternal' and rhs == ['IDENT']:
-            ident_tok = children[0]
-            return VarBinding(ident_tok.value, False,children[0].line, children[0].col)
-
-        # Program → DeclList
-        if lhs == 'Program' and rhs == ['DeclList']:
-            decls = children[0]
-            first_decl = decls[0] if isinstance(decls, list) and decls else None
-            line = first_decl.line if first_decl else 1
-            col = first_decl.col if first_decl else 1
-            return Program(decls, line, col)
-
-        # DeclList → ε
-        if lhs == 'DeclList' and not rhs:
-            return []
-
-        # DeclList → Decl DeclList
-        if lhs == 'DeclList' and rhs == ['Decl', 'DeclList']:
-            # print("!!! DEBUG: DeclList join", children[0])
-            return [children[0]] + children[1]
-
-        # Decl → FnDecl
-        if lhs == 'Decl' and rhs == ['FnDecl']:
-            return children[0]
-
-        # FnDecl → FnHead Block
-        if lhs == 'FnDecl' and rhs == ['FnHead', 'Block']:
-            # print(f"!!! DEBUG FnDecl children[0]: {children[0]}")
-            name, params, ret,line, col = children[0]
-            body = children[1]
-            # print(children[0])
-            return FuncDecl(name, params, ret, body,line,col)
-
-        # FnDecl → FnHead FuncExprBlock
-        if lhs == 'FnDecl' and rhs == ['FnHead', 'FuncExprBlock']:
-            name, params, ret,line,col = children[0]
-            body = children[1]
-            return FuncDecl(name, params, ret, body,line,col)
-
-        # FnHead → fn IDENT ( ParamList ) [-> Type]
-        if lhs == 'FnHead':
-            # print(f"!!! DEBUG: FnHead match {rhs}")
-            # 带返回类型
-            fn_token = children[0]
-            if rhs == ['fn', 'IDENT', '(', 'ParamList', ')', '->', 'Type']:
-                name_tok = children[1]
-                plist    = children[3]
-                typ      = children[6]
-
-                return (name_tok.value, plist, typ, fn_token.line, fn_token.col)
-            # 无返回类型
-            if rhs == ['fn', 'IDENT', '(', 'ParamList', ')']:
-                name_tok = children[1]
-                plist    = children[3]
-                return (name_tok.value, plist, None, fn_token.line, fn_token.col)
-
-        # ParamList 相关
-        if lhs == 'ParamList':
-            if not rhs:
-                return []
-            if rhs == ['Param']:
-                return [children[0]]
-            if rhs == ['Param', ',', 'ParamList']:
-                return [children[0]] + children[2]
-
-        if lhs=='ArgList':
-            if not rhs:
-                return []
-            if rhs == ['Expr']:
-                return [children[0]]
-            if rhs == ['Expr', ',', 'ArgList']:
-                return [children[0]] + children[2]
-
-        # Param → VariableInternal : Type
-        if lhs == 'Param' and rhs == ['VariableInternal', ':', 'Type']:
-            var, typ = children[0], children[2]
-            return Param(var.name, var.mutable, typ,children[0].line, children[0].col)
-
-        # ReturnStmt
-        if lhs == 'ReturnStmt':
-            if rhs == ['return', ';']:
-                print("!!! building ReturnStmt(None)")
-                return ReturnStmt(None,children[0].line, children[0].col)
-            if rhs == ['return', 'Expr', ';']:
-                return ReturnStmt(children[1],children[0].line, children[0].col)
-
-        # SelectExpr → if Expr FuncExprBlock else FuncExprBlock
-        if lhs == 'SelectExpr':
-            cond, then_blk, else_blk = children[1], children[2], children[4]
-            return IfStmt(cond, then_blk, else_blk,children[0].line, children[0].col)  # 复用现有 IfStmt AST
-
-        # LoopExpr → loop FuncExprBlock
-        if lhs == 'LoopExpr':
-            body = children[1]
-            return LoopStmt(body,children[0].line, children[0].col)  # 或自定义 LoopExpr 节点
-
-
-        elif lhs == 'FuncExprBlock':
-            stmts = children[1]
-            if not isinstance(stmts, list):
-                stmts = [ExprStmt(stmts, stmts.line, stmts.col)]
-            # elif stmts and isinstance(stmts[-1], (NumberLit, Ident, BinaryOp, FuncCall, IndexExpr, MemberExpr)):
-            #     last = stmts.pop()
-            #     stmts.append(ReturnStmt(last,last.line, last.col))
-            return Block(stmts,children[0].line, children[0].col)
-
-        elif lhs == 'Block':
-            # 普通 Block 不自动包裹 ReturnStmt（避免 main 中的问题）
-            stmts = children[1]
-            if not isinstance(stmts, list):
-                stmts = [ExprStmt(stmts,children[0].line, children[0].col)]
-            for i, stmt in enumerate(stmts):
-                print(f"[Block] stmt[{i}] = {stmt}")
-            return Block(stmts,children[0].line, children[0].col)
-
-        # break Expr ;
-        # if lhs == 'Stmt' and rhs == ['break', 'Expr', ';']:
-        #     return BreakStmt(children[1])  # 带值 break
-        if lhs == 'FuncStmtList':
-            if rhs == ['Stmt']:
-                stmt = children[0]
-                return [stmt]
-
-            if rhs == ['Stmt', 'FuncStmtList']:
-                first_stmt = children[0]
-
-                rest_list = children[1]
-                return [first_stmt] + rest_list
-
-            if rhs == ['Expr']:
-                return [children[0]]
-
-        # 变量声明与赋值
-        if lhs == 'Stmt':
-            stmt = children[0]
-
-            # 处理裸分号 => EmptyStmt
-            if isinstance(stmt, Token) and stmt.kind == TokenKind.DELIM and stmt.value == ';':
-                return EmptyStmt()
-            # return ;
-            if rhs == ['ReturnStmt']:
-                return children[0]
-            if rhs == ['return', ';']:
-                return ReturnStmt(None,children[0].line, children[0].col)
-            if rhs == ['return', 'Expr', ';']:
-                return ReturnStmt(children[1],children[0].line, children[0].col)
-
-
-            # break Expr ;
-            if rhs == ['break', 'Expr', ';']:
-                expr = children[1]
-                return BreakStmt(expr,children[0].line, children[0].col)
-            # let VariableInternal : Type = Expr ;
-            if rhs == ['let', 'VariableInternal', '=', 'Expr', ';']:
-                var = children[1]
-                expr = children[3]
-                if isinstance(expr, ExprStmt):
-                    expr = expr.expr
-                return VarDecl(var.name, var.mutable, None, expr,children[0].line, children[0].col)
-
-            # let VariableInternal : Type = Expr ;
-            if rhs == ['let', 'VariableInternal', ':', 'Type', '=', 'Expr', ';']:
-                var = children[1]
-                typ = children[3]
-                expr = children[5]
-                if isinstance(expr, ExprStmt):
-                    expr = expr.expr
-                return VarDecl(var.name, var.mutable, typ, expr,children[0].line, children[0].col)
-            # let VariableInternal : Type ;
-            if rhs == ['let', 'VariableInternal', ':', 'Type', ';']:
-                var = children[1]
-                typ = children[3]
-                return VarDecl(var.name, var.mutable, typ, None,children[0].line, children[0].col)
-            # let VariableInternal ;
-            if rhs == ['let', 'VariableInternal', ';']:
-                var = children[1]
-                return VarDecl(var.name, var.mutable, None, None,children[0].line, children[0].col)
-            # Assignable = Expr ;
-            if rhs == ['Assignable', '=', 'Expr', ';']:
-                target = children[0]
-                expr = children[2]
-                if isinstance(expr, ExprStmt):
-                    expr = expr.expr
-                if isinstance(target, ExprStmt):  # <<< 需要加这句
-                    target = target.expr
-                return AssignStmt(target, expr,children[0].line, children[0].col)
-            # if Expr Block ElsePart
-            if rhs == ['if', 'Expr', 'Block', 'ElsePart']:
-                cond = children[1]
-                then_blk = children[2]
-                else_blk = children[3]
-                return IfStmt(cond, then_blk, else_blk,children[0].line, children[0].col)
-            # while Expr Block
-            if rhs == ['while', 'Expr', 'Block']:
-                return WhileStmt(children[1], children[2],children[0].line, children[0].col)
-            if rhs == ['for', 'VariableInternal', 'in', 'Iterable', 'Block']:
-                var = children[1]
-                iterable = children[3]
-                body_blk = children[4]
-
-                # 如果 iterable 是 range 形式（通过上面 grammar 的 ['Expr', '..', 'Expr'] 规则构造）
-                if isinstance(iterable, tuple) and iterable[0] == 'range':
-                    start, end = iterable[1], iterable[2]
-                    return ForStmt(var.name, var.mutable, start, end, body_blk,children[0].line, children[0].col)
-
-                # 否则直接留给语义检查处理
-                return ForStmt(var.name, var.mutable, iterable, None, body_blk,children[0].line, children[0].col)
-            # loop Block
-            if rhs == ['loop', 'Block']:
-                return LoopStmt(children[1],children[0].line, children[0].col)
-            # break ;
-            if rhs == ['break', ';']:
-                return BreakStmt(None,children[0].line, children[0].col)
-            # continue ;
-            if rhs == ['continue', ';']:
-                return ContinueStmt(children[0].line, children[0].col)
-            # Stmt → Expr ;
-            if rhs == ['Expr', ';']:
-                expr = children[0]
-                return ExprStmt(expr,children[0].line, children[0].col)
-
-        if lhs == 'Iterable' and rhs == ['Expr', '..', 'Expr']:
-            return ('range', children[0], children[2])
-        if lhs == 'Iterable' and rhs == ['Expr']:
-            return children[0]
-
-        # Expr → comparisons or AddExpr
-        if lhs == 'Expr':
-            # 比较运算
-            for op in ('==','!=','<','<=','>','>='):
-                if rhs == ['Expr', op, 'Expr']:
-                    return BinaryOp(op, children[0], children[2],children[0].line, children[0].col)
-            # 回退到 AddExpr
-            if rhs == ['AddExpr']:
-                return children[0]
-
-        if lhs == 'ElsePart' and rhs == ['else', 'Block']:
-            return children[1]
-
-        if lhs == 'ElsePart' and rhs == ['else', 'if', 'Expr', 'Block', 'ElsePart']:
-            cond = children[2]
-            then_blk = children[3]
-            else_blk = children[4]
-            # return Block([IfStmt(cond, then_blk, else_blk,children[1].line, children[1].col)])
-            return IfStmt(cond, then_blk, else_blk, children[1].line, children[1].col)
-
-        if lhs == 'ElsePart' and not rhs:
-            return None
-
-        # AddExpr / MulExpr
-        if lhs == 'AddExpr':
-            if rhs == ['AddExpr', '+', 'MulExpr']:
-                return BinaryOp('+', children[0], children[2],children[0].line, children[0].col)
-            if rhs == ['AddExpr', '-', 'MulExpr']:
-                return BinaryOp('-', children[0], children[2],children[0].line, children[0].col)
-            if rhs == ['MulExpr']:
-                return children[0]
-
-        if lhs == 'MulExpr':
-            if rhs == ['MulExpr', '*', 'Primary']:
-                return BinaryOp('*', children[0], children[2],children[0].line, children[0].col)
-            if rhs == ['MulExpr', '/', 'Primary']:
-                return BinaryOp('/', children[0], children[2],children[0].line, children[0].col)
-            if rhs == ['Primary']:
-                return children[0]
-
-        # Primary
-        if lhs == 'Primary':
-            # IDENT ( ArgList )
-            if rhs == ['IDENT', '(', 'ArgList', ')']:
-                args = children[2] if children[2] is not None else []
-                return FuncCall(Ident(children[0].value,children[0].line, children[0].col), args,children[0].line, children[0].col)
-            # ( Expr )
-            if rhs == ['(', 'Expr', ')']:
-                return children[1]
-            # NUMBER
-            if rhs == ['NUMBER']:
-                return NumberLit(int(children[0].value,0),children[0].line, children[0].col)
-            # Assignable
-            if rhs == ['Assignable']:
-                return children[0]
-            # * Primary
-            if rhs == ['*', 'Primary']:
-                return DerefExpr(children[1],children[0].line, children[0].col)
-            # & Primary
-            if rhs == ['&', 'Primary']:
-                return BorrowExpr(children[1], False,children[0].line, children[0].col)
-            # & mut Primary
-            if rhs == ['&', 'mut', 'Primary']:
-                return BorrowExpr(children[2], True,children[0].line, children[0].col)
-            # [ ExprList ]
-            if rhs == ['[', 'ExprList', ']']:
-                return ArrayLiteral(children[1],children[0].line, children[0].col)
-            # ( ExprList )
-                # 单元素元组 (Expr, )
-            if rhs == ['(', 'Expr', ',', ')']:
-                return TupleLiteral([children[1]],children[0].line, children[0].col)
-
-            # 多元素元组 (Expr, ExprList)
-            if rhs == ['(', 'Expr', ',', 'ExprList', ')']:
-                return TupleLiteral([children[1]] + children[3],children[0].line, children[0].col)
-
-            # 空元组 ()
-            if rhs == ['(', ')']:
-                return TupleLiteral([],children[0].line, children[0].col)
-            if rhs == ['IDENT']:
-                return Ident(children[0].value,children[0].line, children[0].col)
-
-        # ExprList
-        if lhs == 'ExprList':
-            if not rhs:
-                return []
-            if rhs == ['Expr']:
-                return [children[0]]
-            if rhs == ['Expr', ',', 'ExprList']:
-                return [children[0]] + children[2]
-
-        # Assignable
-        if lhs == 'Assignable':
-            if rhs == ['Primary', '[', 'Expr', ']']:
-                return IndexExpr(children[0], children[2],children[0].line, children[0].col)
-            if rhs == ['Primary', '.', 'NUMBER']:
-                return MemberExpr(children[0], int(children[2].value,0),children[0].line, children[0].col)
-            if rhs == ['IDENT']:
-                return Ident(children[0].value,children[0].line, children[0].col)
-            if rhs == ['*', 'Primary']:
-                return DerefExpr(children[1],children[0].line, children[0].col)
-
-        # Type (keep as simple strings or tuples)
-        if lhs == 'Type':
-            if rhs == ['i32']:
-                return 'i32'
-            if rhs == ['&', 'Type']:
-                return ('&', children[1])
-            if rhs == ['&', 'mut', 'Type']:
-                return ('&mut', children[2])
-            if rhs == ['[', 'Type', ';', 'NUMBER', ']']:
-                return ('array', children[1], int(children[3].value,0))
-            if rhs == ['(', ')']:
-                return TupleLiteral([],children[0].line, children[0].col)
-            if rhs == ['(', 'TypeList', ')']:
-                return TupleLiteral(children[1],children[0].line, children[0].col)
-            if rhs == ['(', 'Type', ',', ')']:
-                return TupleLiteral([children[1]], children[0].line, children[0].col)
-
-        if lhs == 'TypeList':
-            if rhs == ['Type']:
-                return [children[0]]
-            if rhs == ['Type', ',', 'TypeList']:
-                return [children[0]] + children[2]
-
-        # Fallback
-        if not children:
-            return None
-        last = children[-1]
-        if isinstance(last, Expr):
-            return last
-        while isinstance(last, ExprStmt):
-            last = last.expr
-        if isinstance(last, Token):
-            return Ident(last.value,children[0].line, children[0].col)
-        return last
+        return self.parse(iter_tokens(path, chunk_size))
 
 
 if __name__ == '__main__':
@@ -1,8 +1,8 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from lr1_parser import LR1Parser
-from lexer import tokenize_file, Lexer, TokenKind
+from lr1_parser import LR1Parser, ParseTrace
+from lexer import IncrementalLexer, TokenKind
 from PIL import Image, ImageTk
 #from semantic_checker import run_semantic_checks
 from semantic_checker import SemanticChecker, SemanticError
@@ -20,6 +20,8 @@ TOKEN_COLORS = {
     'COMMENT': '#629755'
 }
 
+TRACE_INPUT_TOKENS = 40     # 归约过程表中输入串列最多显示的 token 数
+
 class CompilerApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -31,6 +33,7 @@ class CompilerApp(ctk.CTk):
         self.original_image = None
         self.zoom_ratio = 1.0
         self.current_file_path = None
+        self.lexer = None  # 编辑器内容的增量分词器，按键时只重新分词改动附近
 
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -150,30 +153,44 @@ class CompilerApp(ctk.CTk):
         for kind in TokenKind:
             self.code_input.tag_config(kind.name, foreground=TOKEN_COLORS.get(kind.name, "white"))
 
-    def highlight_code(self):
+    def sync_lexer(self):
+        """让增量分词器与编辑器内容一致，返回重新分词的区间；内容未变时返回 None。"""
         code = self.code_input.get("1.0", "end-1c")
-        lexer = Lexer(code)
-        tokens = []
-        while True:
-            tok = lexer.next_token()
-            if tok.kind == TokenKind.EOF:
-                break
-            tokens.append(tok)
-
-        for kind in TokenKind:
-            self.code_input.tag_remove(kind.name, "1.0", "end")
-
-        for token in tokens:
-            start = f"{token.line}.{token.col - 1}"
-            end = f"{token.line}.{token.col - 1 + len(token.value)}"
-            self.code_input.tag_add(token.kind.name, start, end)
+        if self.lexer is None:
+            self.lexer = IncrementalLexer(code)
+            return 0, len(code)
+        return self.lexer.update(code)
 
-        self.highlight_comments(code)
+    def highlight_code(self):
+        changed = self.sync_lexer()
+        if changed is None:
+            return
+        # 只重新着色被重新分词的那几行，其余位置的 tag 随文本编辑自动移动
+        lines = self.lexer.lines
+        first_line = lines.position(changed[0])[0]
+        last_line = lines.position(changed[1])[0]
+        start, end = f"{first_line}.0", f"{last_line}.end"
 
-    def highlight_comments(self, code):
-        self.code_input.tag_remove("COMMENT", "1.0", "end")
+        for kind in TokenKind:
+            self.code_input.tag_remove(kind.name, start, end)
+
+        lo = lines.line_offset(first_line)
+        hi = lo + len(self.code_input.get(start, end)) + 1
+        for token in self.lexer.tokens_between(lo, hi):
+            if token.kind == TokenKind.EOF:
+                continue
+            line, col = token.line, token.col
+            tok_start = f"{line}.{col - 1}"
+            tok_end = f"{line}.{col - 1 + len(token.value)}"
+            self.code_input.tag_add(token.kind.name, tok_start, tok_end)
+
+        self.highlight_comments(self.code_input.get(start, end), first_line)
+
+    def highlight_comments(self, code, first_line=1):
+        last_line = first_line + code.count('\n')
+        self.code_input.tag_remove("COMMENT", f"{first_line}.0", f"{last_line}.end")
         lines = code.split('\n')
-        for lineno, line in enumerate(lines, start=1):
+        for lineno, line in enumerate(lines, start=first_line):
             idx = line.find("//")
             if idx != -1:
                 start = f"{lineno}.{idx}"
@@ -205,10 +222,6 @@ class CompilerApp(ctk.CTk):
             self.save_file()
 
     def run_analysis(self):
-        code = self.code_input.get("1.0", tk.END).strip()
-        with open("temp_test.rs", "w", encoding="utf-8") as f:
-            f.write(code)
-
         self.token_output.config(state="normal")
         self.token_output.delete("1.0", tk.END)
         self.token_output.config(state="disabled")
@@ -216,8 +229,11 @@ class CompilerApp(ctk.CTk):
         self.ast_canvas.delete("all")
 
         try:
-        # 词法分析
-            tokens = tokenize_file("temp_test.rs")
+        # 词法分析（复用编辑器的增量分词结果）
+        # 这些 token 下次按键时会被就地改写，因此分析结果都在本函数内渲染完毕：
+        # AST 节点在归约时已把行列换算成整数，解析过程表也在这里一次性填好。
+            self.highlight_code()
+            tokens = self.lexer.tokens
             self.token_output.config(state="normal")
             for t in tokens:
                 self.token_output.insert("end", f"{t}\n")
@@ -225,10 +241,11 @@ class CompilerApp(ctk.CTk):
 
         # 语法分析
             parser = LR1Parser()
-            parser.reduction_trace = []
+            parser.reduction_trace = ParseTrace(tokens, parser.productions)
             ast = parser.parse(tokens, trace_output=parser.reduction_trace)
 
-            for row in parser.reduction_trace:
+            # 输入串列只列出前面一段，否则大文件的每一行都带着剩余的全部 token
+            for row in parser.reduction_trace.iter_rows(max_input=TRACE_INPUT_TOKENS, symbols=False):
                 self.reduction_table.insert("", "end", values=(
                     ",".join(map(str, row["state"])),
                     " ".join(row["input"]),
@@ -245,7 +262,7 @@ class CompilerApp(ctk.CTk):
         # === 中间代码生成 ===
             irgen = IRGenerator()
             irgen.generate(ast)
-            ir_output = irgen.code
+            ir_output = irgen.listing()
             # 清空旧表格内容
             self.ir_table.delete(*self.ir_table.get_children())
 
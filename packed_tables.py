@@ -0,0 +1,322 @@
+# packed_tables.py  – 整数编码、行压缩的 ACTION/GOTO 表
+#
+# 终结符、非终结符、产生式都换成整数编号；内容相同的行只存一份，
+# 各行再用 comb（行位移）方式叠放进同一组 array('i')：
+#   第 r 行第 c 列的表项存放在 value[base[r] + c]，当且仅当 check[base[r] + c] == r。
+# ACTION 表项编码：0 = 出错，j + 1 = 移进到状态 j，-(p + 1) = 按产生式 p 归约
+# （p = 0 即增广产生式，表示接受）。GOTO 表项直接存目标状态。
+#
+# 默认归约：若某状态的全部动作都是按同一产生式归约，就把它记在 default_action[state]，
+# 该状态的 ACTION 行置空。解析时直接归约、不看向前看符号；出错的向前看会在
+# 随后某个需要查表的状态（最迟在下一次移进之前）被发现。
+#
+# 二进制文件格式（parse_tables.bin，小端）：
+#   头部   magic 'RLCT' | 格式版本 u32 | 文法指纹 64 字节 | 元数据长度 u32 | 9 个数组长度 u32
+#   元数据 JSON：[终结符列表, 非终结符列表, 产生式列表]，其后补 0 到 4 字节边界（头部记的是补齐前的长度）
+#   数组   9 个 int32 数组依次排列，顺序同 PackedTables.arrays()
+# 用 mmap 打开后各数组直接是文件映射上的 memoryview，不做反序列化，
+# 多个进程打开同一文件时共用操作系统页缓存里的同一份物理内存。
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from array import array
+from grammar import Production, build_grammar, build_lr1_states_incremental, build_parse_table
+
+ERROR = 0
+BUILDER_VERSION = 2     # 表的构造算法或编码格式改变时加一，使旧缓存全部失效
+BIN_MAGIC = b'RLCT'
+BIN_HEADER = struct.Struct('<4sI64sI9I')
+
+
+def grammar_fingerprint(G):
+    """由构造器版本和产生式列表（按顺序）算出的稳定哈希，文法一改就变。"""
+    h = hashlib.sha256(f"v{BUILDER_VERSION}\n{G.start}\n".encode())
+    for p in G.productions:
+        h.update(f"{p.lhs}\0{' '.join(p.rhs)}\n".encode())
+    return h.hexdigest()
+
+
+def cache_dir():
+    """用户缓存目录：Windows 下为 %LOCALAPPDATA%，其他系统为 $XDG_CACHE_HOME 或 ~/.cache。"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(r'~\AppData\Local')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'rust-like-compiler')
+
+
+def atomic_write(path, data):
+    """先写同目录下的临时文件再 os.replace，并发的进程只会看到完整的旧文件或新文件。"""
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)    # mkstemp 建的文件只有属主可读
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _load(path, fingerprint):
+    try:
+        with open(path, 'rb') as f:
+            if f.read(len(BIN_MAGIC)) == BIN_MAGIC:
+                tables = PackedTables.open(path)
+            else:
+                f.seek(0)
+                tables = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError, struct.error):
+        return None
+    if isinstance(tables, PackedTables) and tables.fingerprint == fingerprint:
+        return tables
+    return None
+
+
+def build_states(G, incremental=True, workers=1):
+    """
+    构造 LR(1) 项目集族。incremental 为真时读取缓存目录里上一次构造留下的快照，
+    只为受文法修改影响的状态重新求闭包；构造完成后把新快照原子地写回。
+    workers 为并行求闭包的进程数，见 build_lr1_states。
+    返回 (C, first, trans, 复用的状态数)。
+    """
+    path = os.path.join(cache_dir(), 'lr1_states.pkl')
+    prev = None
+    if incremental:
+        try:
+            with open(path, 'rb') as f:
+                version, prev = pickle.load(f)
+            if version != BUILDER_VERSION:
+                prev = None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+            prev = None
+    C, first, trans, snapshot, reused = build_lr1_states_incremental(G, prev, workers)
+    try:
+        atomic_write(path, pickle.dumps((BUILDER_VERSION, snapshot)))
+    except OSError:
+        pass
+    return C, first, trans, reused
+
+
+def load_tables(path=None):
+    """
+    取与当前 build_grammar() 一致的解析表：依次尝试 path（如仓库里的 parse_tables.bin，
+    也接受 pickle 格式）和用户缓存目录中以文法指纹命名的文件；
+    指纹都对不上时重新构造，并原子地写入缓存。
+    """
+    G = build_grammar()
+    fingerprint = grammar_fingerprint(G)
+    cached = os.path.join(cache_dir(), f'parse_tables-{fingerprint[:16]}.bin')
+    for candidate in (path, cached):
+        if candidate and os.path.exists(candidate):
+            tables = _load(candidate, fingerprint)
+            if tables is not None:
+                return tables
+    C, first, trans, _ = build_states(G)
+    ACTION, GOTO = build_parse_table(C, G, trans, report=False)
+    tables = PackedTables.from_tables(G, ACTION, GOTO)
+    try:
+        atomic_write(cached, tables.to_bytes())
+    except OSError:
+        pass    # 缓存目录不可写时只是下次还要重建
+    return tables
+
+
+def encode_action(act):
+    cmd, arg = act
+    if cmd == 'shift':
+        return arg + 1
+    if cmd == 'reduce':
+        return -(arg.index + 1)
+    return -1   # accept：归约增广产生式 0
+
+
+def pack_rows(rows, width):
+    """
+    把若干 {列: 值} 行去重后叠放进一张一维表。
+    返回 (row, base, check, value)：row[s] 为第 s 行去重后的编号。
+    """
+    distinct, row = {}, array('i')
+    for r in rows:
+        key = tuple(sorted(r.items()))
+        row.append(distinct.setdefault(key, len(distinct)))
+
+    keys = list(distinct)
+    base = array('i', [0]) * len(keys)
+    used = 0    # 已占用位置的位图
+    # 先放表项多的行，首次适配
+    for rid in sorted(range(len(keys)), key=lambda k: (-len(keys[k]), k)):
+        cols = [c for c, _ in keys[rid]]
+        if not cols:
+            continue
+        mask = 0
+        for c in cols:
+            mask |= 1 << c
+        # 合法的 b 必然让首列落在空位上，直接跳到下一个空位再整行检查
+        pos = cols[0]
+        while True:
+            free = ~used >> pos
+            pos += (free & -free).bit_length() - 1
+            b = pos - cols[0]
+            if not (used >> b) & mask:
+                break
+            pos += 1
+        base[rid] = b
+        used |= mask << b
+
+    # 补足长度，使任意 base[r] + c（c < width）都不越界，查表时无需判断边界
+    size = max(used.bit_length(), max(base, default=0) + width)
+    check = array('i', [-1]) * size
+    value = array('i', [0]) * size
+    for rid, key in enumerate(keys):
+        for c, v in key:
+            check[base[rid] + c] = rid
+            value[base[rid] + c] = v
+    return row, base, check, value
+
+
+class PackedTables:
+    """
+    LR1Parser 使用的紧凑解析表。只保存编号、各 array 和符号/产生式的文本，
+    pickle 时不再携带 Grammar 和 Production 对象图，加载后重建产生式列表。
+    """
+    def __init__(self, terminals, nonterminals, prods, action, goto, default_action, fingerprint=None):
+        self.terminals = terminals              # 终结符编号 -> 名字（含 '$'）
+        self.nonterminals = nonterminals        # 非终结符编号 -> 名字
+        self.prods = prods                      # [(lhs, rhs)]，下标即产生式编号
+        self.action_row, self.action_base, self.action_check, self.action_value = action
+        self.goto_row, self.goto_base, self.goto_check, self.goto_value = goto
+        self.default_action = default_action    # 状态 -> 默认归约的 ACTION 编码，0 表示没有
+        self.fingerprint = fingerprint          # 生成这张表的文法指纹，见 grammar_fingerprint
+        self._digest = None
+        self._index()
+
+    def _index(self):
+        self.term_ids = {t: i for i, t in enumerate(self.terminals)}
+        self.nonterm_ids = {A: i for i, A in enumerate(self.nonterminals)}
+        self.productions = [Production(lhs, list(rhs)) for lhs, rhs in self.prods]
+        for i, p in enumerate(self.productions):
+            p.index = i
+        self.prod_lhs = array('i', (self.nonterm_ids[lhs] for lhs, _ in self.prods))
+        self.prod_len = array('i', (len(rhs) for _, rhs in self.prods))
+
+    @classmethod
+    def from_tables(cls, G, ACTION, GOTO, default_reductions=True):
+        terminals = list(G.term_names)
+        nonterminals = sorted(G.nonterminals)
+        tid = {t: i for i, t in enumerate(terminals)}
+        nid = {A: i for i, A in enumerate(nonterminals)}
+        nstates = max(list(ACTION) + list(GOTO)) + 1
+        arows = [{tid[t]: encode_action(a) for t, a in ACTION.get(s, {}).items()}
+                 for s in range(nstates)]
+        grows = [{nid[A]: j for A, j in GOTO.get(s, {}).items()}
+                 for s in range(nstates)]
+        default = array('i', [0]) * nstates
+        if default_reductions:
+            for s, row in enumerate(arows):
+                acts = set(row.values())
+                if len(acts) == 1 and min(acts) < -1:     # 唯一的动作是归约（接受除外）
+                    default[s] = acts.pop()
+                    arows[s] = {}
+        prods = [(p.lhs, tuple(p.rhs)) for p in G.productions]
+        return cls(terminals, nonterminals, prods,
+                   pack_rows(arows, len(terminals)), pack_rows(grows, len(nonterminals)), default,
+                   grammar_fingerprint(G))
+
+    def action(self, state, t):
+        d = self.default_action[state]
+        if d:
+            return d
+        r = self.action_row[state]
+        i = self.action_base[r] + t
+        return self.action_value[i] if self.action_check[i] == r else ERROR
+
+    def goto(self, state, A):
+        r = self.goto_row[state]
+        i = self.goto_base[r] + A
+        return self.goto_value[i] if self.goto_check[i] == r else None
+
+    def arrays(self):
+        return (self.action_row, self.action_base, self.action_check, self.action_value,
+                self.goto_row, self.goto_base, self.goto_check, self.goto_value,
+                self.default_action)
+
+    def digest(self):
+        """
+        表内容（符号、产生式和全部数组）的 sha256。生成的解析器模块记下它，
+        用来判断模块与当前使用的表（LR(1) 或 LALR(1)）是否是同一份。
+        """
+        if self._digest is None:
+            h = hashlib.sha256(json.dumps([self.terminals, self.nonterminals, self.prods],
+                                          ensure_ascii=False).encode())
+            for a in self.arrays():
+                h.update(a)
+            self._digest = h.hexdigest()
+        return self._digest
+
+    def nbytes(self):
+        """各 array 占用的字节数。"""
+        return sum(a.itemsize * len(a) for a in self.arrays())
+
+    def __len__(self):
+        return len(self.action_row)
+
+    def to_bytes(self):
+        """编码成二进制文件格式，见模块开头的说明。编码后立即解码核对一次，保证写出的文件能读回。"""
+        meta = json.dumps([self.terminals, self.nonterminals, self.prods], ensure_ascii=False).encode()
+        arrays = [array('i', a) for a in self.arrays()]
+        if sys.byteorder != 'little':
+            for a in arrays:
+                a.byteswap()
+        head = BIN_HEADER.pack(BIN_MAGIC, BUILDER_VERSION, (self.fingerprint or '').encode(),
+                               len(meta), *map(len, arrays))
+        blob = b''.join([head, meta, bytes(-len(meta) % 4)] + [a.tobytes() for a in arrays])
+        if PackedTables.from_buffer(blob).__getstate__() != self.__getstate__():
+            raise RuntimeError('parse table encoding does not round-trip')
+        return blob
+
+    @classmethod
+    def from_buffer(cls, buf):
+        """直接在 buf（bytes 或 mmap）上构造，各数组是 buf 的 memoryview 切片，不复制。"""
+        view = memoryview(buf)
+        magic, version, fingerprint, meta_len, *lens = BIN_HEADER.unpack_from(view)
+        if magic != BIN_MAGIC or version != BUILDER_VERSION:
+            raise ValueError('not a parse table file of this version')
+        pos = BIN_HEADER.size
+        terminals, nonterminals, prods = json.loads(bytes(view[pos:pos + meta_len]))
+        pos += meta_len + (-meta_len % 4)
+        arrays = []
+        for n in lens:
+            a = view[pos:pos + 4 * n].cast('i')
+            if sys.byteorder != 'little':   # 大端机器上只能复制一份再换字节序
+                a = array('i', a.tobytes())
+                a.byteswap()
+            arrays.append(a)
+            pos += 4 * n
+        return cls(terminals, nonterminals, [(lhs, tuple(rhs)) for lhs, rhs in prods],
+                   arrays[:4], arrays[4:8], arrays[8], fingerprint.rstrip(b'\0').decode() or None)
+
+    @classmethod
+    def open(cls, path):
+        """以只读 mmap 打开二进制表文件。"""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        tables = cls.from_buffer(mm)
+        tables._mm = mm     # 映射须与表同生命周期
+        return tables
+
+    def __getstate__(self):
+        arrays = tuple(array('i', a) for a in self.arrays())    # memoryview 不能 pickle
+        return self.terminals, self.nonterminals, self.prods, arrays, self.fingerprint
+
+    def __setstate__(self, state):
+        terminals, nonterminals, prods, arrays, fingerprint = state
+        self.__init__(terminals, nonterminals, prods, arrays[:4], arrays[4:8], arrays[8], fingerprint)
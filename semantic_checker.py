@@ -1,4 +1,5 @@
 from ast_nodes import *
+from lexer import symbol_name
 import sys
 import  traceback
 
@@ -84,15 +85,19 @@ class FunctionType(Type):
 
 
 class Symbol:
-    """存储在符号表中的对象"""
-    def __init__(self, name, typ: Type, is_mutable=False, is_initialized=False, kind='variable'):
-        self.name = name
+    """存储在符号表中的对象，以名字的驻留编号 sym 为键"""
+    def __init__(self, sym, typ: Type, is_mutable=False, is_initialized=False, kind='variable'):
+        self.sym = sym
         self.type = typ
         self.is_mutable = is_mutable
         self.is_initialized = is_initialized
         self.kind = kind # 'variable', 'function', 'parameter' 等
         #...
 
+    @property
+    def name(self):
+        return symbol_name(self.sym)
+
 # 预定义一些类型
 I32 = PrimitiveType('i32')
 VOID = PrimitiveType('void')
@@ -130,17 +135,17 @@ class SemanticChecker:
         """向当前作用域添加一个新符号。"""
         # WHY: 新声明的变量总是添加到最内层的作用域中。
         current_scope = self.env_stack[-1]
-        if symbol.name in current_scope:
+        if symbol.sym in current_scope:
             # 允许重影。
             pass
-        current_scope[symbol.name] = symbol
+        current_scope[symbol.sym] = symbol
 
-    def lookup_symbol(self, name: str) -> Symbol | None:
-        """从内到外查找一个符号。"""
+    def lookup_symbol(self, sym: int) -> Symbol | None:
+        """按名字的驻留编号从内到外查找一个符号。"""
         # WHY: 查找时要从最内层作用域开始，这符合语言的变量查找规则。
         for scope in reversed(self.env_stack):
-            if name in scope:
-                return scope[name]
+            if sym in scope:
+                return scope[sym]
         return None
 
     def _resolve_type(self, type_node) -> Type:
@@ -197,7 +202,7 @@ class SemanticChecker:
 
     def check_Ident(self, node: Ident) -> Type:
         # 在符号表中查找标识符
-        symbol = self.lookup_symbol(node.name)
+        symbol = self.lookup_symbol(node.sym)
         if not symbol:
             raise SemanticError(f"未声明的标识符 '{node.name}'", node.line, node.col)
         if not symbol.is_initialized:
@@ -230,13 +235,13 @@ class SemanticChecker:
                 node.line, node.col)
 
         current_scope= self.env_stack[-1]
-        if node.name in current_scope:
+        if node.sym in current_scope:
             current_borrows = current_scope['$borrows']
-            if node.name in current_borrows:
-                del current_borrows[node.name]  # 重置
+            if node.sym in current_borrows:
+                del current_borrows[node.sym]  # 重置
 
         symbol = Symbol(
-            name=node.name,
+            sym=node.sym,
             typ=final_type,
             is_mutable=node.mutable,
             is_initialized=(node.init is not None)
@@ -256,7 +261,7 @@ class SemanticChecker:
         func_type = FunctionType(param_types, return_type)
 
         # 在作用域注册
-        func_symbol=Symbol(node.name, func_type, is_mutable=False, is_initialized=True,kind='function')
+        func_symbol=Symbol(node.sym, func_type, is_mutable=False, is_initialized=True,kind='function')
         self.add_symbol(func_symbol)
 
         # 2.进入函数作用域
@@ -269,7 +274,7 @@ class SemanticChecker:
         # 将参数加入符号表
         for param in node.params:
             param_type = self._resolve_type(param.typ)
-            param_symbol = Symbol(param.name, param_type, param.mutable, is_initialized=True, kind='parameter')
+            param_symbol = Symbol(param.sym, param_type, param.mutable, is_initialized=True, kind='parameter')
             self.add_symbol(param_symbol)
 
         # 3.检查函数体
@@ -307,7 +312,7 @@ class SemanticChecker:
         # 1.特殊处理left，不check
         if isinstance(node.target,Ident):
             target_name=node.target.name
-            symbol = self.lookup_symbol(target_name)
+            symbol = self.lookup_symbol(node.target.sym)
             if not symbol:
                 raise SemanticError(f"未声明的变量 '{target_name}'", node.line, node.col)
             if not symbol.is_mutable:
@@ -333,7 +338,7 @@ class SemanticChecker:
             target_element_type=self.check(node.target)
 
             if isinstance(node.target.base,Ident):
-                base_symbol=self.lookup_symbol(node.target.base.name)
+                base_symbol=self.lookup_symbol(node.target.base.sym)
                 if base_symbol and not base_symbol.is_mutable:
                     raise SemanticError(
                         f"不可变数组 '{base_symbol.name}' 不能被修改",
@@ -349,7 +354,7 @@ class SemanticChecker:
             member_type = self.check(node.target)
 
             if isinstance(node.target.base, Ident):
-                base_symbol = self.lookup_symbol(node.target.base.name)
+                base_symbol = self.lookup_symbol(node.target.base.sym)
                 if base_symbol and not base_symbol.is_mutable:
                     raise SemanticError(
                         f"不可变元组 '{base_symbol.name}' 不能被修改",
@@ -371,7 +376,7 @@ class SemanticChecker:
             raise SemanticError("函数调用目标必须是一个标识符",node.func.line,node.func.col)
 
         func_name=node.func.name
-        symbol=self.lookup_symbol(func_name)
+        symbol=self.lookup_symbol(node.func.sym)
 
         if not symbol:
             raise SemanticError(f"使用了未声明的函数 '{func_name}'", node.line, node.col)
@@ -508,7 +513,7 @@ class SemanticChecker:
         # 3.创建作用域，添加循环变量符号
         self.enter_scope()
         loop_var_symbol = Symbol(
-            name=node.name,
+            sym=node.sym,
             typ=loop_var_type,
             is_mutable=node.mutable,
             is_initialized=True,
@@ -572,16 +577,16 @@ class SemanticChecker:
             raise SemanticError("continue 语句只能在循环内部使用", node.line, node.col)
 
 
-    def _get_borrow_info(self, var_name:str)->BorrowInfo:
+    def _get_borrow_info(self, var_sym:int)->BorrowInfo:
         current_borrows= self.env_stack[-1]['$borrows']
-        if var_name not in current_borrows:
-            current_borrows[var_name] = self.BorrowInfo()
-        return current_borrows[var_name]
+        if var_sym not in current_borrows:
+            current_borrows[var_sym] = self.BorrowInfo()
+        return current_borrows[var_sym]
 
-    def _lookup_borrow_info(self, var_name:str)->BorrowInfo|None:
+    def _lookup_borrow_info(self, var_sym:int)->BorrowInfo|None:
         for scope in reversed(self.env_stack):
-            if var_name in scope['$borrows']:
-                return scope['$borrows'][var_name]
+            if var_sym in scope['$borrows']:
+                return scope['$borrows'][var_sym]
         return None
 
     def check_BorrowExpr(self,node:BorrowExpr)->Type:
@@ -590,11 +595,11 @@ class SemanticChecker:
             raise SemanticError("借用操作只能用于具名变量", node.line, node.col)
 
         target_name = node.expr.name
-        target_symbol=self.lookup_symbol(target_name)
+        target_symbol=self.lookup_symbol(node.expr.sym)
         if not target_symbol:
             raise SemanticError(f"未声明的变量 '{target_name}'", node.line, node.col)
         # 2.查找已存在借用信息
-        existing_borrow = self._lookup_borrow_info(target_name)
+        existing_borrow = self._lookup_borrow_info(node.expr.sym)
 
         #3.根据借用类型进行处理
         if node.mutable:
@@ -604,13 +609,13 @@ class SemanticChecker:
             if not target_symbol.is_mutable:
                 raise SemanticError(f"变量 '{target_name}' 不是可变的，不能进行可变借用", node.line, node.col)
             # 更新借用信息
-            borrow_info = self._get_borrow_info(target_name)
+            borrow_info = self._get_borrow_info(node.expr.sym)
             borrow_info.mutable_borrow_active = True
         else:
             if existing_borrow and existing_borrow.mutable_borrow_active:
                 raise SemanticError(f"变量 '{target_name}' 已经被可变借用，不能进行不可变借用", node.line, node.col)
             # 更新借用信息
-            borrow_info = self._get_borrow_info(target_name)
+            borrow_info = self._get_borrow_info(node.expr.sym)
             borrow_info.immutable_borrow_count += 1
         # 4.创建引用类型
         result_type = RefType(target_symbol.type, is_mutable=node.mutable)
@@ -721,7 +726,7 @@ if __name__ == "__main__":
         from ir_generator import IRGenerator
         ir_gen = IRGenerator()
         ir_gen.generate(ast)
-        for quad in ir_gen.code:
+        for quad in ir_gen.listing():
             print(quad)
     except (SemanticError,SyntaxError) as e:
         print(f"错误：{e}")